@@ -0,0 +1,55 @@
+"""Benchmark MAC format conversion, batch functions against Mac objects.
+
+Usage:
+    python -m benchmarks.bench_mac --size 1000000
+"""
+
+import argparse
+import random
+import time
+
+from netports.mac import Mac, convert_macs, parse_macs
+
+LAYOUTS = [
+    "{}{}{}{}.{}{}{}{}.{}{}{}{}",
+    "{}{}:{}{}:{}{}:{}{}:{}{}:{}{}",
+    "{}{}{}{}{}{}-{}{}{}{}{}{}",
+]
+
+
+def generate_addrs(size: int) -> list:
+    """Generate random MAC addresses in mixed formats."""
+    rand = random.Random(0)
+    addrs = []
+    for idx in range(size):
+        hex_ = f"{rand.getrandbits(48):012x}"
+        addrs.append(LAYOUTS[idx % len(LAYOUTS)].format(*hex_))
+    return addrs
+
+
+def measure(name: str, func, *args) -> float:
+    """Run function once and print elapsed time."""
+    started = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<32} {elapsed:8.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    """Compare Mac(addr).cisco with convert_macs(addrs, to="cisco")."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of MAC addresses")
+    args = parser.parse_args()
+
+    addrs = generate_addrs(args.size)
+    print(f"{args.size} MAC addresses")
+    objects = measure("[Mac(addr).cisco]", lambda: [Mac(s).cisco for s in addrs])
+    batch = measure('convert_macs(to="cisco")', convert_macs, addrs, "cisco")
+    measure("[Mac(addr).integer]", lambda: [Mac(s).integer for s in addrs])
+    measure("parse_macs()", parse_macs, addrs)
+    print(f"speedup {objects / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""Benchmark cases of public hot paths.
+
+Each case gets `scale` factor of the realistic size and returns (function, size),
+the function is called without arguments and is measured by the runner.
+"""
+
+import random
+from array import array
+from typing import Any, Callable, Dict, Tuple
+
+import netports
+from netports import Intf, IntfGM, IPv4, Mac, Range, SwVersion
+
+TCase = Tuple[Callable[[], Any], int]
+CASES: Dict[str, Callable[[float], TCase]] = {}
+
+
+def case(name: str):
+    """Register benchmark case."""
+
+    def register(func: Callable[[float], TCase]) -> Callable[[float], TCase]:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+def _size(size: int, scale: float) -> int:
+    """Scale realistic size, at least 1."""
+    return max(1, int(size * scale))
+
+
+def _fragmented(size: int, step: int = 3) -> str:
+    """Range line with `size` items, like "1-2,4-5,7-8"."""
+    return ",".join(f"{i * step + 1}-{i * step + 2}" for i in range(size))
+
+
+# =============================== range ==============================
+
+
+@case("parse_range")
+def parse_range_(scale: float) -> TCase:
+    """parse_range() of fragmented line."""
+    size = _size(2000, scale)
+    line = _fragmented(size)
+    return (lambda: netports.parse_range(line)), size
+
+
+@case("range.union")
+def range_union(scale: float) -> TCase:
+    """Range.union() of two fragmented ranges."""
+    size = _size(2000, scale)
+    range1 = Range(_fragmented(size))
+    range2 = Range(_fragmented(size, step=5))
+    return (lambda: range1.union(range2)), size
+
+
+@case("range.intersection")
+def range_intersection(scale: float) -> TCase:
+    """Range.intersection() of two fragmented ranges."""
+    size = _size(2000, scale)
+    range1 = Range(_fragmented(size))
+    range2 = Range(_fragmented(size, step=5))
+    return (lambda: range1.intersection(range2)), size
+
+
+@case("range.difference")
+def range_difference(scale: float) -> TCase:
+    """Range.difference() of two fragmented ranges."""
+    size = _size(2000, scale)
+    range1 = Range(_fragmented(size))
+    range2 = Range(_fragmented(size, step=5))
+    return (lambda: range1.difference(range2)), size
+
+
+@case("Range.union_all")
+def range_union_all(scale: float) -> TCase:
+    """Range.union_all() of trunk VLANs of many devices."""
+    size = _size(10000, scale)
+    rand = random.Random(0)
+    lines = [_fragmented(20, step=rand.randint(3, 9)) for _ in range(50)]
+    ranges = [Range(lines[rand.randrange(50)]) for _ in range(size)]
+    return (lambda: Range.union_all(ranges)), size
+
+
+@case("coverage")
+def coverage_(scale: float) -> TCase:
+    """coverage() of trunk VLANs of many devices."""
+    size = _size(10000, scale)
+    rand = random.Random(0)
+    lines = [_fragmented(20, step=rand.randint(3, 9)) for _ in range(50)]
+    ranges = [Range(lines[rand.randrange(50)]) for _ in range(size)]
+    return (lambda: netports.coverage(ranges)), size
+
+
+@case("Range.contains_many")
+def range_contains_many(scale: float) -> TCase:
+    """Range.contains_many() of flow destination ports."""
+    size = _size(1000000, scale)
+    range_o = Range("22,53,80,443,1024-5000,8000-8100")
+    rand = random.Random(0)
+    ports = array("H", [rand.randint(1, 65535) for _ in range(size)])
+    return (lambda: range_o.contains_many(ports)), size
+
+
+@case("range.from_ints")
+def range_from_ints(scale: float) -> TCase:
+    """Range() from list of ports."""
+    size = _size(65535, scale)
+    numbers = list(range(1, size + 1, 2))
+    return (lambda: Range(numbers)), size
+
+
+@case("Range.str")
+def range_str(scale: float) -> TCase:
+    """str() of Range read many times by templates."""
+    size = _size(1000, scale)
+    ranges = [Range(_fragmented(50, step=i % 7 + 3)) for i in range(size)]
+    return (lambda: [str(o) for o in ranges for _ in range(10)]), size
+
+
+@case("Range.from_sorted")
+def range_from_sorted(scale: float) -> TCase:
+    """Range.from_sorted() of sorted ports."""
+    size = _size(65535, scale)
+    numbers = list(range(1, size + 1, 2))
+    return (lambda: Range.from_sorted(numbers)), size
+
+
+@case("AllRange.difference")
+def all_range_difference(scale: float) -> TCase:
+    """AllRange of TCP/UDP ports minus fragmented range, on interval bounds."""
+    size = _size(5000, scale)
+    all_ports = netports.AllRange(1, 65535)
+    range_o = Range(_fragmented(size))
+    return (lambda: all_ports - range_o), size
+
+
+@case("Range.chunks")
+def range_chunks(scale: float) -> TCase:
+    """Range.chunks() of trunk allowed VLANs, HPE format, 80 chars lines."""
+    size = _size(1000, scale)
+    range_o = Range(_fragmented(size, step=4))
+    return (lambda: list(range_o.chunks(max_chars=80, platform="hpe"))), size
+
+
+@case("Range.append")
+def range_append(scale: float) -> TCase:
+    """Range.append() and Range.discard() of a number in fragmented range."""
+    size = _size(4000, scale)
+    range_o = Range(_fragmented(size))
+
+    def func():
+        for number in range(3, size * 3, 3):
+            range_o.append(number)
+            range_o.discard(number)
+
+    return func, size
+
+
+# =============================== vlan ===============================
+
+
+@case("ivlan")
+def ivlan_(scale: float) -> TCase:
+    """ivlan() of trunk allowed VLANs."""
+    size = _size(1000, scale)
+    line = _fragmented(size, step=4)
+    return (lambda: netports.ivlan(line)), size
+
+
+@case("ivlan.cached")
+def ivlan_cached(scale: float) -> TCase:
+    """ivlan() of the same trunk allowed VLANs on many devices."""
+    size = _size(1000, scale)
+    lines = ["1-4094", "10,20,30-40", "100-199,300"]
+    return (lambda: [netports.ivlan(lines[i % 3]) for i in range(size)]), size
+
+
+@case("svlan")
+def svlan_(scale: float) -> TCase:
+    """svlan() of trunk allowed VLANs."""
+    size = _size(1000, scale)
+    vlans = [i for i in range(1, size * 4) if i % 4]
+    return (lambda: netports.svlan(vlans)), size
+
+
+@case("trunk_changes")
+def trunk_changes_(scale: float) -> TCase:
+    """trunk_changes() of trunks with a few changed VLANs."""
+    size = _size(1000, scale)
+    pairs = []
+    for i in range(size):
+        current = f"1-{i % 100 + 10},{200 + i % 50}-300,1000-1100"
+        desired = f"1-{i % 100 + 12},{200 + i % 50}-290,1000-1100,2000"
+        pairs.append((current, desired))
+    return (lambda: [netports.trunk_changes(*t) for t in pairs]), size
+
+
+@case("VlanMatrix.col")
+def vlan_matrix_col(scale: float) -> TCase:
+    """VlanMatrix bulk load of trunks, column index and column queries."""
+    size = _size(10000, scale)
+    intfs = [netports.Intf(f"Gi{i // 48}/0/{i % 48}") for i in range(size)]
+    lines = [f"1-{i % 100 + 10},{200 + i % 50}-300,1000-1100" for i in range(size)]
+
+    def func():
+        matrix = netports.VlanMatrix(zip(intfs, lines))
+        return [matrix.col(vlan) for vlan in range(1, 4095, 100)]
+
+    return func, size
+
+
+# ================================ tcp ===============================
+
+
+@case("itcp")
+def itcp_(scale: float) -> TCase:
+    """itcp() of ACL ports."""
+    size = _size(5000, scale)
+    line = _fragmented(size)
+    return (lambda: netports.itcp(line)), size
+
+
+@case("stcp")
+def stcp_(scale: float) -> TCase:
+    """stcp() of ACL ports."""
+    size = _size(5000, scale)
+    ports = [i for i in range(1, size * 3) if i % 3]
+    return (lambda: netports.stcp(ports)), size
+
+
+@case("complement_ports")
+def complement_ports_(scale: float) -> TCase:
+    """complement_ports() of ACL ports, not permitted ports."""
+    size = _size(5000, scale)
+    line = _fragmented(size)
+    return (lambda: netports.complement_ports(line)), size
+
+
+# ================================ ip ================================
+
+
+@case("iip")
+def iip_(scale: float) -> TCase:
+    """iip() of protocol names and numbers."""
+    size = _size(100, scale)
+    items = ["icmp", "tcp", "udp", "gre", "esp", "ospf", *range(size)]
+    return (lambda: netports.iip(items)), size
+
+
+@case("ip_pairs")
+def ip_pairs_(scale: float) -> TCase:
+    """ip_pairs() of protocol names and numbers."""
+    size = _size(100, scale)
+    items = ["icmp", "tcp", "udp", "gre", "esp", "ospf", *range(size)]
+    return (lambda: netports.ip_pairs(items)), size
+
+
+# ================================ intf ==============================
+
+
+def _intf_names(size: int) -> list:
+    """Interface names in random order."""
+    names = [f"interface Ethernet{i // 48 + 1}/{i % 48 + 1}" for i in range(size)]
+    random.Random(0).shuffle(names)
+    return names
+
+
+@case("Intf")
+def intf_init(scale: float) -> TCase:
+    """Intf() construction."""
+    size = _size(5000, scale)
+    names = _intf_names(size)
+    return (lambda: [Intf(s) for s in names]), size
+
+
+@case("Intf.sorted")
+def intf_sorted(scale: float) -> TCase:
+    """sorted() of Intf objects."""
+    size = _size(5000, scale)
+    intfs = [Intf(s) for s in _intf_names(size)]
+    return (lambda: sorted(intfs)), size
+
+
+@case("IntfGM.ranges")
+def intf_gm_ranges(scale: float) -> TCase:
+    """IntfGM.ranges() of interfaces."""
+    size = _size(2000, scale)
+    intf_gm = IntfGM(_intf_names(size))
+    return (lambda: intf_gm.ranges()), size
+
+
+@case("range_to_intfs")
+def range_to_intfs_(scale: float) -> TCase:
+    """range_to_intfs() of interface range."""
+    size = _size(100, scale)
+    line = ",".join(f"{i}/1-48" for i in range(1, size + 1))
+    return (lambda: netports.range_to_intfs(line, base="Ethernet")), size * 48
+
+
+# ============================= ipv4, mac ============================
+
+
+@case("IPv4")
+def ipv4_init(scale: float) -> TCase:
+    """IPv4() construction."""
+    size = _size(10000, scale)
+    addrs = [f"10.{i >> 8 & 255}.{i & 255}.1/24" for i in range(size)]
+    return (lambda: [IPv4(s) for s in addrs]), size
+
+
+@case("IPv4.hosts")
+def ipv4_hosts(scale: float) -> TCase:
+    """IPv4.hosts() of /16 network as strings."""
+    ipv4 = IPv4("10.0.0.0/16")
+    size = _size(65534, scale)
+    return (lambda: list(ipv4.hosts(stop=size, fmt="str"))), size
+
+
+@case("Mac")
+def mac_init(scale: float) -> TCase:
+    """Mac() construction."""
+    size = _size(10000, scale)
+    addrs = [f"{i:012x}" for i in range(size)]
+    return (lambda: [Mac(s) for s in addrs]), size
+
+
+@case("convert_macs")
+def convert_macs_(scale: float) -> TCase:
+    """convert_macs() to cisco format."""
+    size = _size(100000, scale)
+    addrs = [f"{i:012x}" for i in range(size)]
+    return (lambda: netports.convert_macs(addrs, to="cisco")), size
+
+
+# ============================= swversion ============================
+
+
+@case("SwVersion.sorted")
+def swversion_sorted(scale: float) -> TCase:
+    """sorted() of SwVersion objects."""
+    size = _size(5000, scale)
+    rand = random.Random(0)
+    texts = [
+        f"15.{rand.randint(0, 9)}({rand.randint(1, 9)})E{rand.randint(0, 99)}" for _ in range(size)
+    ]
+    versions = [SwVersion(s) for s in texts]
+    return (lambda: sorted(versions)), size
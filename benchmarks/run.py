@@ -0,0 +1,107 @@
+"""Benchmark runner, measures cases of benchmarks/cases.py and saves results to JSON.
+
+Usage:
+    python -m benchmarks.run --output benchmarks.json
+    python -m benchmarks.run --filter range --repeat 10
+    python -m benchmarks.run --compare old.json --output new.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+from datetime import datetime
+from importlib import metadata
+from typing import Any, Dict, List, Optional
+
+from benchmarks.cases import CASES
+from netports import cache
+
+DAny = Dict[str, Any]
+
+
+def run(names: List[str], repeat: int = 5, scale: float = 1.0) -> DAny:
+    """Run benchmark cases, parse cache is cleared before each measurement.
+
+    :param names: Names of the cases.
+    :param repeat: Number of measurements of each case.
+    :param scale: Factor of the realistic sizes.
+    :return: Results {name: {"size", "min", "median", "mean"}}, time in seconds.
+    """
+    results: DAny = {}
+    for name in names:
+        func, size = CASES[name](scale)
+        timings: List[float] = []
+        for _ in range(repeat):
+            cache.cache_clear()
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        results[name] = {
+            "size": size,
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.mean(timings),
+        }
+    return results
+
+
+def report(results: DAny, baseline: Optional[DAny] = None) -> str:
+    """Format results as table, with ratio to baseline results."""
+    lines = [f"{'case':<24} {'size':>8} {'min, ms':>10} {'median, ms':>11} {'ratio':>7}"]
+    for name, data in results.items():
+        ratio = ""
+        if baseline and name in baseline:
+            ratio = f"{data['min'] / baseline[name]['min']:.2f}"
+        lines.append(
+            f"{name:<24} {data['size']:>8} {data['min'] * 1000:>10.3f} "
+            f"{data['median'] * 1000:>11.3f} {ratio:>7}"
+        )
+    return "\n".join(lines)
+
+
+def _version() -> str:
+    """Version of installed netports package."""
+    try:
+        return metadata.version("netports")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def main(argv: Optional[List[str]] = None) -> DAny:
+    """Parse arguments, run benchmarks, print report and save JSON."""
+    parser = argparse.ArgumentParser(description="netports benchmarks")
+    parser.add_argument("--filter", default="", help="substring of case names")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements of each case")
+    parser.add_argument("--scale", type=float, default=1.0, help="factor of realistic sizes")
+    parser.add_argument("--output", default="", help="path to JSON results")
+    parser.add_argument("--compare", default="", help="path to JSON results of baseline")
+    args = parser.parse_args(argv)
+
+    names = [s for s in CASES if args.filter in s]
+    results = run(names=names, repeat=args.repeat, scale=args.scale)
+    data = {
+        "netports": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "repeat": args.repeat,
+        "scale": args.scale,
+        "results": results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+    print(report(results, baseline))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2)
+    return data
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,87 @@
-"""netports"""
+"""netports
+
+Public names are imported lazily on first access (PEP 562), so `import netports`
+does not import pydantic, packaging and vhelpers until IPv4, Mac, SwVersion, Intf are used.
+Environment variable NETPORTS_PROFILE=1 enables netports.profiling instrumentation.
+"""
+
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from netports.exceptions import NetportsValueError
-from netports.intf import (
-    Intf,
-    is_port_base,
-    sort_names,
-)
-from netports.intf_gm import (
-    IntfGM,
-    generate_intfs,
-    generate_names,
-    names_to_range,
-    range_to_intfs,
-    range_to_names,
-)
-from netports.intf_map import (
-    long_to_long,
-    long_to_short,
-    longs,
-    short_to_long,
-    short_to_short,
-    shorts,
-)
-from netports.ip import IP_NAMES, IP_NUMBERS, iip, sip, ip_pairs
-from netports.ipv4 import IPv4
-from netports.item import Item
-from netports.mac import Mac
-from netports.ports import inumbers, parse_range, snumbers
-from netports.range import Range
-from netports.swversion import SwVersion
-from netports.tcp import stcp, itcp, check_port, check_ports
-from netports.vlan import ivlan, svlan
+
+if TYPE_CHECKING:  # pragma: no cover
+    from netports.intf import (
+        Intf,
+        is_port_base,
+        sort_names,
+    )
+    from netports.intf_gm import (
+        IntfGM,
+        generate_intfs,
+        generate_names,
+        names_to_range,
+        range_to_intfs,
+        range_to_names,
+    )
+    from netports.intf_map import (
+        long_to_long,
+        long_to_short,
+        longs,
+        short_to_long,
+        short_to_short,
+        shorts,
+    )
+    from netports.ip import IP_NAMES, IP_NUMBERS, complement_ip, iip, sip, ip_pairs
+    from netports.ipv4 import IPv4
+    from netports.item import Item
+    from netports.mac import Mac, convert_macs, parse_macs, vendors
+    from netports.mac_table import MacTable
+    from netports.oui import OuiIndex
+    from netports.ports import inumbers, parse_range, snumbers
+    from netports.range import AllRange, FrozenRange, Range, coverage
+    from netports.swversion import SwVersion, SwVersionSpec
+    from netports.tcp import stcp, itcp, check_port, check_ports, complement_ports
+    from netports.vlan import complement_vlans, ivlan, svlan, trunk_changes
+    from netports.vlan_matrix import VlanMatrix
+
+_MODULES = {
+    "netports.intf": ("Intf", "is_port_base", "sort_names"),
+    "netports.intf_gm": (
+        "IntfGM",
+        "generate_intfs",
+        "generate_names",
+        "names_to_range",
+        "range_to_intfs",
+        "range_to_names",
+    ),
+    "netports.intf_map": (
+        "long_to_long",
+        "long_to_short",
+        "longs",
+        "short_to_long",
+        "short_to_short",
+        "shorts",
+    ),
+    "netports.ip": ("IP_NAMES", "IP_NUMBERS", "complement_ip", "iip", "sip", "ip_pairs"),
+    "netports.ipv4": ("IPv4",),
+    "netports.item": ("Item",),
+    "netports.mac": ("Mac", "convert_macs", "parse_macs", "vendors"),
+    "netports.mac_table": ("MacTable",),
+    "netports.oui": ("OuiIndex",),
+    "netports.ports": ("inumbers", "parse_range", "snumbers"),
+    "netports.range": ("AllRange", "FrozenRange", "Range", "coverage"),
+    "netports.swversion": ("SwVersion", "SwVersionSpec"),
+    "netports.tcp": ("stcp", "itcp", "check_port", "check_ports", "complement_ports"),
+    "netports.vlan": ("complement_vlans", "ivlan", "svlan", "trunk_changes"),
+    "netports.vlan_matrix": ("VlanMatrix",),
+}
+_LAZY_NAMES: Dict[str, str] = {name: module for module, names in _MODULES.items() for name in names}
 
 __all__ = [
+    "AllRange",
+    "FrozenRange",
     "IP_NAMES",
     "IP_NUMBERS",
     "IPv4",
@@ -40,11 +89,20 @@ __all__ = [
     "IntfGM",
     "Item",
     "Mac",
+    "MacTable",
     "NetportsValueError",
+    "OuiIndex",
     "Range",
     "SwVersion",
+    "SwVersionSpec",
+    "VlanMatrix",
     "check_port",
     "check_ports",
+    "complement_ip",
+    "complement_ports",
+    "complement_vlans",
+    "convert_macs",
+    "coverage",
     "generate_intfs",
     "generate_names",
     "iip",
@@ -57,6 +115,7 @@ __all__ = [
     "long_to_short",
     "longs",
     "names_to_range",
+    "parse_macs",
     "parse_range",
     "range_to_intfs",
     "range_to_names",
@@ -68,4 +127,27 @@ __all__ = [
     "sort_names",
     "stcp",
     "svlan",
+    "trunk_changes",
+    "vendors",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public name from submodule on first access and cache it in the package."""
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Names of the package, including not yet imported."""
+    return sorted(set(globals()).union(__all__))
+
+
+if os.environ.get("NETPORTS_PROFILE"):  # pragma: no cover
+    from netports import profiling
+
+    profiling.enable()
@@ -0,0 +1,226 @@
+"""LRU cache of parsed ranges, used by parse_range, ivlan, svlan, itcp, stcp.
+
+The same strings ("1-4094", "10,20,30-40") recur in configurations of many devices.
+Results are cached by (function, items, kwargs) and stored in immutable compact form,
+list results as runs of consecutive numbers, a mutable copy is made on each call
+only for list and Range results. One public call is one cache entry, ivlan and itcp
+call the not cached parser internally.
+Items that are not str, int or list/tuple of str/int (up to MAX_ITEMS) are not cached.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from netports.exceptions import NetportsValueError
+
+DEFAULT_MAXSIZE = 1024
+MAX_ITEMS = 1024  # longer lists are not cached, key would hold all numbers
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, like functools.lru_cache().cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LruCache:
+    """Bounded thread-safe LRU cache."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """Init LruCache.
+
+        :param maxsize: Maximum number of cached results, 0 - disable cache.
+        """
+        self._lock = threading.Lock()
+        self._data: OrderedDict = OrderedDict()
+        self._maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.maxsize = maxsize
+
+    def __repr__(self) -> str:
+        """Representation of the object."""
+        class_ = self.__class__.__name__
+        return f"<{class_}: {self.info()}>"
+
+    def __len__(self) -> int:
+        """Return number of cached results."""
+        return len(self._data)
+
+    # =========================== property ===========================
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached results, 0 - cache is disabled."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if not isinstance(maxsize, int):
+            raise TypeError(f"{maxsize=} {int} expected")
+        if maxsize < 0:
+            raise NetportsValueError(f"{maxsize=}, expected >= 0")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    # =========================== methods ============================
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: Any) -> Tuple[bool, Any]:
+        """Get cached result and mark it as recently used.
+
+        :param key: Hashable key.
+        :return: (True, result) if the key is cached, (False, None) otherwise.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def info(self) -> CacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def set(self, key: Any, value: Any) -> None:
+        """Cache result, the least recently used result is removed if the cache is full."""
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+CACHE = LruCache()
+
+
+def cache_info() -> CacheInfo:
+    """Return statistics of parse cache.
+
+    :return: CacheInfo(hits, misses, maxsize, currsize).
+
+    :example:
+        ivlan("1-3")
+        ivlan("1-3")
+        cache_info() -> CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    """
+    return CACHE.info()
+
+
+def cache_clear() -> None:
+    """Remove all cached results and reset statistics."""
+    CACHE.clear()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Set maximum number of cached results.
+
+    :param maxsize: Maximum number of cached results, 0 - disable cache.
+    :raises TypeError: If maxsize is not int.
+    :raises NetportsValueError: If maxsize is negative.
+    """
+    CACHE.maxsize = maxsize
+
+
+# ============================ decorator =============================
+
+
+def cached(freeze: Callable[[Any], Any], thaw: Callable[[Any], Any]) -> Callable:
+    """Cache results of the parse function by (function, items, kwargs).
+
+    :param freeze: Convert result to immutable form, to store in the cache.
+    :param thaw: Convert stored result to the returned form (mutable copy).
+    :return: Decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _key(name, args, kwargs)
+            if key is None or not CACHE.maxsize:
+                return func(*args, **kwargs)
+            found, value = CACHE.get(key)
+            if not found:
+                value = freeze(func(*args, **kwargs))
+                CACHE.set(key, value)
+            return thaw(value)
+
+        return wrapper
+
+    return decorator
+
+
+def _key(name: str, args: tuple, kwargs: Dict[str, Any]) -> Optional[tuple]:
+    """Hashable key of the call or None if items or kwargs are not cacheable."""
+    if len(args) > 1:
+        return None
+    items = args[0] if args else ""
+    if isinstance(items, (list, tuple)):
+        if len(items) > MAX_ITEMS:
+            return None
+        if not all(type(i) in (str, int) for i in items):  # bool True == 1
+            return None
+        items = tuple(items)
+    elif type(items) not in (str, int):
+        return None
+    kwargs_ = tuple(sorted(kwargs.items()))
+    for _, value in kwargs_:
+        if not isinstance(value, (str, int, type(None))):
+            return None
+    return name, items, kwargs_
+
+
+def _same(value: Any) -> Any:
+    """Return value as is, for immutable results."""
+    return value
+
+
+def _to_intervals(value: Any) -> Any:
+    """Convert list result to compact tuple of runs ((first, last), ...) of consecutive numbers,
+    immutable results (AllRange) as is. Memory of the cached result depends on the number of
+    runs, not on the number of numbers."""
+    if not isinstance(value, list):
+        return value
+    runs: List[List[int]] = []
+    for number in value:
+        if runs and number == runs[-1][1] + 1:
+            runs[-1][1] = number
+        else:
+            runs.append([number, number])
+    return tuple((first, last) for first, last in runs)
+
+
+def _to_list(value: Any) -> Any:
+    """Convert stored runs to list of numbers, immutable results (AllRange) as is."""
+    if not isinstance(value, tuple):
+        return value
+    return list(chain.from_iterable(range(first, last + 1) for first, last in value))
+
+
+cached_list = cached(freeze=_to_intervals, thaw=_to_list)
+cached_str = cached(freeze=_same, thaw=_same)
@@ -43,6 +43,11 @@ def is_brief_in_items(items: Any) -> bool:
     return False
 
 
+def is_lazy(**kwargs) -> bool:
+    """Get param `lazy` from `kwargs`."""
+    return bool(kwargs.get("lazy"))
+
+
 def is_verbose(**kwargs) -> bool:
     """Get param `verbose` from `kwargs`."""
     verbose = kwargs.get("verbose")
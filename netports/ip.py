@@ -1,12 +1,12 @@
 """IP Protocols"""
 
 from operator import itemgetter
-from typing import Any, Tuple
+from typing import Any, Tuple, Union
 
 from netports import helpers as h
 from netports.exceptions import NetportsValueError
 from netports.ports import snumbers
-from netports.range import Range
+from netports.range import AllRange, Range
 from netports.static import BRIEF_ALL_I
 from netports.types_ import LInt, LStr, DAny, DiAny, SStr, SInt, LTIntStr
 
@@ -296,10 +296,11 @@ MIN_NUMBER = 0
 MAX_NUMBER = 255
 ALL_NUMBERS_L = list(range(MIN_NUMBER, MAX_NUMBER + 1))
 ALL_NUMBERS_S = f"{MIN_NUMBER}-{MAX_NUMBER}"
+ALL_NUMBERS_R = AllRange(MIN_NUMBER, MAX_NUMBER)  # lazy, returned for lazy=True
 
 
 # noinspection PyIncorrectDocstring
-def iip(items: Any = "", **kwargs) -> LInt:
+def iip(items: Any = "", **kwargs) -> Union[LInt, AllRange]:
     """Sorting IP protocol numbers and removing duplicates.
 
     :param items: Range of IP protocol numbers, can be unsorted and with duplicates,
@@ -316,8 +317,13 @@ def iip(items: Any = "", **kwargs) -> LInt:
     :param all: True - Return all IP protocol numbers: [0, 1, ..., 255].
     :type all: bool
 
-    :return: List[int] of unique sorted IP protocol numbers.
-    :rtype: List[int]
+    :param lazy: True - all IP protocol numbers as lazy ALL_NUMBERS_R = AllRange(0, 255),
+        instead of [-1] or [0, 1, ..., 255], False - list (default).
+    :type lazy: bool
+
+    :return: List[int] of unique sorted IP protocol numbers,
+        AllRange of all numbers for lazy=True.
+    :rtype: List[int] or AllRange
 
     :raises NetportsValueError: If IP protocol numbers are outside valid range 0...255.
 
@@ -328,22 +334,28 @@ def iip(items: Any = "", **kwargs) -> LInt:
         iip("ip") -> [0, 1, ... 254, 255]
     """
     if h.is_all(**kwargs):
+        if h.is_lazy(**kwargs):
+            return ALL_NUMBERS_R
         if h.is_brief(**kwargs):
             return [BRIEF_ALL_I]
         return ALL_NUMBERS_L.copy()
-    if h.is_brief(**kwargs):
+    if h.is_brief(**kwargs) or h.is_lazy(**kwargs):
         if h.is_brief_in_items(items):
-            return [BRIEF_ALL_I]
+            return ALL_NUMBERS_R if h.is_lazy(**kwargs) else [BRIEF_ALL_I]
 
     items_ = [s.lower() for s in h.split(items)]
 
     # 0-255
     if ALL_NUMBERS_S in items_:
+        if h.is_lazy(**kwargs):
+            return ALL_NUMBERS_R
         if h.is_brief(**kwargs):
             return [BRIEF_ALL_I]
         return ALL_NUMBERS_L.copy()
 
     # names, numbers
+    if h.is_lazy(**kwargs):  # "ip" to all numbers, compared with ALL_NUMBERS_L below
+        kwargs = {**kwargs, "verbose": True}
     pairs, invalid = ip_pairs(items=items_, **kwargs)
     if h.is_strict(**kwargs):
         if invalid:
@@ -352,9 +364,9 @@ def iip(items: Any = "", **kwargs) -> LInt:
         return []
     numbers, _ = [list(t) for t in zip(*pairs)]
 
-    if h.is_brief(**kwargs):
+    if h.is_brief(**kwargs) or h.is_lazy(**kwargs):
         if numbers == ALL_NUMBERS_L:
-            return [BRIEF_ALL_I]
+            return ALL_NUMBERS_R if h.is_lazy(**kwargs) else [BRIEF_ALL_I]
     return numbers
 
 
@@ -391,13 +403,42 @@ def sip(items: Any = "", **kwargs) -> str:
         if h.is_brief_in_items(items):
             return ALL_NUMBERS_S
 
-    numbers = iip(items, **kwargs)
+    numbers = iip(items, **{**kwargs, "lazy": False})
     if h.is_brief_in_items(numbers):
         return ALL_NUMBERS_S
 
     return snumbers(numbers)
 
 
+# noinspection PyIncorrectDocstring
+def complement_ip(items: Any = "", **kwargs) -> Range:
+    """IP protocol numbers that are absent in items, in the valid range 0...255.
+
+    :param items: Range of IP protocol numbers and names, can be unsorted and with duplicates,
+        "ip" or "-1" - all IP protocol numbers.
+    :type items: str or List[int] or List[str]
+
+    :param strict: True - Raises NetportsValueError, if the protocol is unknown (default),
+        False - Skips unknown protocols.
+    :type strict: bool
+
+    :param all: True - items are all IP protocol numbers, returns empty Range.
+    :type all: bool
+
+    :return: Range of absent IP protocol numbers.
+    :rtype: Range
+
+    :raises NetportsValueError: If IP protocol numbers are outside valid range 0...255.
+
+    :example:
+        complement_ip("icmp,tcp,7-255") -> Range("0,2-5")
+    """
+    if h.is_all(**kwargs) or h.is_brief_in_items(items):
+        return Range()
+    numbers = iip(items, **{**kwargs, "verbose": True, "lazy": False})
+    return Range.from_sorted(numbers).complement(MIN_NUMBER, MAX_NUMBER)
+
+
 # noinspection PyIncorrectDocstring
 def ip_pairs(items: Any, **kwargs) -> Tuple[LTIntStr, LStr]:
     """Split items to IP protocol Number, Name and undefined-invalid protocols.
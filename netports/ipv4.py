@@ -5,17 +5,18 @@ from __future__ import annotations
 import re
 from functools import total_ordering
 from ipaddress import IPv4Interface, IPv4Network, IPv4Address
-from typing import List, Dict, Iterator
+from typing import Any, Dict, Iterator, List, Tuple
 
 from pydantic import BaseModel, Field
 from vhelpers import vre
 
 from netports.exceptions import NetportsValueError
-from netports.types_ import T2Str
+from netports.types_ import OInt, T2Str
 
 RE_IP = r"\d+\.\d+\.\d+\.\d+"
 RE_PREFIX = r"\d+\.\d+\.\d+\.\d+/\d+"
 MASK_SPLITTER = r"[\s\\/]"
+HOSTS_FMTS = ("ipv4", "str", "int")
 
 
 @total_ordering
@@ -235,28 +236,77 @@ class IPv4(BaseModel):
 
     # ============================== other ===============================
 
-    def hosts(self) -> Iterator[IPv4]:
-        """List of all usable hosts in the network."""
+    @property
+    def hosts_count(self) -> int:
+        """Number of usable hosts in the network, the length of hosts()."""
+        first, last = self._hosts_edges()
+        return last - first + 1
+
+    def hosts(self, start: int = 0, stop: OInt = None, fmt: str = "ipv4") -> Iterator[Any]:
+        """Iterate usable hosts in the network.
+
+        Hosts are generated from the integer value of the network,
+        the IPv4 objects are created only for fmt="ipv4".
+
+        :param start: Index of the first host to yield, negative index counts from the end.
+        :param stop: Index of the host to stop before, None - till the last host.
+        :param fmt: Format option:
+            "ipv4" - IPv4 objects (default),
+            "str" - Strings in the same representation as self.addr,
+            "int" - Integer values of the host addresses.
+        :return: Generator of hosts.
+        :raises NetportsValueError: If the representation is wildcard or invalid fmt.
+
+        :example:
+            IPv4("10.0.0.0/24").hosts(start=1, stop=3, fmt="str") -> "10.0.0.2/24", "10.0.0.3/24"
+        """
+        if fmt not in HOSTS_FMTS:
+            raise NetportsValueError(f"Invalid {fmt=}, expected {HOSTS_FMTS}")
         representation = self.representation
         if representation == "wildcard":
             raise NetportsValueError(f"Invalid {representation=}")
-        generator_ = self._interface.network.hosts()
-        for address in generator_:
-            if representation == "cidr":
-                addr = f"{address}/{self.len}"
-            elif representation == "host":
-                addr = str(address)
-            elif representation == "mask":
-                addr = f"{address} {self.netmask}"
+        first, last = self._hosts_edges()
+        numbers = range(first, last + 1)[start:stop]
+        if fmt == "int":
+            yield from numbers
+            return
+
+        if representation == "cidr":
+            suffix = f"/{self.len}"
+        elif representation == "host":
+            suffix = ""
+        elif representation == "mask":
+            suffix = f" {self.netmask}"
+        else:
+            raise NetportsValueError(f"Invalid {representation=}")
+        for number in numbers:
+            addr = f"{_int_to_ip(number)}{suffix}"
+            if fmt == "str":
+                yield addr
             else:
-                raise NetportsValueError(f"Invalid {representation=}")
-            yield IPv4(addr)
+                yield IPv4(addr)
+
+    # ============================= helpers ==============================
+
+    def _hosts_edges(self) -> Tuple[int, int]:
+        """Integer values of the first and the last usable hosts in the network."""
+        network = self._interface.network
+        first = int(network.network_address)
+        last = int(network.broadcast_address)
+        if network.prefixlen < 31:
+            return first + 1, last - 1
+        return first, last
 
 
 LIPv4 = List[IPv4]
 DIPv4 = Dict[str, IPv4]
 
 
+def _int_to_ip(number: int) -> str:
+    """Convert integer to IPv4 address A.B.C.D without IPv4Address object."""
+    return f"{number >> 24}.{number >> 16 & 255}.{number >> 8 & 255}.{number & 255}"
+
+
 def _validate_addr(*args, **kwargs) -> T2Str:
     """Validate IPv4 address, convert address or network with mask to CIDR A.B.C.D/LEN format.
 
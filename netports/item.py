@@ -11,6 +11,8 @@ from netports.exceptions import NetportsValueError
 class Item:
     """Item, element of Range."""
 
+    _changes = 0  # counter of changed items, invalidates lines rendered by Range
+
     def __init__(self, line: str):
         """Init Item.
 
@@ -26,6 +28,15 @@ class Item:
         """
         self.line = line
 
+    @classmethod
+    def _from_bounds(cls, start: int, end: int) -> "Item":
+        """Create Item from validated bounds start <= end, without regex parsing."""
+        item = cls.__new__(cls)
+        item._min = start
+        item._max = end
+        item._line = f"{start}-{end}" if start < end else str(start)
+        return item
+
     def __repr__(self) -> str:
         """Representation of the object."""
         class_ = self.__class__.__name__
@@ -76,6 +87,8 @@ class Item:
         self._max = self._min if len(items) == 1 else int(items[1])
         if self.min > self.max:
             raise NetportsValueError(f"{self.max=} < {self.min=}")
+        if hasattr(self, "_line"):  # changed in place, not a new item
+            Item._changes += 1
         self._line = line
 
     @property
@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
-import string
+import re
 from functools import total_ordering
-from typing import List, Dict
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Tuple
 
 from pydantic import BaseModel, Field
 
+from netports import oui as oui_
 from netports.exceptions import NetportsValueError
-from netports.types_ import LStr, T2Str
+from netports.types_ import IStr, LInt, LStr, T2Str
+
+MAX_MAC = 0xFFFFFFFFFFFF
+RE_MAC_CHARS = re.compile(r"[0-9a-fA-F:.-]+")
+MAC_SPLITTERS = str.maketrans("", "", ":.-")
+MAC_FORMATS: Dict[str, Tuple[int, str]] = {
+    "cisco": (4, "."),
+    "hex": (12, ""),
+    "hp_comware": (4, "-"),
+    "hp_procurve": (6, "-"),
+    "linux": (2, ":"),
+    "windows": (2, "-"),
+}
+# precomputed slices of the 12 hexdigits and the splitter for each format
+MAC_LAYOUTS: Dict[str, Tuple[str, itemgetter]] = {
+    fmt: (splitter, itemgetter(*[slice(i, i + size) for i in range(0, 12, size)]))
+    for fmt, (size, splitter) in MAC_FORMATS.items()
+}
+RE_HEX12 = re.compile(r"[0-9a-f]{12}")
 
 
 @total_ordering
@@ -28,6 +48,7 @@ class Mac(BaseModel):
         kwargs_ = {k: v for k, v in kwargs.items() if k != "addr"}
         super().__init__(addr=addr, **kwargs_)
         self._hex = hex_
+        self._integer = int(hex_, 16)
 
     def __repr__(self) -> str:
         """Representation of the object."""
@@ -40,7 +61,7 @@ class Mac(BaseModel):
 
     def __hash__(self) -> int:
         """Hash value of the object."""
-        return hash(self.integer)
+        return self._integer
 
     def __eq__(self, other) -> bool:
         """Check if two objects are equal.
@@ -49,8 +70,7 @@ class Mac(BaseModel):
         :return: True if objects are equal, False otherwise.
         """
         if self.__class__ == other.__class__:
-            if self.__hash__() == other.__hash__():
-                return True
+            return self._integer == other._integer
         return False
 
     def __lt__(self, other) -> bool:
@@ -59,7 +79,7 @@ class Mac(BaseModel):
         :param other: Another object to compare with.
         """
         if self.__class__ == other.__class__:
-            return self.integer < other.integer
+            return self._integer < other._integer
         return False
 
     def __copy__(self) -> Mac:
@@ -67,7 +87,36 @@ class Mac(BaseModel):
 
         :return: A copy of the current object.
         """
-        return type(self)(line=self.addr)
+        return self._construct(addr=self.addr, hex_=self._hex, integer=self._integer)
+
+    # =========================== constructors ===========================
+
+    @classmethod
+    def from_int(cls, number: int) -> Mac:
+        """Create Mac from 48-bit integer without parsing and validation of the text.
+
+        :param number: MAC address as integer.
+        :return: Mac object, addr is 12-character lower-case hexadecimal string.
+        :raises TypeError: If number is not integer.
+        :raises NetportsValueError: If number is outside the 48-bit range.
+
+        :example:
+            Mac.from_int(1).addr -> "000000000001"
+        """
+        if not isinstance(number, int):
+            raise TypeError(f"{number=} {int} expected")
+        if not 0 <= number <= MAX_MAC:
+            raise NetportsValueError(f"Invalid {number=}, expected in range 0...{MAX_MAC}")
+        hex_ = f"{number:012x}"
+        return cls._construct(addr=hex_, hex_=hex_, integer=number)
+
+    @classmethod
+    def _construct(cls, addr: str, hex_: str, integer: int) -> Mac:
+        """Create Mac from already validated data, skipping pydantic validation."""
+        obj = cls.model_construct(addr=addr)
+        obj._hex = hex_
+        obj._integer = integer
+        return obj
 
     # ============================= property =============================
 
@@ -79,37 +128,48 @@ class Mac(BaseModel):
     @property
     def integer(self) -> int:
         """MAC address as integer."""
-        return int(self.hex, 16)
+        return self._integer
+
+    @property
+    def oui(self) -> str:
+        """Organizationally Unique Identifier, first 24 bits as 6 hexdigits: 000000."""
+        return f"{self._integer >> 24:06x}"
+
+    @property
+    def vendor(self) -> str:
+        """Vendor name from local OUI registry, set by oui.set_registry().
+
+        :return: Vendor name, empty str if the prefix is unknown or registry is not set.
+        """
+        index = oui_.get_index()
+        if index is None:
+            return ""
+        return index.lookup(self._integer)
 
     @property
     def cisco(self) -> str:
         """Return MAC in Cisco dot format: 0000.0000.0000."""
-        addr = self.format(size=4, splitter=".")
-        return addr.lower()
+        return _render(self._hex.lower(), MAC_LAYOUTS["cisco"])
 
     @property
     def hp_comware(self) -> str:
         """Return MAC in hp_comware dash format: 0000-0000-0000."""
-        addr = self.format(size=4, splitter="-")
-        return addr.lower()
+        return _render(self._hex.lower(), MAC_LAYOUTS["hp_comware"])
 
     @property
     def hp_procurve(self) -> str:
         """Return MAC in hp_procurve dash format: 000000-000000."""
-        addr = self.format(size=6, splitter="-")
-        return addr.lower()
+        return _render(self._hex.lower(), MAC_LAYOUTS["hp_procurve"])
 
     @property
     def linux(self) -> str:
         """Return MAC in Linux colon format: 00:00:00:00:00:00."""
-        addr = self.format(size=2, splitter=":")
-        return addr.lower()
+        return _render(self._hex.lower(), MAC_LAYOUTS["linux"])
 
     @property
     def windows(self) -> str:
         """Return MAC in Windows dash format: 00-00-00-00-00-00."""
-        addr = self.format(size=2, splitter="-")
-        return addr.lower()
+        return _render(self._hex.lower(), MAC_LAYOUTS["windows"])
 
     # ============================= methods ==============================
 
@@ -131,9 +191,130 @@ LMac = List[Mac]
 DMac = Dict[str, Mac]
 
 
+# ============================= functions ============================
+
+
+def convert_macs(addrs: IStr, to: str = "cisco", strict: bool = True) -> LStr:
+    """Convert MAC addresses to the required format in one pass, without Mac objects.
+
+    :param addrs: MAC addresses in any format accepted by Mac.
+    :param to: Format name: "cisco", "hex", "hp_comware", "hp_procurve", "linux", "windows".
+    :param strict: True - Raise NetportsValueError if the MAC address is invalid (default),
+        False - Skip invalid MAC addresses.
+    :return: MAC addresses in lower-case.
+    :raises NetportsValueError: If invalid format or strict=True and the MAC address is invalid.
+
+    :example:
+        convert_macs(["00:00:00:00:00:01"], to="cisco") -> ["0000.0000.0001"]
+    """
+    splitter, chunks = _get_layout(to)
+    join = splitter.join
+    splitters = MAC_SPLITTERS
+    fullmatch = RE_HEX12.fullmatch
+    results: LStr = []
+    for addr in addrs:
+        hex_ = addr.translate(splitters).lower()
+        if fullmatch(hex_):
+            results.append(join(chunks(hex_)))
+        elif strict:
+            raise NetportsValueError(f"Invalid MAC address {addr=}")
+    return results
+
+
+def parse_macs(addrs: IStr, strict: bool = True) -> LInt:
+    """Convert MAC addresses to integers in one pass, without Mac objects.
+
+    :param addrs: MAC addresses in any format accepted by Mac.
+    :param strict: True - Raise NetportsValueError if the MAC address is invalid (default),
+        False - Skip invalid MAC addresses.
+    :return: MAC addresses as integers.
+    :raises NetportsValueError: If strict=True and the MAC address is invalid.
+
+    :example:
+        parse_macs(["0000.0000.0001", "00-00-00-00-00-0a"]) -> [1, 10]
+    """
+    splitters = MAC_SPLITTERS
+    fullmatch = RE_HEX12.fullmatch
+    results: LInt = []
+    for addr in addrs:
+        hex_ = addr.translate(splitters).lower()
+        if fullmatch(hex_):
+            results.append(int(hex_, 16))
+        elif strict:
+            raise NetportsValueError(f"Invalid MAC address {addr=}")
+    return results
+
+
+def vendors(macs: Iterable[Any]) -> LStr:
+    """Vendor names of MAC addresses from local OUI registry, set by oui.set_registry().
+
+    :param macs: MAC addresses, str in any format accepted by Mac, int or Mac objects.
+    :return: Vendor names, empty str if the prefix is unknown or registry is not set.
+    :raises NetportsValueError: If the MAC address is invalid.
+
+    :example:
+        oui.set_registry("oui.csv")
+        vendors(["0000.0c00.0001"]) -> ["Cisco Systems, Inc"]
+    """
+    integers: LInt = []
+    for mac in macs:
+        if isinstance(mac, Mac):
+            integers.append(mac.integer)
+        elif isinstance(mac, int):
+            integers.append(mac)
+        else:
+            integers.append(_addr_to_int(str(mac)))
+    index = oui_.get_index()
+    if index is None:
+        return [""] * len(integers)
+    return index.lookup_many(integers)
+
+
 # ============================= helpers ==============================
 
 
+def _addr_to_int(addr: str) -> int:
+    """Convert MAC address in any format accepted by Mac to integer.
+
+    :param addr: MAC address.
+    :return: MAC address as integer.
+    :raises NetportsValueError: If the MAC address is invalid or empty.
+    """
+    _, hex_ = _validate_addr(addr)
+    return int(hex_, 16)
+
+
+def _int_to_addr(integer: int, fmt: str) -> str:
+    """Convert integer to MAC address in the format defined in MAC_FORMATS.
+
+    :param integer: MAC address as integer.
+    :param fmt: Format name: "cisco", "hex", "hp_comware", "hp_procurve", "linux", "windows".
+    :return: MAC address in lower-case.
+    :raises NetportsValueError: If invalid fmt.
+    """
+    return _render(f"{integer:012x}", _get_layout(fmt))
+
+
+def _render(hex_: str, layout: Tuple[str, itemgetter]) -> str:
+    """Render 12 hexdigits by layout (splitter, chunks getter).
+
+    For "hex" format the getter returns the whole str, joined with empty splitter.
+    """
+    splitter, chunks = layout
+    return splitter.join(chunks(hex_))
+
+
+def _get_layout(fmt: str) -> Tuple[str, itemgetter]:
+    """Get layout (splitter, chunks getter) of the MAC address format.
+
+    :raises NetportsValueError: If invalid fmt.
+    """
+    try:
+        return MAC_LAYOUTS[fmt]
+    except KeyError as ex:
+        raise NetportsValueError(f"Invalid {fmt=}, expected {list(MAC_FORMATS)}") from ex
+
+
 def _validate_addr(*args, **kwargs) -> T2Str:
     """Extract MAC address line from arguments or keyword arguments.
 
@@ -151,15 +332,12 @@ def _validate_addr(*args, **kwargs) -> T2Str:
         raise NetportsValueError("MAC address is empty.")
 
     # splitter
-    expected = string.hexdigits + ":.-"
-    if set(addr).difference(set(expected)):
+    if not RE_MAC_CHARS.fullmatch(addr):
         raise NetportsValueError("Invalid MAC address splitter")
 
     # hex
-    hexdigits: LStr = [s for s in addr if s in string.hexdigits]
-    line = "".join(hexdigits)
-    if len(line) != 12:
+    hex_ = addr.translate(MAC_SPLITTERS)
+    if len(hex_) != 12:
         raise NetportsValueError("Invalid MAC address format, 12 hexdigits expected.")
-    hex_ = "".join(hexdigits)
 
     return addr, hex_
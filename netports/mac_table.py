@@ -0,0 +1,204 @@
+"""MacTable, compact container of MAC address table rows (vlan, mac, interface)."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from netports import helpers as h
+from netports.exceptions import NetportsValueError
+from netports.mac import MAX_MAC, Mac, _addr_to_int, _int_to_addr
+from netports.types_ import LInt, LStr, StrInt
+
+MIN_VLAN_ID = 0
+MAX_VLAN_ID = 4095
+
+TRow = Tuple[int, str, str]
+LTRow = List[TRow]
+
+
+class MacTable:
+    """MacTable, compact container of MAC address table rows (vlan, mac, interface).
+
+    MAC addresses are stored as 48-bit integers in array buffer, with parallel
+    VLAN column and column of interned interface names.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[StrInt, Any, str]] = ()):
+        """Init MacTable.
+
+        :param rows: Rows of MAC address table (vlan, mac, interface).
+            mac can be str in any format accepted by Mac, int or Mac object.
+        :type rows: List[Tuple[int, str, str]]
+
+        :raises NetportsValueError: If the MAC address or VLAN ID is invalid.
+
+        :example:
+            table = MacTable([(10, "0000.0000.0001", "Gi0/1")])
+            table.rows(fmt="linux") -> [(10, "00:00:00:00:00:01", "Gi0/1")]
+        """
+        self._macs: array = array("Q")
+        self._vlans: array = array("H")
+        self._intf_ids: array = array("I")
+        self._intfs: LStr = []  # interned interface names
+        self._intf_idx: Dict[str, int] = {}
+        self._sorted_macs: Optional[array] = None
+        self._sorted_rows: Optional[array] = None
+        self.extend(rows)
+
+    def __repr__(self) -> str:
+        """Representation of the object."""
+        class_ = self.__class__.__name__
+        rows = len(self)
+        intfs = len(self._intfs)
+        return f"<{class_}: {rows=} {intfs=}>"
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return len(self._macs)
+
+    def __iter__(self) -> Iterator[TRow]:
+        """Iterate rows (vlan, mac, interface), mac in hex format."""
+        return iter(self.rows())
+
+    def __contains__(self, mac: Any) -> bool:
+        """Check if the MAC address is present in the table."""
+        return bool(self._find_rows(_to_int(mac)))
+
+    # =========================== property ===========================
+
+    @property
+    def intfs(self) -> LStr:
+        """Unique interface names in order of appearance."""
+        return list(self._intfs)
+
+    @property
+    def integers(self) -> array:
+        """Column of MAC addresses as integers."""
+        return self._macs
+
+    @property
+    def vlans(self) -> array:
+        """Column of VLAN IDs."""
+        return self._vlans
+
+    # =========================== methods ============================
+
+    def append(self, vlan: StrInt, mac: Any, intf: str) -> None:
+        """Append row to the table.
+
+        :param vlan: VLAN ID.
+        :param mac: MAC address, str in any format accepted by Mac, int or Mac object.
+        :param intf: Interface name.
+        :raises NetportsValueError: If the MAC address or VLAN ID is invalid.
+        """
+        self._append(vlan=vlan, integer=_to_int(mac), intf=intf)
+        self._sorted_macs = None
+        self._sorted_rows = None
+
+    def extend(self, rows: Iterable[Tuple[StrInt, Any, str]]) -> None:
+        """Append rows (vlan, mac, interface) to the table.
+
+        :param rows: Rows of MAC address table.
+        :raises NetportsValueError: If the MAC address or VLAN ID is invalid.
+        """
+        self._sorted_macs = None  # reset before the loop, rows appended before an error are kept
+        self._sorted_rows = None
+        for vlan, mac, intf in rows:
+            self._append(vlan=vlan, integer=_to_int(mac), intf=intf)
+
+    def find(self, mac: Any, fmt: str = "hex") -> LTRow:
+        """Find rows by MAC address, using binary search in the sorted index.
+
+        :param mac: MAC address, str in any format accepted by Mac, int or Mac object.
+        :param fmt: Format of the MAC address in result, key of mac.MAC_FORMATS.
+        :return: Rows (vlan, mac, interface) with the MAC address.
+        """
+        return [self._row(i, fmt) for i in self._find_rows(_to_int(mac))]
+
+    def intfs_by_mac(self, mac: Any) -> LStr:
+        """Interface names where the MAC address is learned.
+
+        :param mac: MAC address, str in any format accepted by Mac, int or Mac object.
+        :return: Unique interface names.
+        """
+        names: LStr = []
+        for idx in self._find_rows(_to_int(mac)):
+            name = self._intfs[self._intf_ids[idx]]
+            if name not in names:
+                names.append(name)
+        return names
+
+    def macs(self, fmt: str = "hex") -> LStr:
+        """Render MAC addresses column in the required format.
+
+        :param fmt: Format name: "cisco", "hex", "hp_comware", "hp_procurve", "linux", "windows".
+        :return: MAC addresses.
+        :raises NetportsValueError: If invalid fmt.
+        """
+        return [_int_to_addr(i, fmt) for i in self._macs]
+
+    def rows(self, fmt: str = "hex") -> LTRow:
+        """Render rows (vlan, mac, interface) with MAC address in the required format.
+
+        :param fmt: Format name: "cisco", "hex", "hp_comware", "hp_procurve", "linux", "windows".
+        :return: Rows of MAC address table.
+        :raises NetportsValueError: If invalid fmt.
+        """
+        return [self._row(i, fmt) for i in range(len(self))]
+
+    # =========================== helpers ============================
+
+    def _append(self, vlan: StrInt, integer: int, intf: str) -> None:
+        """Append already converted row to the columns."""
+        vlan_ = h.to_int(vlan)
+        if not MIN_VLAN_ID <= vlan_ <= MAX_VLAN_ID:
+            raise NetportsValueError(f"{vlan=}, expected in range {MIN_VLAN_ID}...{MAX_VLAN_ID}")
+        intf = str(intf)
+        intf_id = self._intf_idx.get(intf)
+        if intf_id is None:
+            intf_id = len(self._intfs)
+            self._intf_idx[intf] = intf_id
+            self._intfs.append(intf)
+        self._macs.append(integer)
+        self._vlans.append(vlan_)
+        self._intf_ids.append(intf_id)
+
+    def _find_rows(self, integer: int) -> LInt:
+        """Indexes of rows with the MAC address, in order of appearance (stable sort)."""
+        sorted_macs, sorted_rows = self._index()
+        start = bisect_left(sorted_macs, integer)
+        end = bisect_right(sorted_macs, integer, start)
+        return list(sorted_rows[start:end])
+
+    def _index(self) -> Tuple[array, array]:
+        """Sorted index of MAC addresses and row indexes, built on first lookup."""
+        if self._sorted_macs is None or self._sorted_rows is None:
+            macs = self._macs
+            rows = sorted(range(len(macs)), key=macs.__getitem__)
+            self._sorted_rows = array("I", rows)
+            self._sorted_macs = array("Q", [macs[i] for i in rows])
+        return self._sorted_macs, self._sorted_rows
+
+    def _row(self, idx: int, fmt: str) -> TRow:
+        """Render row by index."""
+        mac = _int_to_addr(self._macs[idx], fmt)
+        return self._vlans[idx], mac, self._intfs[self._intf_ids[idx]]
+
+
+# ============================= helpers ==============================
+
+
+def _to_int(mac: Any) -> int:
+    """Convert MAC address str, int or Mac to integer.
+
+    :raises NetportsValueError: If the MAC address is invalid.
+    """
+    if isinstance(mac, Mac):
+        return mac.integer
+    if isinstance(mac, int):
+        if not 0 <= mac <= MAX_MAC:
+            raise NetportsValueError(f"Invalid {mac=}, expected in range 0...{MAX_MAC}")
+        return mac
+    return _addr_to_int(str(mac))
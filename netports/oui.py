@@ -0,0 +1,250 @@
+"""OUI index, vendor lookup by MAC address prefix from local IEEE registry file.
+
+The index is built from IEEE registry files (oui.csv, mam.csv, oui36.csv or oui.txt)
+or loaded from binary index file created by OuiIndex.save(), which is memory-mapped.
+No network access, registry files should be downloaded in advance.
+"""
+
+from __future__ import annotations
+
+import csv
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from netports.exceptions import NetportsValueError
+from netports.types_ import LStr
+
+ENV_OUI_REGISTRY = "NETPORTS_OUI_REGISTRY"
+MAGIC = b"NPOUI\x01\x00\x00"  # binary index, native byte order
+PREFIX_BITS = (36, 28, 24)  # MA-S, MA-M, MA-L, the most specific first
+RE_OUI_TXT = re.compile(r"^\s*([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})-([0-9A-Fa-f]{2})\s+\(hex\)\s+(.*)$")
+
+UPath = Union[str, Path]
+TEntry = Tuple[int, int, str]  # bits, prefix, vendor
+
+
+class OuiIndex:
+    """OUI index, sorted arrays of 24/28/36-bit prefixes with binary search."""
+
+    def __init__(self, entries: Iterable[TEntry] = ()):
+        """Init OuiIndex.
+
+        :param entries: Registry entries (bits, prefix, vendor), bits are 24, 28 or 36.
+        :raises NetportsValueError: If invalid bits.
+
+        :example:
+            index = OuiIndex([(24, 0x00000C, "Cisco Systems, Inc")])
+            index.lookup(0x00000C123456) -> "Cisco Systems, Inc"
+        """
+        self._mmap: Optional[mmap.mmap] = None
+        self._names: LStr = []
+        self._tables: List[Tuple[int, Sequence[int], Sequence[int]]] = []
+
+        names_idx: Dict[str, int] = {}
+        prefixes: Dict[int, Dict[int, int]] = {i: {} for i in PREFIX_BITS}
+        for bits, prefix, vendor in entries:
+            if bits not in prefixes:
+                raise NetportsValueError(f"Invalid {bits=}, expected {PREFIX_BITS}")
+            name_id = names_idx.get(vendor)
+            if name_id is None:
+                name_id = len(self._names)
+                names_idx[vendor] = name_id
+                self._names.append(vendor)
+            prefixes[bits].setdefault(prefix, name_id)
+
+        for bits in PREFIX_BITS:
+            items = sorted(prefixes[bits].items())
+            self._tables.append(
+                (bits, array("Q", [t[0] for t in items]), array("I", [t[1] for t in items]))
+            )
+
+    def __repr__(self) -> str:
+        """Representation of the object."""
+        class_ = self.__class__.__name__
+        prefixes = len(self)
+        vendors = len(self._names)
+        return f"<{class_}: {prefixes=} {vendors=}>"
+
+    def __len__(self) -> int:
+        """Return number of prefixes."""
+        return sum(len(t[1]) for t in self._tables)
+
+    # ========================== constructors ==========================
+
+    @classmethod
+    def from_registry(cls, *paths: UPath) -> OuiIndex:
+        """Build index from IEEE registry files: *.csv (MA-L, MA-M, MA-S) or oui.txt (MA-L).
+
+        :param paths: Paths to IEEE registry files.
+        :return: OuiIndex object.
+        """
+        entries: List[TEntry] = []
+        for path in paths:
+            path_ = Path(path)
+            if path_.suffix.lower() == ".csv":
+                entries.extend(_read_csv(path_))
+            else:
+                entries.extend(_read_txt(path_))
+        return cls(entries)
+
+    @classmethod
+    def load(cls, path: UPath) -> OuiIndex:
+        """Load binary index file created by save(), prefix arrays are memory-mapped.
+
+        :param path: Path to binary index file.
+        :return: OuiIndex object.
+        :raises NetportsValueError: If the file is not an OUI index.
+        """
+        with open(path, "rb") as fh:
+            mmap_ = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mmap_)
+        if bytes(view[:8]) != MAGIC:
+            view.release()
+            mmap_.close()
+            raise NetportsValueError(f"Invalid OUI index {path=}")
+        counts = view[8:40].cast("Q").tolist()
+        obj = cls()
+        obj._mmap = mmap_
+        obj._tables = []
+        offset = 40
+        q_views = []
+        for count in counts[:3]:
+            q_views.append(view[offset : offset + count * 8].cast("Q"))
+            offset += count * 8
+        for bits, count, prefixes in zip(PREFIX_BITS, counts[:3], q_views):
+            ids = view[offset : offset + count * 4].cast("I")
+            offset += count * 4
+            obj._tables.append((bits, prefixes, ids))
+        names = bytes(view[offset : offset + counts[3]]).decode("utf-8")
+        obj._names = names.split("\n")
+        return obj
+
+    # ============================ methods =============================
+
+    def lookup(self, integer: int) -> str:
+        """Vendor name by MAC address, the most specific prefix wins.
+
+        :param integer: MAC address as integer.
+        :return: Vendor name or empty str if the prefix is not in the registry.
+        """
+        for bits, prefixes, ids in self._tables:
+            key = integer >> (48 - bits)
+            idx = bisect_left(prefixes, key)
+            if idx < len(prefixes) and prefixes[idx] == key:
+                return self._names[ids[idx]]
+        return ""
+
+    def lookup_many(self, integers: Iterable[int]) -> LStr:
+        """Vendor names by MAC addresses, cache by 24-bit OUI for bulk tables.
+
+        :param integers: MAC addresses as integers.
+        :return: Vendor names, empty str if the prefix is not in the registry.
+        """
+        lookup = self.lookup
+        specific = {p >> 12 for p in self._tables[0][1]}  # OUIs split to MA-S blocks
+        specific.update(p >> 4 for p in self._tables[1][1])  # OUIs split to MA-M blocks
+        cache: Dict[int, str] = {}
+        results: LStr = []
+        for integer in integers:
+            oui = integer >> 24
+            if oui in specific:
+                results.append(lookup(integer))
+                continue
+            vendor = cache.get(oui)
+            if vendor is None:
+                vendor = lookup(integer)
+                cache[oui] = vendor
+            results.append(vendor)
+        return results
+
+    def save(self, path: UPath) -> None:
+        """Save index to binary file, which can be memory-mapped by load().
+
+        :param path: Path to binary index file.
+        """
+        names = "\n".join(self._names).encode("utf-8")
+        counts = [len(t[1]) for t in self._tables] + [len(names)]
+        with open(path, "wb") as fh:
+            fh.write(MAGIC)
+            fh.write(array("Q", counts).tobytes())
+            for _, prefixes, _ in self._tables:
+                fh.write(array("Q", prefixes).tobytes())
+            for _, _, ids in self._tables:
+                fh.write(array("I", ids).tobytes())
+            fh.write(names)
+
+
+# ============================= registry =============================
+
+_REGISTRY: Dict[str, Any] = {"paths": (), "index": None}
+
+
+def set_registry(*paths: UPath) -> None:
+    """Set local registry files for Mac.vendor, the index is loaded lazily on first lookup.
+
+    :param paths: Binary index file created by OuiIndex.save() or IEEE registry files.
+        Without paths, registry is taken from environment variable NETPORTS_OUI_REGISTRY
+        (paths separated by os.pathsep).
+    """
+    _REGISTRY["paths"] = tuple(paths)
+    _REGISTRY["index"] = None
+
+
+def get_index() -> Optional[OuiIndex]:
+    """Get OUI index, load it on first call.
+
+    :return: OuiIndex object or None if registry is not set.
+    """
+    index = _REGISTRY["index"]
+    if index is not None:
+        return index
+    paths = _REGISTRY["paths"]
+    if not paths:
+        paths = tuple(s for s in os.environ.get(ENV_OUI_REGISTRY, "").split(os.pathsep) if s)
+    if not paths:
+        return None
+    if len(paths) == 1 and _is_index_file(paths[0]):
+        index = OuiIndex.load(paths[0])
+    else:
+        index = OuiIndex.from_registry(*paths)
+    _REGISTRY["index"] = index
+    return index
+
+
+# ============================= helpers ==============================
+
+
+def _is_index_file(path: UPath) -> bool:
+    """Check magic bytes of binary index file."""
+    with open(path, "rb") as fh:
+        return fh.read(len(MAGIC)) == MAGIC
+
+
+def _read_csv(path: Path) -> List[TEntry]:
+    """Read IEEE registry CSV: Registry,Assignment,Organization Name,Organization Address."""
+    entries: List[TEntry] = []
+    with path.open(encoding="utf-8", newline="") as fh:
+        for row in csv.DictReader(fh):
+            assignment = (row.get("Assignment") or "").strip()
+            vendor = (row.get("Organization Name") or "").strip()
+            bits = len(assignment) * 4
+            if bits not in PREFIX_BITS:
+                continue
+            entries.append((bits, int(assignment, 16), vendor))
+    return entries
+
+
+def _read_txt(path: Path) -> List[TEntry]:
+    """Read IEEE registry oui.txt, lines "00-00-0C   (hex)  Cisco Systems, Inc"."""
+    entries: List[TEntry] = []
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if match := RE_OUI_TXT.match(line):
+                prefix = int("".join(match.groups()[:3]), 16)
+                entries.append((24, prefix, match.group(4).strip()))
+    return entries
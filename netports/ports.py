@@ -4,12 +4,14 @@ import re
 from typing import Any
 
 from netports import helpers as h
+from netports.cache import cached
 from netports.range import Range
 from netports.static import RANGE_SPLITTER, SPLITTER
 from netports.types_ import LStr, LInt
 
 
 # noinspection PyIncorrectDocstring
+@cached(freeze=Range.copy, thaw=Range.copy)
 def parse_range(line: str, **kwargs) -> Range:
     """Parse range from line. Removes white spaces considering splitters.
 
@@ -24,12 +26,17 @@ def parse_range(line: str, **kwargs) -> Range:
     :param range_splitter: Separator between min and max numbers in range. Default is "-".
     :type range_splitter: str
 
-    :return: Range object of unique sorted numbers.
+    :return: Range object of unique sorted numbers, results are cached (netports.cache).
     :rtype: Range
 
     :example: Remove duplicates and sort range of numbers.
         parse_range("3-5,1,3-5,1") -> Range("1,3-5")
     """
+    return _parse_range(line, **kwargs)
+
+
+def _parse_range(line: Any, **kwargs) -> Range:
+    """Parse range from line, not cached, used by cached ivlan, itcp, svlan, stcp."""
     splitter = str(kwargs.get("splitter") or SPLITTER)
     range_splitter = str(kwargs.get("range_splitter") or RANGE_SPLITTER)
     regex = rf"(\s+)?{range_splitter}(\s+)?"
@@ -0,0 +1,169 @@
+"""Opt-in instrumentation of public entry points: call counts, cumulative time, input sizes.
+
+Disabled by default and costs nothing, the original functions are not wrapped.
+enable() replaces the entry points with wrappers, disable() restores the originals.
+Set environment variable NETPORTS_PROFILE=1 to enable on `import netports`.
+Time is inclusive, nested calls of entry points are counted in both entries.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+ENV_PROFILE = "NETPORTS_PROFILE"
+
+# (module, qualified name) of instrumented entry points
+ENTRY_POINTS: Tuple[Tuple[str, str], ...] = (
+    ("netports.ports", "parse_range"),
+    ("netports.vlan", "ivlan"),
+    ("netports.tcp", "itcp"),
+    ("netports.ip", "iip"),
+    ("netports.intf", "Intf.__init__"),
+    ("netports.intf_gm", "IntfGM.ranges"),
+    ("netports.ipv4", "IPv4.__init__"),
+    ("netports.mac", "Mac.__init__"),
+)
+
+
+@dataclass
+class Stats:
+    """Statistics of one entry point."""
+
+    calls: int = 0
+    seconds: float = 0.0  # cumulative time
+    size: int = 0  # cumulative input size
+
+
+_LOCK = threading.Lock()
+_REGISTRY: Dict[str, Stats] = {}
+_ORIGINALS: Dict[Tuple[str, str], Callable] = {}
+
+
+# ============================= toggle ===============================
+
+
+def enable() -> None:
+    """Wrap entry points, statistics are recorded to the registry on each call."""
+    with _LOCK:
+        for module_name, qualname in ENTRY_POINTS:
+            key = (module_name, qualname)
+            if key in _ORIGINALS:
+                continue
+            original = _get(module_name, qualname)
+            _ORIGINALS[key] = original
+            _set(module_name, qualname, original, _wrap(original, qualname))
+
+
+def disable() -> None:
+    """Restore original entry points, the registry is kept."""
+    with _LOCK:
+        for (module_name, qualname), original in list(_ORIGINALS.items()):
+            wrapper = _get(module_name, qualname)
+            _set(module_name, qualname, wrapper, original)
+            del _ORIGINALS[(module_name, qualname)]
+
+
+def is_enabled() -> bool:
+    """Check if entry points are instrumented."""
+    return bool(_ORIGINALS)
+
+
+# ============================= registry =============================
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of the registry.
+
+    :return: Statistics {name: {"calls": int, "seconds": float, "size": int}}.
+
+    :example:
+        enable()
+        ivlan("1-3")
+        stats()["ivlan"] -> {"calls": 1, "seconds": 1.2e-05, "size": 3}
+    """
+    with _LOCK:
+        return {name: asdict(data) for name, data in _REGISTRY.items()}
+
+
+def reset() -> None:
+    """Clear the registry."""
+    with _LOCK:
+        _REGISTRY.clear()
+
+
+def report() -> str:
+    """Format the registry as table, sorted by cumulative time."""
+    items = sorted(stats().items(), key=lambda t: t[1]["seconds"], reverse=True)
+    lines: List[str] = [f"{'name':<16} {'calls':>10} {'seconds':>10} {'size':>12}"]
+    for name, data in items:
+        lines.append(f"{name:<16} {data['calls']:>10} {data['seconds']:>10.4f} {data['size']:>12}")
+    return "\n".join(lines)
+
+
+# ============================= helpers ==============================
+
+
+def _wrap(func: Callable, name: str) -> Callable:
+    """Wrap function to record statistics, the first argument (after self) is input,
+    self is input of methods without arguments (IntfGM.ranges)."""
+    is_method = "." in name
+    name = name.replace(".__init__", "")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            inputs = args[1:] if is_method and len(args) > 1 else args
+            size = _size(inputs[0]) if inputs else 0
+            with _LOCK:
+                data = _REGISTRY.get(name)
+                if data is None:
+                    data = _REGISTRY[name] = Stats()
+                data.calls += 1
+                data.seconds += elapsed
+                data.size += size
+
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _size(item: Any) -> int:
+    """Input size, length of str, collection or IntfGM.items, otherwise 1."""
+    if isinstance(getattr(item, "items", None), list):
+        item = item.items
+    try:
+        return len(item)
+    except TypeError:
+        return 1
+
+
+def _get(module_name: str, qualname: str) -> Callable:
+    """Get function or method by qualified name."""
+    obj: Any = import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _set(module_name: str, qualname: str, old: Callable, new: Callable) -> None:
+    """Replace function or method, functions are replaced in all netports modules
+    that imported them (from netports.ports import parse_range)."""
+    if "." in qualname:
+        class_name, method = qualname.split(".")
+        setattr(getattr(import_module(module_name), class_name), method, new)
+        return
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == "netports" or name.startswith("netports.")):
+            continue
+        namespace = vars(module)
+        if namespace.get(qualname) is old:
+            namespace[qualname] = new
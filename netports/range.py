@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from functools import total_ordering
+from itertools import accumulate
+from math import inf
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from netports import helpers as h
 from netports.exceptions import NetportsValueError
 from netports.item import Item, LItem
-from netports.static import SPLITTER, RANGE_SPLITTER
+from netports.static import PLATFORMS, SPLITTER, RANGE_SPLITTER
 from netports.types_ import LStr, LInt, OInt, IInt, T2SInt, StrInt, StrIInt, IStrInt
 
+TIntervals = Tuple[Tuple[int, int], ...]
+
+_NUMPY: Dict[str, Any] = {}  # optional dependency, imported on first use
+NUMPY_MIN_SIZE = 4096  # set operations on smaller ranges are faster with Python sets
+MAX_LINES = 8  # rendered lines cached in Range
+
+# FrozenRange objects shared by identical intervals, while they are in use
+_INTERNED: WeakValueDictionary = WeakValueDictionary()
+
+# set operations on intervals, keep segment by (in first range, in second range)
+_OPERATIONS: Dict[str, Callable[[bool, bool], bool]] = {
+    "union1d": lambda in1, in2: in1 or in2,
+    "intersect1d": lambda in1, in2: in1 and in2,
+    "setdiff1d": lambda in1, in2: in1 and not in2,
+    "setxor1d": lambda in1, in2: in1 != in2,
+}
+
 
 @total_ordering
 class Range:
@@ -34,7 +56,7 @@ class Range:
         self.splitter = kwargs.get("splitter") or SPLITTER
         self.range_splitter = kwargs.get("range_splitter") or RANGE_SPLITTER
         self._strict = self._init_strict(**kwargs)
-        self.items: LItem = []
+        self.items = []
         self._idx = 0
 
         if isinstance(items, str):
@@ -75,7 +97,7 @@ class Range:
         :param other: Another object to compare.
         :return: True if objects are equal, False otherwise.
         """
-        if self.__class__ == other.__class__:
+        if isinstance(other, Range):  # Range and FrozenRange with the same numbers are equal
             if self.__hash__() == other.__hash__():
                 return True
         return False
@@ -86,13 +108,13 @@ class Range:
         :param other: Another object to compare with.
         """
         if self.__class__ == other.__class__:
-            self_len = len(self.items)
-            other_len = len(other.items)
+            self_len = len(self._items)
+            other_len = len(other._items)
             if not (self_len and other_len):
                 return self_len < other_len
-            for idx, self_item in enumerate(self.items):
+            for idx, self_item in enumerate(self._items):
                 try:
-                    other_item = other.items[idx]
+                    other_item = other._items[idx]
                 except IndexError:
                     return False
                 if self_item.min != other_item.min:
@@ -104,30 +126,42 @@ class Range:
 
     def __add__(self, other: Range) -> Range:
         """+ Add."""
+        intervals = self._fast_operation(other, "union1d")
+        if intervals is not None:
+            return self.__class__._from_intervals(intervals)
         self_numbers, other_numbers = self._numbers_sets(other)
         self_numbers.update(other_numbers)
-        return Range(self_numbers)
+        return self.__class__(self_numbers)
 
     def __sub__(self, other: Range) -> Range:
         """- Subtract."""
+        intervals = self._fast_operation(other, "setdiff1d")
+        if intervals is not None:
+            return self.__class__._from_intervals(intervals)
         self_numbers, other_numbers = self._numbers_sets(other)
         self_numbers.difference_update(other_numbers)
-        return Range(self_numbers)
+        return self.__class__(self_numbers)
 
     def __contains__(self, number: int) -> bool:
-        """Return key in self."""
+        """Return key in self, binary search in items."""
         if not isinstance(number, int):
             raise TypeError
-        return number in self.numbers()
+        idx = self._find_item(number)
+        return idx >= 0 and self._items[idx].max >= number
 
     def __delitem__(self, idx: int) -> None:
-        """Delete self.numbers[idx]."""
-        numbers = self.numbers()
-        numbers.__delitem__(idx)
-        self.items = self._create_items(numbers)
+        """Delete self.numbers[idx], only the interval of the number is changed."""
+        if not isinstance(idx, int):
+            numbers = self.numbers()
+            numbers.__delitem__(idx)
+            self.items = self._create_items(numbers)
+            return
+        self.discard(self._number_at(idx))
 
     def __getitem__(self, idx: int):
         """Return number by index."""
+        if isinstance(idx, int):
+            return self._number_at(idx)
         return self.numbers()[idx]
 
     def __iter__(self):
@@ -136,7 +170,8 @@ class Range:
 
     def __len__(self) -> int:
         """Return length of numbers."""
-        return len(self.numbers())
+        offsets = self._prefix_sums()
+        return offsets[-1] if offsets else 0
 
     def __next__(self) -> int:
         """Return next number."""
@@ -151,46 +186,182 @@ class Range:
 
     def add(self, other: Range) -> None:
         """Add other Range object to self."""
+        intervals = self._fast_operation(other, "union1d")
+        if intervals is not None:
+            self.items = [_interval_to_item(i, j) for i, j in intervals]
+            return
         self_numbers, other_numbers = self._numbers_sets(other)
         self_numbers.update(other_numbers)
         self.items = self._create_items(self_numbers)
 
     def append(self, number: StrInt) -> None:
-        """Append number to self."""
+        """Append number to self, only the neighbouring intervals are merged.
+
+        :raises NetportsValueError: If the number is negative.
+        """
         number_ = h.to_int(number)
-        other = Range(number_)
-        self.add(other)
+        if number_ < 0:
+            raise NetportsValueError(f"{number=}, expected >= 0")
+        items = self._items
+        idx = self._find_item(number_)
+        if idx >= 0 and items[idx].max >= number_:
+            return
+        left = idx >= 0 and items[idx].max == number_ - 1
+        right = idx + 1 < len(items) and items[idx + 1].min == number_ + 1
+        if left and right:
+            items[idx] = Item._from_bounds(items[idx].min, items[idx + 1].max)
+            del items[idx + 1]
+        elif left:
+            items[idx] = Item._from_bounds(items[idx].min, number_)
+        elif right:
+            items[idx + 1] = Item._from_bounds(number_, items[idx + 1].max)
+        else:
+            items.insert(idx + 1, Item._from_bounds(number_, number_))
+        self.items = items
+
+    def chunks(self, max_chars: int = 0, max_items: int = 0, **kwargs) -> Iterator[str]:
+        """Split rendered range to chunks, for CLI line length limits.
+
+        Chunks are rendered from the items in one pass, without re-parsing.
+
+        :param max_chars: Maximal length of chunk, 0 - unlimited (default).
+        :param max_items: Maximal number of items (number or min-max range) in chunk,
+            0 - unlimited (default).
+
+        :param splitter: Separator between items, by default self.splitter.
+        :type splitter: str
+
+        :param range_splitter: Separator between min and max numbers,
+            by default self.range_splitter.
+        :type range_splitter: str
+
+        :param platform: Set `splitter` and `range_splitter` to platform specific values,
+            "cisco" or "hpe", the same as in ivlan().
+        :type platform: str
+
+        :return: Iterator of chunks, no chunks for empty range.
+        :raises NetportsValueError: If max_chars or max_items is negative,
+            or if an item is longer than max_chars.
+
+        :example:
+            list(Range("1,3-5,7,9-10").chunks(max_chars=7)) -> ["1,3-5,7", "9-10"]
+            list(Range("1,3-5").chunks(platform="hpe")) -> ["1 3 to 5"]
+        """
+        for name, value in {"max_chars": max_chars, "max_items": max_items}.items():
+            if not isinstance(value, int):
+                raise TypeError(f"{name}={value!r} {int} expected")
+            if value < 0:
+                raise NetportsValueError(f"{name}={value}, expected >= 0")
+        splitter = kwargs.get("splitter") or self.splitter
+        range_splitter = kwargs.get("range_splitter") or self.range_splitter
+        platform = str(kwargs.get("platform") or "")
+        if platform in PLATFORMS:
+            splitter, range_splitter = PLATFORMS[platform]
+        lines = [
+            str(o.min) if o.min == o.max else f"{o.min}{range_splitter}{o.max}" for o in self._items
+        ]
+        if max_chars:
+            if too_long := [s for s in lines if len(s) > max_chars]:
+                raise NetportsValueError(f"{too_long=}, expected length <= {max_chars=}")
+        return _chunks(lines, splitter, max_chars, max_items)
 
     def clear(self) -> None:
         """Remove all numbers from self."""
         self.items = []
 
+    def clip(self, lo: int, hi: int) -> Range:
+        """Return the Range object of numbers in the window lo...hi, computed on interval bounds.
+
+        :param lo: Minimal number of the window.
+        :param hi: Maximal number of the window.
+        :return: Range of self numbers that are in lo...hi.
+        :raises NetportsValueError: If lo < 0 or lo > hi.
+
+        :example:
+            Range("1,3-5,7").clip(4, 10) -> Range("4-5,7")
+        """
+        _check_window(lo, hi)
+        intervals: List[Tuple[int, int]] = []
+        for item in self._items[max(self._find_item(lo), 0) :]:
+            if item.min > hi:
+                break
+            if item.max >= lo:
+                intervals.append((max(item.min, lo), min(item.max, hi)))
+        return self.__class__._from_intervals(tuple(intervals), self.splitter, self.range_splitter)
+
+    def complement(self, lo: int, hi: int) -> Range:
+        """Return the Range object of numbers in the domain lo...hi that are not in self,
+        computed on interval bounds, the domain is not expanded.
+
+        :param lo: Minimal number of the domain.
+        :param hi: Maximal number of the domain.
+        :return: Range of lo...hi numbers that are absent in self.
+        :raises NetportsValueError: If lo < 0 or lo > hi.
+
+        :example:
+            Range("1,3-5,7").complement(1, 10) -> Range("2,6,8-10")
+        """
+        _check_window(lo, hi)
+        intervals: List[Tuple[int, int]] = []
+        start = lo
+        for item in self._items[max(self._find_item(lo), 0) :]:
+            if item.min > hi:
+                break
+            if item.min > start:
+                intervals.append((start, item.min - 1))
+            start = max(start, item.max + 1)
+        if start <= hi:
+            intervals.append((start, hi))
+        return self.__class__._from_intervals(tuple(intervals), self.splitter, self.range_splitter)
+
     def copy(self):
-        """Return a copy of self Range object."""
-        return Range(
-            items=self.line,
-            splitter=self.splitter,
-            range_splitter=self.range_splitter,
-            strict=self._strict,
-        )
+        """Return a copy of self Range object, items are new objects built from bounds."""
+        range_o = Range.__new__(Range)
+        range_o.splitter = self.splitter
+        range_o.range_splitter = self.range_splitter
+        range_o._strict = self._strict
+        range_o.items = [_interval_to_item(o.min, o.max) for o in self.items]
+        range_o._lines = dict(self._lines)
+        range_o._idx = 0
+        return range_o
 
     def difference(self, other: Range) -> Range:
         """Return the Range object of the difference between self and other Range."""
+        intervals = self._fast_operation(other, "setdiff1d")
+        if intervals is not None:
+            return self.__class__._from_intervals(intervals)
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.difference(other_numbers)
-        return Range(numbers)
+        return self.__class__(numbers)
 
     def difference_update(self, other: Range) -> None:
         """Remove other Range from self."""
+        intervals = self._fast_operation(other, "setdiff1d")
+        if intervals is not None:
+            self.items = [_interval_to_item(i, j) for i, j in intervals]
+            return
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.difference(other_numbers)
         self.items = self._create_items(numbers)
 
     def discard(self, number: StrInt) -> None:
-        """Remove the specified number from self Range."""
+        """Remove the specified number from self Range, only its interval is split."""
         number_ = h.to_int(number)
-        numbers = set(self.numbers()).difference({number_})
-        self.items = self._create_items(numbers)
+        items = self._items
+        idx = self._find_item(number_)
+        if idx < 0 or items[idx].max < number_:
+            return
+        min_, max_ = items[idx].min, items[idx].max
+        if min_ == max_:
+            del items[idx]
+        elif number_ == min_:
+            items[idx] = Item._from_bounds(min_ + 1, max_)
+        elif number_ == max_:
+            items[idx] = Item._from_bounds(min_, max_ - 1)
+        else:
+            items[idx] = Item._from_bounds(min_, number_ - 1)
+            items.insert(idx + 1, Item._from_bounds(number_ + 1, max_))
+        self.items = items
 
     def extend(self, numbers: IInt) -> None:
         """Add List[int] numbers to self."""
@@ -210,28 +381,57 @@ class Range:
 
     def intersection(self, other: Range) -> Range:
         """Return Range which is the intersection of self and other Range."""
+        intervals = self._fast_operation(other, "intersect1d")
+        if intervals is not None:
+            return self.__class__._from_intervals(intervals)
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.intersection(other_numbers)
-        return Range(numbers)
+        return self.__class__(numbers)
 
     def intersection_update(self, other: Range) -> None:
         """Remove numbers of other Range in self, that are not present in other."""
+        intervals = self._fast_operation(other, "intersect1d")
+        if intervals is not None:
+            self.items = [_interval_to_item(i, j) for i, j in intervals]
+            return
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.intersection(other_numbers)
         self.items = self._create_items(numbers)
 
+    def irange(self, lo: int, hi: int) -> Iterator[int]:
+        """Iterate numbers in the window lo...hi, the first item is located by binary search.
+
+        :param lo: Minimal number of the window.
+        :param hi: Maximal number of the window.
+        :return: Iterator of sorted numbers.
+        :raises NetportsValueError: If lo < 0 or lo > hi.
+
+        :example:
+            list(Range("1,3-5,7-4094").irange(4, 8)) -> [4, 5, 7, 8]
+        """
+        _check_window(lo, hi)
+        return self._irange(lo, hi)
+
     def isdisjoint(self, other: Range) -> bool:
         """Return whether self numbers and other Range numbers have intersection or not."""
+        intervals = self._fast_operation(other, "intersect1d")
+        if intervals is not None:
+            return not intervals
         self_numbers, other_numbers = self._numbers_sets(other)
         return self_numbers.isdisjoint(other_numbers)
 
     def issubset(self, other: Range) -> bool:
         """Return whether other Range numbers contains self numbers or not."""
+        intervals = self._fast_operation(other, "setdiff1d")
+        if intervals is not None:
+            return not intervals
         self_numbers, other_numbers = self._numbers_sets(other)
         return self_numbers.issubset(other_numbers)
 
     def issuperset(self, other: Range) -> bool:
         """Return whether self Range numbers contains other Range numbers set or not."""
+        if isinstance(other, Range):
+            return other.issubset(self)
         self_numbers, other_numbers = self._numbers_sets(other)
         return self_numbers.issuperset(other_numbers)
 
@@ -240,9 +440,10 @@ class Range:
 
         :raises IndexError: If list is empty or index is out of range.
         """
-        numbers = self.numbers()
-        number = numbers.pop()
-        self.items = self._create_items(numbers)
+        if not self._items:
+            raise IndexError("pop from empty Range")
+        number = self._items[-1].max
+        self.discard(number)
         return number
 
     def remove(self, number: StrInt) -> None:
@@ -251,30 +452,44 @@ class Range:
         :raises ValueError: If the numbers is not present.
         """
         number_ = h.to_int(number)
-        numbers = self.numbers()
-        numbers.remove(number_)
-        self.items = self._create_items(numbers)
+        if number_ not in self:
+            raise ValueError(f"{number=} not in Range")
+        self.discard(number_)
 
     def symmetric_difference(self, other: Range) -> Range:
         """Return Range object with the symmetric differences of self and other Range."""
+        intervals = self._fast_operation(other, "setxor1d")
+        if intervals is not None:
+            return self.__class__._from_intervals(intervals)
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.symmetric_difference(other_numbers)
-        return Range(numbers)
+        return self.__class__(numbers)
 
     def symmetric_difference_update(self, other: Range) -> None:
         """Insert the symmetric differences from self Range and other Range."""
+        intervals = self._fast_operation(other, "setxor1d")
+        if intervals is not None:
+            self.items = [_interval_to_item(i, j) for i, j in intervals]
+            return
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.symmetric_difference(other_numbers)
         self.items = self._create_items(numbers)
 
     def union(self, other: Range) -> Range:
         """Return Range of the union of self and other numbers."""
+        intervals = self._fast_operation(other, "union1d")
+        if intervals is not None:
+            return self.__class__._from_intervals(intervals)
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.union(other_numbers)
-        return Range(numbers)
+        return self.__class__(numbers)
 
     def update(self, other: Range) -> None:
         """Return Range of the union of self Range and other Range."""
+        intervals = self._fast_operation(other, "union1d")
+        if intervals is not None:
+            self.items = [_interval_to_item(i, j) for i, j in intervals]
+            return
         self_numbers, other_numbers = self._numbers_sets(other)
         numbers = self_numbers.union(other_numbers)
         self.items = self._create_items(numbers)
@@ -291,12 +506,44 @@ class Range:
             return strict
         raise TypeError(f"{strict=} {bool} expected")
 
+    @classmethod
+    def _from_intervals(
+        cls,
+        intervals: TIntervals,
+        splitter: str = SPLITTER,
+        range_splitter: str = RANGE_SPLITTER,
+    ) -> Range:
+        """Create Range from sorted not adjacent intervals ((min, max), ...), without parsing."""
+        range_o = cls.__new__(cls)
+        range_o.splitter = splitter
+        range_o.range_splitter = range_splitter
+        range_o._strict = True
+        range_o.items = [_interval_to_item(i, j) for i, j in intervals]
+        range_o._idx = 0
+        return range_o
+
     # =========================== property ===========================
 
+    @property
+    def items(self) -> LItem:
+        """Items of the range, rendered lines are cached until the items are set or changed."""
+        return self._items
+
+    @items.setter
+    def items(self, items: LItem) -> None:
+        self._items = items
+        self._lines: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        self._offsets: List[Any] = []  # [Item changes, prefix sums of item sizes]
+
+    @property
+    def intervals(self) -> TIntervals:
+        """Sorted intervals ((min, max), ...)."""
+        return tuple((o.min, o.max) for o in self.items)
+
     @property
     def line(self) -> str:
-        """Range in str format."""
-        return self._items_to_line(self.items)
+        """Range in str format, cached until the range is changed."""
+        return self.render()
 
     @line.setter
     def line(self, line: str) -> None:
@@ -315,8 +562,215 @@ class Range:
         """Return list of numbers."""
         return [i for o in self.items for i in o.range]
 
+    def render(self, splitter: str = "", range_splitter: str = "") -> str:
+        """Render range with the splitters, without changing the range.
+
+        Rendered lines are cached by (splitter, range_splitter) until the range is changed.
+
+        :param splitter: Separator between items, by default self.splitter.
+        :param range_splitter: Separator between min and max numbers,
+            by default self.range_splitter.
+        :return: Range in str format.
+
+        :example:
+            Range("1,3-5").render(splitter=" ", range_splitter=" to ") -> "1 3 to 5"
+        """
+        key = (splitter or self.splitter, range_splitter or self.range_splitter)
+        changes = Item._changes  # pylint: disable=protected-access
+        changes_line = self._lines.get(key)
+        if changes_line is None or changes_line[0] != changes:
+            splitter_, range_splitter_ = key
+            line = splitter_.join([o.line.replace("-", range_splitter_) for o in self._items])
+            if len(self._lines) >= MAX_LINES:
+                self._lines.clear()
+            self._lines[key] = (changes, line)
+            return line
+        return changes_line[1]
+
+    def to_array(self, dtype: Any = None) -> Any:
+        """Export numbers as NumPy array, without Python-level loop over numbers.
+
+        :param dtype: NumPy dtype, by default the smallest of uint16, uint32, uint64.
+        :return: numpy.ndarray of sorted numbers.
+        :raises ImportError: If NumPy is not installed.
+
+        :example:
+            Range("1,3-5").to_array() -> array([1, 3, 4, 5], dtype=uint16)
+        """
+        np = _require_numpy()
+        intervals = self.intervals
+        if dtype is None:
+            max_ = intervals[-1][1] if intervals else 0
+            dtype = np.uint16 if max_ <= 0xFFFF else np.uint32 if max_ <= 0xFFFFFFFF else np.uint64
+        if not intervals:
+            return np.zeros(0, dtype=dtype)
+        starts = np.array([t[0] for t in intervals], dtype=np.int64)
+        lengths = np.array([t[1] - t[0] + 1 for t in intervals], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths  # index of the first number of each interval
+        array_ = np.arange(int(lengths.sum()), dtype=np.int64)
+        array_ += np.repeat(starts - offsets, lengths)
+        return array_.astype(dtype)
+
+    @classmethod
+    def from_array(cls, array_: Any, **kwargs) -> Range:
+        """Create Range from NumPy array or buffer of numbers, vectorised run detection.
+
+        :param array_: Numbers, can be unsorted and with duplicates.
+        :type array_: numpy.ndarray or array.array
+        :param splitter: Separator character between numbers (default ",").
+        :param range_splitter: Separator between min and max digits in range (default "-").
+        :return: Range object.
+        :raises ImportError: If NumPy is not installed.
+        :raises NetportsValueError: If numbers are negative.
+
+        :example:
+            Range.from_array(numpy.array([5, 1, 3, 4, 1])) -> Range("1,3-5")
+        """
+        np = _require_numpy()
+        array_ = np.unique(np.asarray(array_))
+        if array_.size and array_[0] < 0:
+            raise NetportsValueError(f"number={array_[0]}, expected >= 0")
+        intervals = _array_to_intervals(np, array_)
+        splitter = kwargs.get("splitter") or SPLITTER
+        range_splitter = kwargs.get("range_splitter") or RANGE_SPLITTER
+        return cls._from_intervals(intervals, splitter, range_splitter)
+
+    def contains_many(self, values: Iterable[int], subset: bool = False) -> Any:
+        """Check many numbers at once, binary search over interval bounds.
+
+        With NumPy installed, values are checked by numpy.searchsorted() in one call.
+
+        :param values: Numbers: list, tuple, array.array, buffer or numpy.ndarray.
+        :param subset: False - return mask (default), True - return numbers present in self.
+        :return: Mask [bool, ...] or subset [int, ...] in order of values,
+            numpy.ndarray if values is numpy.ndarray.
+
+        :example:
+            Range("1,3-5").contains_many([1, 2, 5, 6]) -> [True, False, True, False]
+            Range("1,3-5").contains_many([1, 2, 5, 6], subset=True) -> [1, 5]
+        """
+        starts = [o.min for o in self._items]
+        ends = [o.max for o in self._items]
+        np = _numpy()
+        if np is not None:
+            return _contains_many_numpy(np, starts, ends, values, subset)
+
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        mask = []
+        for value in values:
+            idx = bisect_right(starts, value) - 1
+            mask.append(idx >= 0 and value <= ends[idx])
+        if subset:
+            return [i for i, is_in in zip(values, mask) if is_in]
+        return mask
+
+    @classmethod
+    def from_sorted(cls, numbers: Iterable[int], **kwargs) -> Range:
+        """Create Range from sorted numbers, run detection in one pass without intermediate set.
+
+        :param numbers: Sorted numbers >= 0, can be with duplicates, any iterable.
+        :param splitter: Separator character between numbers (default ",").
+        :param range_splitter: Separator between min and max digits in range (default "-").
+        :return: Range object.
+        :raises NetportsValueError: If numbers are not sorted or negative.
+
+        :example:
+            Range.from_sorted(range(1, 1001)) -> Range("1-1000")
+        """
+        intervals = tuple(_runs(numbers))
+        splitter = kwargs.get("splitter") or SPLITTER
+        range_splitter = kwargs.get("range_splitter") or RANGE_SPLITTER
+        return cls._from_intervals(intervals, splitter, range_splitter)
+
+    @classmethod
+    def union_all(cls, ranges: Iterable[Range], min_count: int = 1) -> Range:
+        """Union of many Range objects, sweep line over interval bounds in one pass.
+
+        :param ranges: Range objects.
+        :param min_count: Minimal number of ranges that must contain a number,
+            1 - union (default), len(ranges) - intersection.
+        :return: Range of numbers present in at least `min_count` ranges.
+        :raises TypeError: If any of ranges is not Range.
+        :raises NetportsValueError: If min_count < 1.
+
+        :example:
+            Range.union_all([Range("1-3"), Range("5"), Range("2-4")]) -> Range("1-5")
+            Range.union_all([Range("1-3"), Range("5"), Range("2-4")], min_count=2) -> Range("2-3")
+        """
+        if min_count < 1:
+            raise NetportsValueError(f"{min_count=}, expected >= 1")
+        intervals: List[List[int]] = []
+        for start, end, count in _sweep(ranges):
+            if count < min_count:
+                continue
+            if intervals and intervals[-1][1] + 1 == start:
+                intervals[-1][1] = end
+            else:
+                intervals.append([start, end])
+        return cls._from_intervals(tuple((i, j) for i, j in intervals))
+
+    @classmethod
+    def intersection_all(cls, ranges: Iterable[Range]) -> Range:
+        """Intersection of many Range objects, sweep line over interval bounds in one pass.
+
+        :param ranges: Range objects.
+        :return: Range of numbers present in all ranges, empty Range for no ranges.
+
+        :example:
+            Range.intersection_all([Range("1-5"), Range("3-7"), Range("4-9")]) -> Range("4-5")
+        """
+        ranges_ = list(ranges)
+        if not ranges_:
+            return cls._from_intervals(())
+        return cls.union_all(ranges_, min_count=len(ranges_))
+
     # =========================== helpers ============================
 
+    def _irange(self, lo: int, hi: int) -> Iterator[int]:
+        """Generator of numbers in the window lo...hi."""
+        for item in self._items[max(self._find_item(lo), 0) :]:
+            if item.min > hi:
+                return
+            if item.max >= lo:
+                yield from range(max(item.min, lo), min(item.max, hi) + 1)
+
+    def _find_item(self, number: int) -> int:
+        """Index of the last item with min <= number, -1 if there is no such item."""
+        items = self._items
+        low, high = 0, len(items)
+        while low < high:
+            mid = (low + high) // 2
+            if items[mid].min <= number:
+                low = mid + 1
+            else:
+                high = mid
+        return low - 1
+
+    def _number_at(self, idx: int) -> int:
+        """Number by index, binary search in prefix sums of item sizes.
+
+        :raises IndexError: If index is out of range.
+        """
+        offsets = self._prefix_sums()
+        size = offsets[-1] if offsets else 0
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError("Range index out of range")
+        pos = bisect_right(offsets, idx)
+        first = offsets[pos - 1] if pos else 0
+        return self._items[pos].min + idx - first
+
+    def _prefix_sums(self) -> LInt:
+        """Prefix sums of item sizes, index after the last number of each item, binary search
+        of number by index. Cached until the items are set or changed."""
+        changes = Item._changes  # pylint: disable=protected-access
+        cache = self._offsets
+        if not cache or cache[0] != changes:
+            cache[:] = [changes, list(accumulate(o.max - o.min + 1 for o in self._items))]
+        return cache[1]
+
     def _items_to_line(self, items: LItem) -> str:
         """Convert  items *List[Item]* to line str.
 
@@ -357,6 +811,26 @@ class Range:
                 items_.append(item_)
         return [Item(s) for s in items_]
 
+    def _fast_operation(self, other: Range, operation: str) -> Optional[TIntervals]:
+        """Set operation on interval bounds if any of the ranges is AllRange,
+        or by NumPy on member arrays of large ranges.
+
+        :param other: Other Range object.
+        :param operation: NumPy function: "union1d", "intersect1d", "setdiff1d", "setxor1d".
+        :return: Intervals of the result or None if the operation should be done on sets of numbers.
+        """
+        if not isinstance(other, Range):
+            return None
+        if isinstance(self, AllRange) or isinstance(other, AllRange):
+            return _merge_intervals(self.intervals, other.intervals, operation)
+        np = _numpy()
+        if np is None:
+            return None
+        if _size(self.intervals) + _size(other.intervals) < NUMPY_MIN_SIZE:
+            return None
+        array_ = getattr(np, operation)(self.to_array(), other.to_array())
+        return _array_to_intervals(np, array_)
+
     def _numbers_sets(self, other: Range) -> T2SInt:
         """Convert self and other List[int] numbers to Set[int]
 
@@ -376,8 +850,14 @@ class Range:
         :return: List of *Item* objects.
         :raises ValueError: If self._strict==True and item is invalid.
         """
+        numbers = items if isinstance(items, (set, frozenset)) else set(items)
+        if all(type(i) is int for i in numbers):  # int fast path, bool is not int here
+            numbers_ = sorted(numbers)
+            if not numbers_ or numbers_[0] >= 0:
+                return [_interval_to_item(i, j) for i, j in _runs(numbers_)]
+
         items_: LItem = []
-        items_wo_duplicates = sorted({str(i) for i in items})
+        items_wo_duplicates = sorted({str(i) for i in numbers})
         for item in items_wo_duplicates:
             if item == "":
                 continue
@@ -407,3 +887,447 @@ class Range:
             line_ = splitter.join(items_)
             lines.append(line_)
         return range_splitter.join(lines)
+
+
+class FrozenRange(Range):
+    """FrozenRange, immutable and hashable Range.
+
+    Intervals are stored as tuple, hash is cached, objects with identical intervals
+    and splitters are interned (shared). Mutating methods raise TypeError.
+    """
+
+    _intervals: TIntervals
+    _items: Tuple[Item, ...]  # type: ignore[assignment]
+    _hash: int
+
+    def __new__(cls, items: StrIInt = "", **kwargs):
+        """Return interned object.
+
+        :param items: Range of numbers or Range object.
+        :type items: str or List[int] or Range
+
+        :param splitter: Separator character between numbers (default ",").
+        :type splitter: str
+
+        :param range_splitter: Separator between min and max digits in range (default "-").
+        :type range_splitter: str
+
+        :param strict: True - Raise ValueError, if in line is invalid item (default),
+            False - Make Range without invalid items.
+        :type strict: bool
+
+        :example:
+            FrozenRange("1,3-5") is FrozenRange([1, 3, 4, 5]) -> True
+        """
+        if isinstance(items, FrozenRange):
+            return items
+        range_o = items if isinstance(items, Range) else Range(items, **kwargs)
+        intervals = tuple((o.min, o.max) for o in range_o.items)
+        return cls._from_intervals(intervals, range_o.splitter, range_o.range_splitter)
+
+    def __init__(self, items: StrIInt = "", **kwargs):  # pylint: disable=super-init-not-called
+        """Init FrozenRange.
+
+        :param items: Range of numbers or Range object.
+        :type items: str or List[int] or Range
+        """
+        # the object is initialized in __new__() and may be shared
+
+    @classmethod
+    def _from_intervals(
+        cls,
+        intervals: TIntervals,
+        splitter: str = SPLITTER,
+        range_splitter: str = RANGE_SPLITTER,
+    ) -> FrozenRange:
+        """Return interned object by sorted intervals ((min, max), ...)."""
+        return cls._intern(intervals, splitter, range_splitter)
+
+    @classmethod
+    def _intern(cls, intervals: TIntervals, splitter: str, range_splitter: str) -> FrozenRange:
+        """Return interned object of the class cls, create if not in use."""
+        key = (cls, intervals, splitter, range_splitter)
+        obj = _INTERNED.get(key)
+        if obj is None:
+            obj = object.__new__(cls)
+            items = tuple(_interval_to_item(i, j) for i, j in intervals)
+            attrs = {
+                "splitter": splitter,
+                "range_splitter": range_splitter,
+                "_strict": True,
+                "_intervals": intervals,
+                "_items": items,
+                "_lines": {},
+                "_offsets": [],
+                "_hash": hash(intervals),  # equal to Range.__hash__()
+                "_idx": 0,
+            }
+            for name, value in attrs.items():
+                object.__setattr__(obj, name, value)
+            _INTERNED[key] = obj
+        return obj
+
+    # ======================= special methods ========================
+
+    def _immutable(self, *args, **kwargs) -> None:
+        """Object is immutable."""
+        raise TypeError(f"{self.__class__.__name__} object is immutable")
+
+    add = append = clear = difference_update = discard = extend = _immutable  # type: ignore
+    intersection_update = pop = remove = _immutable  # type: ignore
+    symmetric_difference_update = update = __delitem__ = _immutable  # type: ignore
+
+    def __setattr__(self, name, value) -> None:
+        """Object is immutable."""
+        raise TypeError(f"{self.__class__.__name__} object is immutable")
+
+    def __delattr__(self, name) -> None:
+        """Object is immutable."""
+        raise TypeError(f"{self.__class__.__name__} object is immutable")
+
+    def __hash__(self) -> int:
+        """Cached hash value of the object."""
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        """Check if two objects are equal, Range with the same numbers is equal."""
+        if self is other:
+            return True
+        return super().__eq__(other)
+
+    def __reduce__(self):
+        return self.__class__._intern, (
+            self._intervals,
+            self.splitter,
+            self.range_splitter,
+        )
+
+    def __copy__(self) -> FrozenRange:
+        """Object is immutable, return self."""
+        return self
+
+    def __deepcopy__(self, memo) -> FrozenRange:
+        """Object is immutable, return self."""
+        return self
+
+    def __contains__(self, number: int) -> bool:
+        """Return key in self, binary search in intervals."""
+        if not isinstance(number, int):
+            raise TypeError
+        idx = bisect_right(self._intervals, (number, inf)) - 1
+        return idx >= 0 and self._intervals[idx][1] >= number
+
+    def __iter__(self):
+        """Iterator, independent of other iterators of the shared object."""
+        return iter(self.numbers())
+
+    def __len__(self) -> int:
+        """Return length of numbers."""
+        return sum(j - i + 1 for i, j in self._intervals)
+
+    # =========================== property ===========================
+
+    @property
+    def intervals(self) -> TIntervals:
+        """Sorted intervals ((min, max), ...)."""
+        return self._intervals
+
+    @property  # type: ignore[misc]
+    def items(self) -> LItem:
+        """Items of the range, new Item objects, the interned object is not changed."""
+        return [_interval_to_item(i, j) for i, j in self._intervals]
+
+    # =========================== methods ============================
+
+    def copy(self) -> FrozenRange:
+        """Object is immutable, return self."""
+        return self
+
+    def numbers(self) -> LInt:
+        """Return list of numbers."""
+        return [i for start, end in self._intervals for i in range(start, end + 1)]
+
+
+class AllRange(FrozenRange):
+    """AllRange, lazy immutable Range of all numbers in the domain lo...hi.
+
+    Sentinel of "all" numbers, alternative to brief [-1]. Length, membership, iteration
+    and string are computed from the bounds, the numbers are not materialized.
+    Set operations with other Range objects are done on interval bounds, results of
+    operations, clip() and complement() are FrozenRange, only AllRange() creates AllRange.
+    """
+
+    def __new__(cls, lo: int, hi: int, **kwargs):
+        """Return interned object.
+
+        :param lo: Minimal number of the domain.
+        :param hi: Maximal number of the domain.
+
+        :param splitter: Separator character between numbers (default ",").
+        :type splitter: str
+
+        :param range_splitter: Separator between min and max digits in range (default "-").
+        :type range_splitter: str
+
+        :raises NetportsValueError: If lo < 0 or lo > hi.
+
+        :example:
+            AllRange(1, 4094) == Range("1-4094") -> True
+        """
+        _check_window(lo, hi)
+        splitter = kwargs.get("splitter") or SPLITTER
+        range_splitter = kwargs.get("range_splitter") or RANGE_SPLITTER
+        return cls._intern(((lo, hi),), splitter, range_splitter)
+
+    def __init__(self, lo: int, hi: int, **kwargs):  # pylint: disable=super-init-not-called
+        """Init AllRange.
+
+        :param lo: Minimal number of the domain.
+        :param hi: Maximal number of the domain.
+        """
+        # the object is initialized in __new__() and may be shared
+
+    @classmethod
+    def _from_intervals(
+        cls,
+        intervals: TIntervals,
+        splitter: str = SPLITTER,
+        range_splitter: str = RANGE_SPLITTER,
+    ) -> FrozenRange:
+        """Return interned FrozenRange, results of operations are not AllRange."""
+        return FrozenRange._intern(intervals, splitter, range_splitter)
+
+    # ======================= special methods ========================
+
+    def __repr__(self) -> str:
+        """Representation of the object."""
+        return f"{self.__class__.__name__}({self.lo}, {self.hi})"
+
+    def __contains__(self, number: int) -> bool:
+        """Return key in self, compare with the bounds."""
+        if not isinstance(number, int):
+            raise TypeError
+        return self.lo <= number <= self.hi
+
+    def __iter__(self):
+        """Iterator of numbers, generated on the fly."""
+        return iter(range(self.lo, self.hi + 1))
+
+    def __len__(self) -> int:
+        """Return length of numbers."""
+        return self.hi - self.lo + 1
+
+    # =========================== property ===========================
+
+    @property
+    def lo(self) -> int:
+        """Minimal number of the domain."""
+        return self._intervals[0][0]
+
+    @property
+    def hi(self) -> int:
+        """Maximal number of the domain."""
+        return self._intervals[0][1]
+
+
+# ============================= functions ============================
+
+
+def coverage(ranges: Iterable[Any]) -> List[Tuple[int, int, int]]:
+    """Coverage histogram, how many ranges contain each number.
+
+    Sweep line over interval bounds, O(k log k) for k distinct bounds,
+    numbers are not expanded.
+
+    :param ranges: Range objects or items accepted by Range: "1,3-5", [1, 3, 4, 5].
+    :return: Sorted segments (start, end, count), count - number of ranges containing
+        the numbers start...end. Numbers not present in any range are skipped,
+        adjacent segments have different counts.
+
+    :example:
+        coverage(["1-10", "5-20"]) -> [(1, 4, 1), (5, 10, 2), (11, 20, 1)]
+    """
+    ranges_ = [o if isinstance(o, Range) else Range(o) for o in ranges]
+    segments: List[List[int]] = []
+    for start, end, count in _sweep(ranges_):
+        if segments and segments[-1][2] == count and segments[-1][1] + 1 == start:
+            segments[-1][1] = end
+        else:
+            segments.append([start, end, count])
+    return [(i, j, k) for i, j, k in segments]
+
+
+# ============================= helpers ==============================
+
+
+def _numpy() -> Any:
+    """Import NumPy on first call, return None if NumPy is not installed."""
+    if "numpy" not in _NUMPY:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            _NUMPY["numpy"] = numpy
+        except ImportError:
+            _NUMPY["numpy"] = None
+    return _NUMPY["numpy"]
+
+
+def _require_numpy() -> Any:
+    """Import NumPy, optional dependency netports[numpy].
+
+    :raises ImportError: If NumPy is not installed.
+    """
+    np = _numpy()
+    if np is None:
+        raise ImportError("NumPy is required, install netports[numpy]")
+    return np
+
+
+def _array_to_intervals(np: Any, array_: Any) -> TIntervals:
+    """Convert sorted unique NumPy array to intervals, run bounds where diff != 1."""
+    if not array_.size:
+        return ()
+    array_ = array_.astype(np.int64)
+    breaks = np.flatnonzero(np.diff(array_) != 1)
+    starts = np.concatenate((array_[:1], array_[breaks + 1]))
+    ends = np.concatenate((array_[breaks], array_[-1:]))
+    return tuple(zip(starts.tolist(), ends.tolist()))
+
+
+def _size(intervals: TIntervals) -> int:
+    """Number of numbers in intervals."""
+    return sum(j - i + 1 for i, j in intervals)
+
+
+def _contains_many_numpy(np: Any, starts: LInt, ends: LInt, values: Any, subset: bool) -> Any:
+    """Range.contains_many() by numpy.searchsorted()."""
+    is_ndarray = isinstance(values, np.ndarray)
+    if not is_ndarray and not isinstance(values, (list, tuple)):
+        try:
+            memoryview(values)
+        except TypeError:
+            values = list(values)
+    array_ = np.asarray(values, dtype=np.int64)
+    starts_ = np.asarray(starts, dtype=np.int64)
+    ends_ = np.asarray(ends, dtype=np.int64)
+    if len(starts_):
+        idx = np.searchsorted(starts_, array_, side="right") - 1
+        mask = (idx >= 0) & (array_ <= ends_[np.maximum(idx, 0)])
+    else:
+        mask = np.zeros(len(array_), dtype=bool)
+    result = array_[mask] if subset else mask
+    if is_ndarray:
+        return result
+    return result.tolist()
+
+
+def _merge_intervals(intervals1: TIntervals, intervals2: TIntervals, operation: str) -> TIntervals:
+    """Set operation on sorted intervals, walk over elementary segments between bounds.
+
+    :param operation: NumPy function name: "union1d", "intersect1d", "setdiff1d", "setxor1d".
+    :return: Sorted not adjacent intervals of the result.
+    """
+    keep = _OPERATIONS[operation]
+    bounds = sorted({b for i, j in intervals1 + intervals2 for b in (i, j + 1)})
+    results: List[List[int]] = []
+    idx1 = idx2 = 0
+    for start, next_ in zip(bounds, bounds[1:]):
+        while idx1 < len(intervals1) and intervals1[idx1][1] < start:
+            idx1 += 1
+        while idx2 < len(intervals2) and intervals2[idx2][1] < start:
+            idx2 += 1
+        in1 = idx1 < len(intervals1) and intervals1[idx1][0] <= start
+        in2 = idx2 < len(intervals2) and intervals2[idx2][0] <= start
+        if not keep(in1, in2):
+            continue
+        if results and results[-1][1] + 1 == start:
+            results[-1][1] = next_ - 1
+        else:
+            results.append([start, next_ - 1])
+    return tuple((i, j) for i, j in results)
+
+
+def _chunks(lines: LStr, splitter: str, max_chars: int, max_items: int) -> Iterator[str]:
+    """Join rendered items to chunks limited by max_chars and max_items (0 - unlimited)."""
+    chunk: LStr = []
+    length = 0
+    for line in lines:
+        length_ = length + len(splitter) + len(line) if chunk else len(line)
+        if chunk and (
+            (max_items and len(chunk) >= max_items) or (max_chars and length_ > max_chars)
+        ):
+            yield splitter.join(chunk)
+            chunk = []
+            length_ = len(line)
+        chunk.append(line)
+        length = length_
+    if chunk:
+        yield splitter.join(chunk)
+
+
+def _check_window(lo: int, hi: int) -> None:
+    """Check bounds of the window lo...hi.
+
+    :raises TypeError: If lo or hi is not int.
+    :raises NetportsValueError: If lo < 0 or lo > hi.
+    """
+    for number in (lo, hi):
+        if not isinstance(number, int) or isinstance(number, bool):
+            raise TypeError(f"{number=} {int} expected")
+    if lo < 0 or lo > hi:
+        raise NetportsValueError(f"{lo=} {hi=}, expected 0 <= lo <= hi")
+
+
+def _interval_to_item(start: int, end: int) -> Item:
+    """Convert interval (min, max) to Item."""
+    return Item._from_bounds(start, end)  # pylint: disable=protected-access
+
+
+def _runs(numbers: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """Intervals (min, max) of consecutive numbers, in one pass without intermediate set.
+
+    :param numbers: Sorted numbers >= 0, can be with duplicates.
+    :return: Intervals.
+    :raises NetportsValueError: If numbers are not sorted or negative.
+    """
+    iterator = iter(numbers)
+    for first in iterator:
+        break
+    else:
+        return
+    if first < 0:
+        raise NetportsValueError(f"number={first}, expected >= 0")
+    start = end = first
+    for number in iterator:
+        if number == end + 1:
+            end = number
+        elif number > end:
+            yield start, end
+            start = end = number
+        elif number < end:
+            raise NetportsValueError(f"{number=} after {end}, expected sorted numbers")
+    yield start, end
+
+
+def _sweep(ranges: Iterable[Range]) -> Iterator[Tuple[int, int, int]]:
+    """Sweep line over interval bounds of the ranges, O(k log k) for k distinct bounds.
+
+    :param ranges: Range objects.
+    :return: Segments (start, end, count), count - number of ranges containing the segment,
+        segments with count=0 are skipped.
+    :raises TypeError: If any of ranges is not Range.
+    """
+    deltas: Dict[int, int] = {}  # bound: change of count
+    for range_o in ranges:
+        if not isinstance(range_o, Range):
+            raise TypeError(f"{range_o=} {Range} expected")
+        for start, end in range_o.intervals:
+            deltas[start] = deltas.get(start, 0) + 1
+            deltas[end + 1] = deltas.get(end + 1, 0) - 1
+    count = 0
+    start = 0
+    for number in sorted(deltas):
+        if count:
+            yield start, number - 1, count
+        count += deltas[number]
+        start = number
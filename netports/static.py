@@ -4,3 +4,8 @@ RANGE_SPLITTER = "-"
 SPLITTER = ","
 BRIEF_ALL_I = -1
 BRIEF_ALL_S = "-1"
+# platform: (splitter, range_splitter)
+PLATFORMS = {
+    "cisco": (SPLITTER, RANGE_SPLITTER),  # Cisco IOS
+    "hpe": (" ", " to "),  # Hewlett Packard Enterprise
+}
@@ -1,23 +1,72 @@
 """Software Version."""
 
+import re
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Any, Iterable, List, Optional, Tuple
+from weakref import WeakValueDictionary
+
 from packaging.version import Version
-from vhelpers import vre, vstr
+from vhelpers import vstr
 
+from netports.exceptions import NetportsValueError
 from netports.types_ import TStrInt
 
+# up to 4 numbers in a single pass: major, minor, micro, nano
+RE_VERSION = re.compile(r"(\d+)(?:\D+(\d+))?(?:\D+(\d+))?(?:\D+(\d+))?")
+# objects shared by identical version strings, while they are in use
+_INTERNED: WeakValueDictionary = WeakValueDictionary()
+
+TSortKey = Tuple[Tuple[int, ...], int, str]
+
+SPEC_EXCLUDE = ("excluding", "except", "!=")
+SPEC_THROUGH = ("through", "thru", "to")
+SPEC_OPERATORS = (">=", "<=", "==", ">", "<", "=")
+
+# Interval of positions (start, end), both exclusive, end None - unbounded.
+# A version is at position ((release, nano), 1, text, 1). Bounds of rays and ranges
+# ((release, nano), 0 or 2, "", 0) are before or after all texts of the release and nano,
+# bounds of exact match ((release, nano), 1, text, 0 or 2) are next to the text only.
+TPosition = Tuple[Tuple[Any, ...], int, str, int]
+TInterval = Tuple[TPosition, Optional[TPosition]]
+LInterval = List[TInterval]
+MIN_POSITION: TPosition = ((), 0, "", 0)
+
 
 class SwVersion(Version):
-    """Software Version."""
+    """Software Version.
+
+    Objects are interned by lower-case text, identical version strings share one object.
+    """
 
-    def __init__(self, text: str):
+    def __new__(cls, text: str = ""):
+        """Return interned object, parse the text only for the first one."""
+        text_ = cls._init_name(name=text)
+        key = (cls, text_)
+        obj = _INTERNED.get(key)
+        if obj is None:
+            obj = super().__new__(cls)
+            obj._init_version(text_)
+            _INTERNED[key] = obj
+        return obj
+
+    def __init__(self, text: str = ""):
         """Init SwVersion.
         :param text: Cisco version text: "12.2(55)SE12".
         :type text: str
         """
-        self._text = self._init_name(name=text)
-        version, nano = self._parse_version(self._text)
+        # the object is initialized in __new__() and may be shared
+
+    def _init_version(self, text: str) -> None:
+        """Parse lower-case text and init Version, nano and comparison key."""
+        self._text = text
+        version, nano = self._parse_version(text)
         super().__init__(version)
         self._nano: int = nano
+        release = list(self.release)
+        while release and not release[-1]:
+            release.pop()  # 1.2 == 1.2.0 in Version
+        self._sort_key: TSortKey = (tuple(release), nano, text)
 
     # ========================== redefined ===========================
 
@@ -40,6 +89,29 @@ class SwVersion(Version):
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, SwVersion):
+            return NotImplemented
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, SwVersion):
+            return NotImplemented
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, SwVersion):
+            return NotImplemented
+        return self._sort_key > other._sort_key
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, SwVersion):
+            return NotImplemented
+        return self._sort_key >= other._sort_key
+
+    def __reduce__(self):
+        return self.__class__, (self._text,)
+
     # =========================== property ===========================
 
     @property
@@ -57,6 +129,15 @@ class SwVersion(Version):
         """
         return self._nano
 
+    @property
+    def sort_key(self) -> TSortKey:
+        """Precomputed comparison key: release without trailing zeros, nano and text.
+
+        :example:
+            sorted(versions, key=attrgetter("sort_key"))
+        """
+        return self._sort_key
+
     # =========================== helpers ============================
 
     @staticmethod
@@ -72,20 +153,178 @@ class SwVersion(Version):
     @staticmethod
     def _parse_version(text: str) -> TStrInt:
         """Init SwVersion. Split `text` to *Version* and `nano` (4th digit)."""
-        nano = 0
-        items = list(vre.find4(r"(\d+)\D+(\d+)\D+(\d+)\D+(\d+)", text))
-        if items[3]:
-            nano = int(items[3])
-        else:
-            items = list(vre.find3(r"(\d+)\D+(\d+)\D+(\d+)", text))
-        if not items[0]:
-            items = list(vre.find2(r"(\d+)\D+(\d+)", text))
-            if not items[0]:
-                if version := vre.find1(r"(\d+)", text):
-                    items = [version]
+        match = RE_VERSION.search(text)
+        if not match:
+            return "0", 0
+        items = [s for s in match.groups() if s]
+        nano = int(items[3]) if len(items) == 4 else 0
+        return ".".join(items), nano
+
+
+class SwVersionSpec:
+    """Software version constraints, compiled to sorted intervals of comparison keys.
+
+    Constraints are comma-separated clauses in Cisco-style version syntax:
+        "15.2(4)E through 15.2(7)E3"  - closed interval, also "to", "thru"
+        ">= 15.2(4)E", "< 16.0"       - open ray, operators: >=, >, <=, <, ==
+        "15.2(4)E10"                  - single version
+        "excluding 15.2(6)E2"         - exclude version or interval, also "except", "!="
+
+    Open rays are AND'ed together, ">= 1, < 3" is the interval from 1 to 3.
+    The result is OR'ed with the other included clauses, then excluded clauses are removed.
+    Rays and intervals compare release and nano ("1" >= "1.0"), single versions, "==" and
+    "excluding 15.2(6)E2" match the version text exactly. Spec of exclusions only,
+    "!= 2", matches all versions except the excluded.
+    """
+
+    def __init__(self, spec: str):
+        """Init SwVersionSpec.
+
+        :param spec: Version constraints.
+        :type spec: str
+
+        :raises NetportsValueError: If the spec syntax is invalid.
+
+        :example:
+            spec = SwVersionSpec("15.2(4)E through 15.2(7)E3, excluding 15.2(6)E2")
+            "15.2(5)E1" in spec -> True
+            "15.2(6)E2" in spec -> False
+        """
+        self.spec = str(spec)
+        included: LInterval = []
+        excluded: LInterval = []
+        rays: LInterval = [(MIN_POSITION, None)]
+        for clause in self.spec.split(","):
+            words = clause.split()
+            if not words:
+                continue
+            if words[0].lower() in SPEC_EXCLUDE:
+                excluded.append(_clause_to_interval(words[1:], clause))
+            elif words[0].startswith("!="):
+                excluded.append(_clause_to_interval([words[0][2:], *words[1:]], clause))
+            else:
+                interval = _clause_to_interval(words, clause)
+                if interval[0] == MIN_POSITION or interval[1] is None:
+                    rays = _intersect(rays, [interval])
                 else:
-                    items = []
-        version = ".".join(items)
-        if not version:
-            version = "0"
-        return version, nano
+                    included.append(interval)
+        if rays != [(MIN_POSITION, None)] or (excluded and not included):
+            included.extend(rays)  # only exclusions - all versions except the excluded
+        self._intervals = _subtract(_merge(included), _merge(excluded))
+        self._starts = [t[0] for t in self._intervals]
+
+    def __repr__(self) -> str:
+        """Representation of the object."""
+        class_ = self.__class__.__name__
+        return f"{class_}({self.spec!r})"
+
+    def __contains__(self, version: Any) -> bool:
+        """Check if the version matches the constraints, binary search in intervals."""
+        position = _position(_to_version(version))
+        idx = bisect_left(self._starts, position) - 1
+        if idx < 0:
+            return False
+        end = self._intervals[idx][1]
+        return end is None or position < end
+
+    def filter(self, versions: Iterable[Any]) -> List[SwVersion]:
+        """Return versions that match the constraints.
+
+        :param versions: SwVersion objects or version texts.
+        :return: Matched SwVersion objects in the same order.
+        """
+        contains = self.__contains__
+        items = [_to_version(o) for o in versions]
+        return [o for o in items if contains(o)]
+
+
+# ============================= helpers ==============================
+
+
+def _to_version(version: Any) -> SwVersion:
+    """Convert text to SwVersion."""
+    if isinstance(version, SwVersion):
+        return version
+    return SwVersion(version)
+
+
+def _release(version: SwVersion) -> Tuple[Any, ...]:
+    """Release without trailing zeros and nano, comparison key without text."""
+    return version.sort_key[:2]
+
+
+def _position(version: SwVersion) -> TPosition:
+    """Position of the version, between bounds of the release and next to the text."""
+    return _release(version), 1, str(version), 1
+
+
+def _clause_to_interval(words: List[str], clause: str) -> TInterval:
+    """Convert clause words to interval of positions.
+
+    :raises NetportsValueError: If the clause syntax is invalid.
+    """
+    if len(words) == 3 and words[1].lower() in SPEC_THROUGH:
+        start = _release(SwVersion(words[0]))
+        end = _release(SwVersion(words[2]))
+        return (start, 0, "", 0), (end, 2, "", 0)
+
+    text = "".join(words)
+    operator = next((s for s in SPEC_OPERATORS if text.startswith(s)), "")
+    text = text[len(operator) :]
+    if not text or len(words) > 2 or (len(words) == 2 and not operator):
+        raise NetportsValueError(f"Invalid version constraint {clause=}")
+    version = SwVersion(text)
+    release = _release(version)
+    if operator == ">=":
+        return (release, 0, "", 0), None
+    if operator == ">":
+        return (release, 2, "", 0), None
+    if operator == "<=":
+        return MIN_POSITION, (release, 2, "", 0)
+    if operator == "<":
+        return MIN_POSITION, (release, 0, "", 0)
+    return (release, 1, str(version), 0), (release, 1, str(version), 2)
+
+
+def _merge(intervals: LInterval) -> LInterval:
+    """Sort and merge overlapping intervals."""
+    merged: LInterval = []
+    for start, end in sorted(intervals, key=itemgetter(0)):
+        if merged:
+            last_start, last_end = merged[-1]
+            if last_end is None or start <= last_end:
+                if last_end is not None and (end is None or end > last_end):
+                    merged[-1] = (last_start, end)
+                continue
+        merged.append((start, end))
+    return merged
+
+
+def _subtract(included: LInterval, excluded: LInterval) -> LInterval:
+    """Subtract sorted merged excluded intervals from sorted merged included intervals."""
+    gaps: LInterval = []
+    start = MIN_POSITION
+    for ex_start, ex_end in excluded:
+        gaps.append((start, ex_start))
+        if ex_end is None:
+            return _intersect(included, gaps)
+        start = ex_end
+    gaps.append((start, None))
+    return _intersect(included, gaps)
+
+
+def _intersect(intervals1: LInterval, intervals2: LInterval) -> LInterval:
+    """Intersection of two sorted merged lists of intervals, two-pointer walk."""
+    results: LInterval = []
+    idx1, idx2 = 0, 0
+    while idx1 < len(intervals1) and idx2 < len(intervals2):
+        start1, end1 = intervals1[idx1]
+        start2, end2 = intervals2[idx2]
+        start = max(start1, start2)
+        if end1 is None or (end2 is not None and end2 < end1):
+            end, idx2 = end2, idx2 + 1
+        else:
+            end, idx1 = end1, idx1 + 1
+        if end is None or start < end:
+            results.append((start, end))
+    return results
@@ -1,22 +1,33 @@
 """TCP/UDP ports."""
 
-from typing import Any
+from typing import Any, Union
 
 from netports import helpers as h
+from netports.cache import cached_list, cached_str
 from netports.exceptions import NetportsValueError
-from netports.ports import inumbers, parse_range
-from netports.range import Range
+from netports.ports import _parse_range, parse_range
+from netports.range import AllRange, Range
 from netports.static import BRIEF_ALL_I
 from netports.types_ import LInt
 
 MIN_PORT = 1
 MAX_PORT = 65535
-ALL_PORTS_L = list(range(MIN_PORT, MAX_PORT + 1))
 ALL_PORTS_S = f"{MIN_PORT}-{MAX_PORT}"
+ALL_PORTS_LEN = MAX_PORT - MIN_PORT + 1
+ALL_PORTS_R = AllRange(MIN_PORT, MAX_PORT)  # lazy, returned for lazy=True
+
+
+def __getattr__(name: str) -> Any:
+    """Build ALL_PORTS_L list of 65535 ports on first access."""
+    if name == "ALL_PORTS_L":
+        globals()[name] = list(range(MIN_PORT, MAX_PORT + 1))
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # noinspection PyIncorrectDocstring
-def itcp(items: Any = "", **kwargs) -> LInt:
+@cached_list
+def itcp(items: Any = "", **kwargs) -> Union[LInt, AllRange]:
     """Integer TCP/UDP Ports. Sorting TCP/UDP ports and removing duplicates.
 
     :param items: Range of TCP/UDP ports, can be unsorted and with duplicates.
@@ -29,8 +40,12 @@ def itcp(items: Any = "", **kwargs) -> LInt:
     :param all: True - Returns all TCP/UDP ports: [1, 2, ..., 65535], or [-1] for verbose=False.
     :type all: bool
 
-    :return: List[int] of unique sorted TCP/UDP ports.
-    :rtype: List[int]
+    :param lazy: True - all TCP/UDP ports as lazy ALL_PORTS_R = AllRange(1, 65535),
+        instead of [-1] or [1, 2, ..., 65535], False - list (default).
+    :type lazy: bool
+
+    :return: List[int] of unique sorted TCP/UDP ports, AllRange of all ports for lazy=True.
+    :rtype: List[int] or AllRange
 
     :raises NetportsValueError: If TCP/UDP ports are outside valid range 1...65535.
 
@@ -38,23 +53,26 @@ def itcp(items: Any = "", **kwargs) -> LInt:
         itcp("1,3-5") -> [1, 3, 4, 5]
     """
     if h.is_all(**kwargs):
+        if h.is_lazy(**kwargs):
+            return ALL_PORTS_R
         if h.is_brief(**kwargs):
             return [BRIEF_ALL_I]
-        return ALL_PORTS_L.copy()
-    if h.is_brief(**kwargs):
+        return list(range(MIN_PORT, MAX_PORT + 1))
+    if h.is_brief(**kwargs) or h.is_lazy(**kwargs):
         if h.is_brief_in_items(items):
-            return [BRIEF_ALL_I]
+            return ALL_PORTS_R if h.is_lazy(**kwargs) else [BRIEF_ALL_I]
 
-    ports: LInt = inumbers(items)
+    ports: LInt = _parse_range(items).numbers()
     check_ports(ports=ports, strict=True)
 
-    if h.is_brief(**kwargs):
-        if ports == ALL_PORTS_L:
-            return [BRIEF_ALL_I]
+    if h.is_brief(**kwargs) or h.is_lazy(**kwargs):
+        if len(ports) == ALL_PORTS_LEN:  # unique sorted ports in valid range
+            return ALL_PORTS_R if h.is_lazy(**kwargs) else [BRIEF_ALL_I]
     return ports
 
 
 # noinspection PyIncorrectDocstring
+@cached_str
 def stcp(items: Any = "", **kwargs) -> str:
     """String TCP/UDP ports. Sorting TCP/UDP ports and removing duplicates.
 
@@ -81,15 +99,47 @@ def stcp(items: Any = "", **kwargs) -> str:
     if h.is_brief(**kwargs):
         if h.is_brief_in_items(items):
             items_ = ",".join(h.lstr(h.remove_brief_items(items)))
-            range_o: Range = parse_range(items_)
+            range_o: Range = _parse_range(items_)
             check_ports(ports=range_o.numbers(), strict=True)
             return ALL_PORTS_S
 
-    range_o = parse_range(items)
+    range_o = _parse_range(items)
     check_ports(ports=range_o.numbers(), strict=True)
     return str(range_o)
 
 
+# noinspection PyIncorrectDocstring
+def complement_ports(items: Any = "", **kwargs) -> Range:
+    """TCP/UDP ports that are absent in items, in the valid range 1...65535 (not permitted ports).
+
+    Computed on interval bounds, ports are not expanded to a list.
+
+    :param items: Range of TCP/UDP ports, can be unsorted and with duplicates, "-1" - all ports.
+    :type items: str or List[int] or List[str]
+
+    :param all: True - items are all TCP/UDP ports, returns empty Range.
+    :type all: bool
+
+    :return: Range of absent TCP/UDP ports.
+    :rtype: Range
+
+    :raises NetportsValueError: If TCP/UDP ports are outside valid range 1...65535.
+
+    :example:
+        complement_ports("1,3-5") -> Range("2,6-65535")
+    """
+    if h.is_all(**kwargs):
+        return Range()
+    if h.is_brief_in_items(items):
+        items_ = ",".join(h.lstr(h.remove_brief_items(items)))
+        _check_bounds(parse_range(items_))
+        return Range()
+
+    range_o: Range = parse_range(items)
+    _check_bounds(range_o)
+    return range_o.complement(MIN_PORT, MAX_PORT)
+
+
 def check_port(port: int, strict: bool = False) -> bool:
     """Check TCP/UDP port in the range 1 to 65535.
 
@@ -130,3 +180,12 @@ def check_ports(ports: LInt, strict: bool = False) -> bool:
         if not check_port(port=port, strict=strict):
             return False
     return True
+
+
+# ============================= helpers ==============================
+
+
+def _check_bounds(range_o: Range) -> None:
+    """Check the min and max ports of the range, without expanding numbers."""
+    if range_o.items:
+        check_ports(ports=[range_o.items[0].min, range_o.items[-1].max], strict=True)
@@ -1,24 +1,51 @@
 """VLAN IDs."""
 
-from typing import Any
+from typing import Any, Dict, Union
 
 from netports import Range
 from netports import helpers as h
+from netports.cache import cached_list, cached_str
 from netports.exceptions import NetportsValueError
-from netports.ports import inumbers, parse_range
-from netports.static import BRIEF_ALL_I, RANGE_SPLITTER, SPLITTER
-from netports.types_ import LInt
+from netports.ports import _parse_range, parse_range
+from netports.range import AllRange
+from netports.static import BRIEF_ALL_I, PLATFORMS
+from netports.types_ import LInt, LStr
 
 MIN_VLAN = 1
 MAX_VLAN = 4094
-ALL_VLANS_L = list(range(MIN_VLAN, MAX_VLAN + 1))
 ALL_VLANS_S = f"{MIN_VLAN}-{MAX_VLAN}"
-SPLITTER_HPE = " "
-RANGE_SPLITTER_HPE = " to "
+ALL_VLANS_LEN = MAX_VLAN - MIN_VLAN + 1
+SPLITTER_HPE, RANGE_SPLITTER_HPE = PLATFORMS["hpe"]
+ALL_VLANS_R = AllRange(MIN_VLAN, MAX_VLAN)  # lazy, returned for lazy=True
+MAX_LINE_CHARS = 80
+# platform: commands of trunk allowed VLANs, "replace": "" - replace by "none" and "add"
+TRUNK_COMMANDS: Dict[str, Dict[str, str]] = {
+    "cisco": {
+        "add": "switchport trunk allowed vlan add ",
+        "remove": "switchport trunk allowed vlan remove ",
+        "replace": "switchport trunk allowed vlan ",
+        "none": "switchport trunk allowed vlan none",
+    },
+    "hpe": {
+        "add": "port trunk permit vlan ",
+        "remove": "undo port trunk permit vlan ",
+        "replace": "",
+        "none": "undo port trunk permit vlan all",
+    },
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Build ALL_VLANS_L list of 4094 VLAN IDs on first access."""
+    if name == "ALL_VLANS_L":
+        globals()[name] = list(range(MIN_VLAN, MAX_VLAN + 1))
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # noinspection PyIncorrectDocstring
-def ivlan(items: Any = "", **kwargs) -> LInt:
+@cached_list
+def ivlan(items: Any = "", **kwargs) -> Union[LInt, AllRange]:
     """Sorting integer VLAN IDs and removing duplicates.
 
     :param items: Range of VLANs, can be unsorted and with duplicates.
@@ -31,6 +58,10 @@ def ivlan(items: Any = "", **kwargs) -> LInt:
     :param all: True - Returns all VLAN IDs: [1, 2, ..., 4094], or [-1] for verbose=False.
     :type all: bool
 
+    :param lazy: True - all VLAN IDs as lazy ALL_VLANS_R = AllRange(1, 4094),
+        instead of [-1] or [1, 2, ..., 4094], False - list (default).
+    :type lazy: bool
+
     :param splitter: Separator character between items (default ",").
     :type splitter: str
 
@@ -44,8 +75,8 @@ def ivlan(items: Any = "", **kwargs) -> LInt:
         "hpe"       " "         " to "          Hewlett Packard Enterprise
     :type platform: str
 
-    :return: List[int] of unique sorted VLANs.
-    :rtype: List[int]
+    :return: List[int] of unique sorted VLANs, AllRange of all VLANs for lazy=True.
+    :rtype: List[int] or AllRange
 
     :raises NetportsValueError: if VLANs are outside valid range 1...4094.
 
@@ -53,27 +84,30 @@ def ivlan(items: Any = "", **kwargs) -> LInt:
         ivlan("1,3-5") -> [1, 3, 4, 5]
     """
     if h.is_all(**kwargs):
+        if h.is_lazy(**kwargs):
+            return ALL_VLANS_R
         if h.is_brief(**kwargs):
             return [BRIEF_ALL_I]
-        return ALL_VLANS_L.copy()
-    if h.is_brief(**kwargs):
+        return list(range(MIN_VLAN, MAX_VLAN + 1))
+    if h.is_brief(**kwargs) or h.is_lazy(**kwargs):
         if h.is_brief_in_items(items):
             items_ = h.remove_brief_items(items)
-            ports = inumbers(items_)
+            ports = _parse_range(items_).numbers()
             check_vlans(ports)
-            return [BRIEF_ALL_I]
+            return ALL_VLANS_R if h.is_lazy(**kwargs) else [BRIEF_ALL_I]
 
     kwargs = _update_splitters(**kwargs)
-    vlans: LInt = inumbers(items, **kwargs)
+    vlans: LInt = _parse_range(items, **kwargs).numbers()
     check_vlans(vlans)
 
-    if h.is_brief(**kwargs):
-        if vlans == ALL_VLANS_L:
-            return [BRIEF_ALL_I]
+    if h.is_brief(**kwargs) or h.is_lazy(**kwargs):
+        if len(vlans) == ALL_VLANS_LEN:  # unique sorted VLANs in valid range
+            return ALL_VLANS_R if h.is_lazy(**kwargs) else [BRIEF_ALL_I]
     return vlans
 
 
 # noinspection PyIncorrectDocstring
+@cached_str
 def svlan(items: Any = "", **kwargs) -> str:
     """Sorting string VLANs and removing duplicates.
 
@@ -114,18 +148,148 @@ def svlan(items: Any = "", **kwargs) -> str:
     if h.is_brief(**kwargs):
         if h.is_brief_in_items(items):
             items_ = ",".join(h.lstr(h.remove_brief_items(items)))
-            range_o: Range = parse_range(items_)
+            range_o: Range = _parse_range(items_)
             check_vlans(range_o.numbers())
             return _replace_range_splitter(ALL_VLANS_S, **kwargs)
 
-    range_o = parse_range(items, **kwargs)
+    range_o = _parse_range(items, **kwargs)
     check_vlans(range_o.numbers())
     return str(range_o)
 
 
+# noinspection PyIncorrectDocstring
+def complement_vlans(items: Any = "", **kwargs) -> Range:
+    """VLAN IDs that are absent in items, in the valid range 1...4094 (not allowed VLANs).
+
+    Computed on interval bounds, VLAN IDs are not expanded to a list.
+
+    :param items: Range of VLANs, can be unsorted and with duplicates, "-1" - all VLAN IDs.
+    :type items: str or List[int] or List[str]
+
+    :param all: True - items are all VLAN IDs, returns empty Range.
+    :type all: bool
+
+    :param splitter: Separator character between items (default ",").
+    :type splitter: str
+
+    :param range_splitter: Separator between min and max numbers in range (default "-").
+    :type range_splitter: str
+
+    :param platform: Set `splitter` and `range_splitter` to platform specific values,
+        "cisco" or "hpe", the same as in ivlan().
+    :type platform: str
+
+    :return: Range of absent VLAN IDs.
+    :rtype: Range
+
+    :raises NetportsValueError: if VLANs are outside valid range 1...4094.
+
+    :example:
+        complement_vlans("1,3-5") -> Range("2,6-4094")
+    """
+    kwargs = _update_splitters(**kwargs)
+    splitters = {k: kwargs.get(k) for k in ("splitter", "range_splitter")}
+    if h.is_all(**kwargs):
+        return Range("", **splitters)
+    if h.is_brief_in_items(items):
+        items_ = ",".join(h.lstr(h.remove_brief_items(items)))
+        _check_bounds(parse_range(items_))
+        return Range("", **splitters)
+
+    range_o: Range = parse_range(items, **kwargs)
+    _check_bounds(range_o)
+    return range_o.complement(MIN_VLAN, MAX_VLAN)
+
+
+def trunk_changes(
+    current: Any,
+    desired: Any,
+    platform: str = "cisco",
+    max_chars: int = MAX_LINE_CHARS,
+) -> LStr:
+    """Commands to change trunk allowed VLANs from current to desired state.
+
+    Minimal change-set: "add" and "remove" commands, or "replace" commands if they are shorter.
+    VLANs to add and remove are computed on interval bounds, commands are chunked to max_chars.
+
+    :param current: Current allowed VLANs, in the platform format or List[int] or Range.
+    :type current: str or List[int] or Range
+
+    :param desired: Desired allowed VLANs, in the platform format or List[int] or Range.
+    :type desired: str or List[int] or Range
+
+    :param platform: "cisco" (Cisco IOS, default) or "hpe" (Hewlett Packard Enterprise).
+    :param max_chars: Maximal length of command line, 0 - unlimited. Default is 80.
+
+    :return: Command lines, empty list if there are no changes.
+    :rtype: List[str]
+
+    :raises NetportsValueError: If platform is unknown, VLANs are outside valid range 1...4094
+        or max_chars is too small for a command.
+
+    :example:
+        trunk_changes("10,20,30,40,50,60,70", "10,20,30,40,50,60,70,80") ->
+            ["switchport trunk allowed vlan add 80"]
+        trunk_changes("10,20,30,40,50,60,70", "10,20") ->
+            ["switchport trunk allowed vlan 10,20"]
+        trunk_changes("1 to 10", "20", platform="hpe") ->
+            ["undo port trunk permit vlan all", "port trunk permit vlan 20"]
+    """
+    if platform not in TRUNK_COMMANDS:
+        raise NetportsValueError(f"{platform=}, expected {list(TRUNK_COMMANDS)}")
+    commands = TRUNK_COMMANDS[platform]
+    current_ = _trunk_range(current, platform)
+    desired_ = _trunk_range(desired, platform)
+    add = Range.intersection_all([desired_, current_.complement(MIN_VLAN, MAX_VLAN)])
+    remove = Range.intersection_all([current_, desired_.complement(MIN_VLAN, MAX_VLAN)])
+    if not (add.items or remove.items):
+        return []
+
+    changes = _trunk_lines(add, commands["add"], commands["add"], platform, max_chars)
+    changes += _trunk_lines(remove, commands["remove"], commands["remove"], platform, max_chars)
+    if commands["replace"] and desired_.items:
+        replaces = _trunk_lines(desired_, commands["replace"], commands["add"], platform, max_chars)
+    else:
+        replaces = [commands["none"]]
+        replaces += _trunk_lines(desired_, commands["add"], commands["add"], platform, max_chars)
+    if sum(len(s) for s in replaces) < sum(len(s) for s in changes):
+        return replaces
+    return changes
+
+
 # ============================= helpers ==============================
 
 
+def _trunk_range(items: Any, platform: str) -> Range:
+    """Parse trunk allowed VLANs in the platform format, Range is used as is."""
+    if isinstance(items, Range):
+        range_o = items
+    else:
+        range_o = parse_range(items, **_update_splitters(platform=platform))
+    _check_bounds(range_o)
+    return range_o
+
+
+def _trunk_lines(range_o: Range, first: str, command: str, platform: str, max_chars: int) -> LStr:
+    """Command lines with chunks of VLANs in the platform format.
+
+    :param first: Command of the first line.
+    :param command: Command of the next lines.
+    """
+    length = max(len(first), len(command))
+    max_chars_ = max_chars - length if max_chars else 0
+    if max_chars and max_chars_ <= 0:
+        raise NetportsValueError(f"{max_chars=}, expected > {length}")
+    chunks = range_o.chunks(max_chars=max_chars_, platform=platform)
+    return [(command if i else first) + s for i, s in enumerate(chunks)]
+
+
+def _check_bounds(range_o: Range) -> None:
+    """Check the min and max VLAN IDs of the range, without expanding numbers."""
+    if range_o.items:
+        check_vlans([range_o.items[0].min, range_o.items[-1].max])
+
+
 def _replace_range_splitter(item: str, **kwargs) -> str:
     """Replace "-" to range_splitter specified in kwargs."""
     range_splitter = kwargs.get("range_splitter") or ""
@@ -144,10 +308,9 @@ def _update_splitters(**kwargs):
     "hpe"       " "         " to "          Hewlett Packard Enterprise
     """
     platform = str(kwargs.get("platform") or "")
-    if platform == "cisco":
-        return {**kwargs, **{"splitter": SPLITTER, "range_splitter": RANGE_SPLITTER}}
-    if platform == "hpe":
-        return {**kwargs, **{"splitter": SPLITTER_HPE, "range_splitter": RANGE_SPLITTER_HPE}}
+    if platform in PLATFORMS:
+        splitter, range_splitter = PLATFORMS[platform]
+        return {**kwargs, **{"splitter": splitter, "range_splitter": range_splitter}}
     return kwargs
 
 
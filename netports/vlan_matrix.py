@@ -0,0 +1,241 @@
+"""VlanMatrix, bit matrix of VLAN IDs allowed on interfaces (rows) by VLAN (columns)."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from netports import helpers as h
+from netports.exceptions import NetportsValueError
+from netports.intf import Intf
+from netports.ports import parse_range
+from netports.range import Range, TIntervals
+from netports.vlan import MAX_VLAN, MIN_VLAN, _check_bounds, _update_splitters
+
+LIntf = List[Intf]
+
+# positions of set bits in byte, to scan column bitmaps
+_BYTE_BITS: List[Tuple[int, ...]] = [tuple(i for i in range(8) if b >> i & 1) for b in range(256)]
+
+
+class VlanMatrix:
+    """VlanMatrix, bit matrix of VLAN IDs allowed on interfaces (rows) by VLAN (columns).
+
+    Each row is stored as one 4094-bit bitmap (int, bit N - VLAN N). The column index,
+    bitmap of rows for each VLAN, is built on the first column query and reset on change.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[Any, Any]] = (), **kwargs):
+        """Init VlanMatrix.
+
+        :param rows: Rows (interface, VLANs), interface is Intf or str,
+            VLANs is str in svlan() format, List[int] or Range.
+        :type rows: List[Tuple[Intf, str]]
+
+        :param platform: Format of VLANs str, "cisco" (default) or "hpe", the same as in ivlan().
+        :type platform: str
+
+        :raises NetportsValueError: If VLANs are outside valid range 1...4094.
+
+        :example:
+            matrix = VlanMatrix([("Gi0/1", "1,3-5"), ("Gi0/2", "4-10")])
+            matrix.col(4) -> [Intf("Gi0/1"), Intf("Gi0/2")]
+        """
+        self._intfs: LIntf = []
+        self._bits: List[int] = []
+        self._idx: Dict[Intf, int] = {}
+        self._cols: Optional[List[int]] = None
+        self.update(rows, **kwargs)
+
+    def __repr__(self) -> str:
+        """Representation of the object."""
+        class_ = self.__class__.__name__
+        rows = len(self)
+        return f"<{class_}: {rows=}>"
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return len(self._intfs)
+
+    def __iter__(self) -> Iterator[Intf]:
+        """Iterate interfaces of rows."""
+        return iter(list(self._intfs))
+
+    def __contains__(self, intf: Any) -> bool:
+        """Check if the interface is present in the matrix."""
+        return _to_intf(intf) in self._idx
+
+    # =========================== property ===========================
+
+    @property
+    def intfs(self) -> LIntf:
+        """Interfaces of rows in order of appearance."""
+        return list(self._intfs)
+
+    # =========================== methods ============================
+
+    def col(self, vlan: Any) -> LIntf:
+        """Interfaces that carry the VLAN, using the column index.
+
+        :param vlan: VLAN ID.
+        :return: Interfaces in order of appearance.
+        :raises NetportsValueError: If the VLAN ID is outside valid range 1...4094.
+        """
+        vlan_ = h.to_int(vlan)
+        if not MIN_VLAN <= vlan_ <= MAX_VLAN:
+            raise NetportsValueError(f"{vlan=}, expected in range {MIN_VLAN}...{MAX_VLAN}")
+        bits = self._index()[vlan_]
+        return [self._intfs[i] for i in _bit_indexes(bits, len(self._intfs))]
+
+    def intersection(self, intfs: Optional[Iterable[Any]] = None) -> Range:
+        """VLANs allowed on all the interfaces.
+
+        :param intfs: Interfaces, all rows by default.
+        :return: Range of VLAN IDs, empty Range for no interfaces.
+        :raises KeyError: If the interface is absent in the matrix.
+        """
+        bits_: Optional[int] = None
+        for bits in self._rows_bits(intfs):
+            bits_ = bits if bits_ is None else bits_ & bits
+        return Range._from_intervals(_bits_to_intervals(bits_ or 0))
+
+    def row(self, intf: Any) -> Range:
+        """VLANs allowed on the interface.
+
+        :param intf: Interface, Intf or str.
+        :return: Range of VLAN IDs.
+        :raises KeyError: If the interface is absent in the matrix.
+        """
+        bits = self._bits[self._idx[_to_intf(intf)]]
+        return Range._from_intervals(_bits_to_intervals(bits))
+
+    def set(self, intf: Any, vlans: Any, **kwargs) -> None:
+        """Add row or replace VLANs of the existing row.
+
+        :param intf: Interface, Intf or str.
+        :param vlans: VLANs, str in svlan() format, List[int] or Range.
+        :param platform: Format of VLANs str, "cisco" (default) or "hpe".
+        :raises NetportsValueError: If VLANs are outside valid range 1...4094.
+        """
+        self._set(_to_intf(intf), _to_bits(vlans, **kwargs))
+        self._cols = None
+
+    def union(self, intfs: Optional[Iterable[Any]] = None) -> Range:
+        """VLANs allowed on any of the interfaces.
+
+        :param intfs: Interfaces, all rows by default.
+        :return: Range of VLAN IDs.
+        :raises KeyError: If the interface is absent in the matrix.
+        """
+        bits_ = 0
+        for bits in self._rows_bits(intfs):
+            bits_ |= bits
+        return Range._from_intervals(_bits_to_intervals(bits_))
+
+    def update(self, rows: Iterable[Tuple[Any, Any]], **kwargs) -> None:
+        """Add rows or replace VLANs of the existing rows, bulk load.
+
+        :param rows: Rows (interface, VLANs), VLANs is str in svlan() format, List[int] or Range.
+        :param platform: Format of VLANs str, "cisco" (default) or "hpe".
+        :raises NetportsValueError: If VLANs are outside valid range 1...4094.
+        """
+        bits_by_line: Dict[str, int] = {}  # the same VLANs on many interfaces are parsed once
+        for intf, vlans in rows:
+            if isinstance(vlans, str):
+                bits = bits_by_line.get(vlans)
+                if bits is None:
+                    bits = bits_by_line[vlans] = _to_bits(vlans, **kwargs)
+            else:
+                bits = _to_bits(vlans, **kwargs)
+            self._set(_to_intf(intf), bits)
+        self._cols = None
+
+    # =========================== helpers ============================
+
+    def _index(self) -> List[int]:
+        """Column index, bitmap of rows for each VLAN (bit N - row N), built on first query.
+
+        Sweep over interval bounds of rows, columns between bounds share the same bitmap.
+        """
+        if self._cols is None:
+            starts: Dict[int, List[int]] = {}
+            ends: Dict[int, List[int]] = {}  # first VLAN after the interval
+            intervals_by_bits: Dict[int, TIntervals] = {}
+            for row, bits in enumerate(self._bits):
+                intervals = intervals_by_bits.get(bits)
+                if intervals is None:
+                    intervals = intervals_by_bits[bits] = _bits_to_intervals(bits)
+                for start, end in intervals:
+                    starts.setdefault(start, []).append(row)
+                    ends.setdefault(end + 1, []).append(row)
+            active = bytearray((len(self._bits) + 7) // 8)
+            cols = [0] * (MAX_VLAN + 1)
+            col = 0
+            for vlan in range(MIN_VLAN, MAX_VLAN + 1):
+                if vlan in starts or vlan in ends:
+                    for row in ends.get(vlan, ()):
+                        active[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+                    for row in starts.get(vlan, ()):
+                        active[row >> 3] |= 1 << (row & 7)
+                    col = int.from_bytes(active, "little")
+                cols[vlan] = col
+            self._cols = cols
+        return self._cols
+
+    def _rows_bits(self, intfs: Optional[Iterable[Any]]) -> Iterable[int]:
+        """Bitmaps of the interfaces, all rows by default."""
+        if intfs is None:
+            return self._bits
+        return [self._bits[self._idx[_to_intf(o)]] for o in intfs]
+
+    def _set(self, intf: Intf, bits: int) -> None:
+        """Add or replace row bitmap."""
+        row = self._idx.setdefault(intf, len(self._intfs))
+        if row == len(self._intfs):
+            self._intfs.append(intf)
+            self._bits.append(bits)
+        else:
+            self._bits[row] = bits
+
+
+# ============================= helpers ==============================
+
+
+def _to_intf(intf: Any) -> Intf:
+    """Convert interface name to Intf, Intf is used as is."""
+    if isinstance(intf, Intf):
+        return intf
+    return Intf(str(intf))
+
+
+def _to_bits(vlans: Any, **kwargs) -> int:
+    """Convert VLANs to bitmap, bit N - VLAN N, on interval bounds.
+
+    :raises NetportsValueError: If VLANs are outside valid range 1...4094.
+    """
+    if isinstance(vlans, Range):
+        range_o = vlans
+    else:
+        range_o = parse_range(vlans, **_update_splitters(**kwargs))
+    _check_bounds(range_o)
+    bits = 0
+    for start, end in range_o.intervals:
+        bits |= ((1 << (end - start + 1)) - 1) << start
+    return bits
+
+
+def _bits_to_intervals(bits: int) -> TIntervals:
+    """Convert bitmap to sorted intervals ((min, max), ...) of set bits, run by run."""
+    intervals: List[Tuple[int, int]] = []
+    while bits:
+        start = (bits & -bits).bit_length() - 1
+        shifted = bits >> start
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        intervals.append((start, start + length - 1))
+        bits = (shifted >> length) << (start + length)
+    return tuple(intervals)
+
+
+def _bit_indexes(bits: int, size: int) -> List[int]:
+    """Positions of set bits in bitmap of size bits, byte by byte."""
+    data = bits.to_bytes((size + 7) // 8, "little")
+    return [i * 8 + j for i, byte in enumerate(data) if byte for j in _BYTE_BITS[byte]]
@@ -0,0 +1,181 @@
+"""Tests cache.py"""
+
+import threading
+
+import pytest
+
+from netports import NetportsValueError, cache, vlan
+from netports.cache import CacheInfo, LruCache
+from netports.ports import parse_range
+from netports.range import Range
+from netports.tcp import itcp, stcp
+from netports.vlan import ivlan, svlan
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Clean cache with default size before and after test."""
+    cache.set_cache_size(cache.DEFAULT_MAXSIZE)
+    cache.cache_clear()
+    yield
+    cache.set_cache_size(cache.DEFAULT_MAXSIZE)
+    cache.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "func, items, kwargs, expected",
+    [
+        (ivlan, "1,3-5", {}, [1, 3, 4, 5]),
+        (ivlan, "1 3 to 5", {"platform": "hpe"}, [1, 3, 4, 5]),
+        (ivlan, "1-4094", {}, [-1]),
+        (ivlan, "1-4094", {"verbose": True}, list(range(1, 4095))),
+        (svlan, [1, 3, 4, 5], {}, "1,3-5"),
+        (svlan, [1, 3, 4, 5], {"platform": "hpe"}, "1 3 to 5"),
+        (itcp, "1,3-5", {}, [1, 3, 4, 5]),
+        (itcp, ("1", 3, 4, 5), {}, [1, 3, 4, 5]),
+        (stcp, [1, 3, 4, 5], {}, "1,3-5"),
+        (parse_range, "1,3-5", {}, Range("1,3-5")),
+        (parse_range, "1 3 to 5", {"splitter": " ", "range_splitter": " to "}, Range("1,3-5")),
+    ],
+)
+def test__hits(func, items, kwargs, expected):
+    """Repeated calls return cached results."""
+    actual1 = func(items, **kwargs)
+    actual2 = func(items, **kwargs)
+
+    assert actual1 == expected
+    assert actual2 == expected
+    info = cache.cache_info()
+    assert info.hits >= 1
+    assert info.currsize >= 1
+
+
+def test__mutable_copies():
+    """Callers get mutable copies, cached results are not changed."""
+    vlans = ivlan("1-3")
+    vlans.append(10)
+    range_o = parse_range("1-3")
+    range_o.append(10)
+
+    assert ivlan("1-3") == [1, 2, 3]
+    assert parse_range("1-3") == Range("1-3")
+    assert parse_range("1-3") is not parse_range("1-3")
+
+
+def test__mutable_items():
+    """Items of the returned Range are not shared with the cache."""
+    range_o = parse_range("1-5")
+    range_o.items[0].line = "7"
+
+    actual = parse_range("1-5")
+    assert actual.line == "1-5"
+    assert actual.numbers() == [1, 2, 3, 4, 5]
+    assert actual.items[0] is not parse_range("1-5").items[0]
+
+
+def test__immutable_shared():
+    """Immutable AllRange results are cached as is."""
+    assert ivlan("1-4094", lazy=True) is ivlan("1-4094", lazy=True)
+    assert ivlan("1-4094", lazy=True) is vlan.ALL_VLANS_R
+    assert cache.cache_info().hits == 2
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [Range("1")],
+        [1] * (cache.MAX_ITEMS + 1),
+        {1, 2},
+    ],
+)
+def test__not_cached(items):
+    """Items that are not cacheable."""
+    parse_range(items)
+    parse_range(items)
+
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+
+
+def test__errors_not_cached():
+    """Errors are raised on each call."""
+    for _ in range(2):
+        with pytest.raises(NetportsValueError):
+            ivlan("4095")
+    assert cache.cache_info() == CacheInfo(hits=0, misses=2, maxsize=1024, currsize=0)
+
+
+@pytest.mark.parametrize("func, items", [
+    (ivlan, "1-3"),
+    (svlan, "1-3"),
+    (itcp, "1-3"),
+    (stcp, "1-3"),
+])
+def test__one_entry(func, items):
+    """One public call is one cache entry and one hit or miss, nested parser is not cached."""
+    func(items)
+    func(items)
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+
+
+def test__compact_lists():
+    """List results are stored as runs of consecutive numbers."""
+    assert itcp("1-65535", verbose=True) == list(range(1, 65536))
+    assert itcp("1,3-5,1-2", verbose=True) == [1, 2, 3, 4, 5]
+    assert ivlan("7,10-12") == [7, 10, 11, 12]
+    assert ivlan("1-4094") == [-1]
+
+    stored = list(cache.CACHE._data.values())  # pylint: disable=protected-access
+    assert stored == [((1, 65535),), ((1, 5),), ((7, 7), (10, 12)), ((-1, -1),)]
+
+
+def test__set_cache_size():
+    """cache.set_cache_size()"""
+    for i in range(1, 5):
+        parse_range(i)
+    cache.set_cache_size(2)
+    assert cache.cache_info().currsize == 2
+
+    parse_range(3)  # recently used
+    parse_range(5)
+    assert cache.cache_info() == CacheInfo(hits=1, misses=5, maxsize=2, currsize=2)
+    parse_range(3)
+    assert cache.cache_info().hits == 2
+
+    cache.set_cache_size(0)
+    parse_range(3)
+    assert cache.cache_info() == CacheInfo(hits=2, misses=5, maxsize=0, currsize=0)
+
+
+@pytest.mark.parametrize(
+    "maxsize, error",
+    [
+        (-1, NetportsValueError),
+        ("1", TypeError),
+    ],
+)
+def test__set_cache_size__invalid(maxsize, error):
+    """cache.set_cache_size() invalid maxsize."""
+    with pytest.raises(error):
+        cache.set_cache_size(maxsize)
+
+
+def test__threads():
+    """LruCache is consistent when used from threads."""
+    lru = LruCache(maxsize=10)
+
+    def worker(idx: int) -> None:
+        for i in range(1000):
+            key = (idx + i) % 20
+            found, _ = lru.get(key)
+            if not found:
+                lru.set(key, key)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = lru.info()
+    assert info.hits + info.misses == 8000
+    assert info.currsize == 10
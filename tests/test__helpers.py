@@ -36,6 +36,19 @@ def test__is_brief(kwargs, expected):
     assert actual == expected
 
 
+@pytest.mark.parametrize("kwargs, expected", [
+    ({"lazy": True}, True),
+    ({"lazy": 1}, True),
+    ({"lazy": False}, False),
+    ({"verbose": False}, False),
+    ({}, False),
+])
+def test__is_lazy(kwargs, expected):
+    """helpers.is_lazy()"""
+    actual = h.is_lazy(**kwargs)
+    assert actual == expected
+
+
 @pytest.mark.parametrize("items, expected", [
     (1, False),
     ("1", False),
@@ -135,3 +135,44 @@ def test__ip_pairs(kwargs, expected):
 
     diff = list(dictdiffer.diff(actual, expected))
     assert diff == []
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, "0-255"),
+    ({"items": "icmp,tcp,7-255"}, "0,2-5"),
+    ({"items": [0, 255]}, "1-254"),
+    ({"items": "ip"}, ""),
+    ({"items": "-1"}, ""),
+    ({"items": "1", "all": True}, ""),
+    ({"items": "typo,1", "strict": False}, "0,2-255"),
+    ({"items": "typo"}, NetportsValueError),
+    ({"items": "256"}, NetportsValueError),
+])
+def test__complement_ip(kwargs, expected):
+    """ip.complement_ip()"""
+    if isinstance(expected, str):
+        actual = ip.complement_ip(**kwargs)
+        assert actual.line == expected
+    else:
+        with pytest.raises(expected):
+            ip.complement_ip(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({"items": "ip", "lazy": True}, ip.ALL_NUMBERS_R),
+    ({"items": "ip", "lazy": True, "verbose": True}, ip.ALL_NUMBERS_R),
+    ({"items": "-1", "lazy": True}, ip.ALL_NUMBERS_R),
+    ({"items": [-1, 255], "lazy": True}, ip.ALL_NUMBERS_R),
+    ({"items": "255", "all": True, "lazy": True}, ip.ALL_NUMBERS_R),
+    ({"items": "255", "lazy": True}, [255]),
+    ({"items": "ip", "lazy": False}, [-1]),
+])
+def test__iip__lazy(kwargs, expected):
+    """ip.iip(lazy=True)"""
+    actual = ip.iip(**kwargs)
+    assert actual == expected
+    if isinstance(expected, list):
+        assert isinstance(actual, list)
+    else:
+        assert actual is expected
+        assert len(actual) == 256
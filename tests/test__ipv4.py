@@ -422,6 +422,48 @@ def test__hosts(ipv4, addr, expected):
             list(ipv4.hosts())
 
 
+@pytest.mark.parametrize("addr, kwargs, expected", [
+    # fmt
+    ("10.0.0.0/30", {"fmt": "str"}, ["10.0.0.1/30", "10.0.0.2/30"]),
+    ("10.0.0.0/30", {"fmt": "int"}, [167772161, 167772162]),
+    ("10.0.0.1", {"fmt": "str"}, ["10.0.0.1"]),
+    ("10.0.0.0 255.255.255.252", {"fmt": "str"}, [
+        "10.0.0.1 255.255.255.252",
+        "10.0.0.2 255.255.255.252",
+    ]),
+    ("10.0.0.0/30", {"fmt": "typo"}, NetportsValueError),
+    ("10.0.0.0 0.0.0.3", {"fmt": "str"}, NetportsValueError),
+    # start stop
+    ("10.0.0.0/16", {"fmt": "str", "start": 256, "stop": 258}, ["10.0.1.1/16", "10.0.1.2/16"]),
+    ("10.0.0.0/16", {"fmt": "str", "start": -2}, ["10.0.255.253/16", "10.0.255.254/16"]),
+    ("10.0.0.0/30", {"fmt": "str", "start": 5}, []),
+])
+def test__hosts__kwargs(ipv4, addr, kwargs, expected):
+    """IPv4.hosts(start, stop, fmt)."""
+    if isinstance(expected, list):
+        actual = list(ipv4.hosts(**kwargs))
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            list(ipv4.hosts(**kwargs))
+
+
+@pytest.mark.parametrize("addr, expected", [
+    ("10.0.0.0", 1),
+    ("10.0.0.0/32", 1),
+    ("10.0.0.0/31", 2),
+    ("10.0.0.0/30", 2),
+    ("10.0.0.0/16", 65534),
+    ("10.0.0.1 255.255.255.0", 254),
+])
+def test__hosts_count(ipv4, addr, expected):
+    """IPv4.hosts_count."""
+    actual = ipv4.hosts_count
+    assert actual == expected
+    if expected < 300:
+        assert actual == len(list(ipv4.hosts()))
+
+
 # ============================= helpers ==============================
 
 @pytest.mark.parametrize("args, kwargs, expected", [
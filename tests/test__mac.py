@@ -1,5 +1,7 @@
 """Tests mac.py"""
 
+import copy
+
 import dictdiffer  # type: ignore[import-untyped]
 import pytest
 
@@ -81,6 +83,44 @@ def test__le__(addr1, addr2, expected):
     assert actual == expected
 
 
+@pytest.mark.parametrize("addr", [
+    "0000.0000.0000",
+    "Abcd.Ef12.3456",
+])
+def test__copy__(mac, addr):
+    """Mac.__copy__()"""
+    actual = copy.copy(mac)
+    assert actual == mac
+    assert actual.addr == addr
+    assert actual.hex == mac.hex
+
+
+# ============================ constructors ============================
+
+@pytest.mark.parametrize("number, expected", [
+    (0, "000000000000"),
+    (0xABCDEF123456, "abcdef123456"),
+    (0xFFFFFFFFFFFF, "ffffffffffff"),
+    (-1, NetportsValueError),
+    (0x1000000000000, NetportsValueError),
+    ("0", TypeError),
+])
+def test__from_int(number, expected):
+    """Mac.from_int()."""
+    if isinstance(expected, str):
+        obj = Mac.from_int(number)
+
+        assert obj.addr == expected
+        assert obj.hex == expected
+        assert obj.integer == number
+        assert obj == Mac(expected)
+        assert hash(obj) == hash(Mac(expected))
+        assert obj.cisco == Mac(expected).cisco
+    else:
+        with pytest.raises(expected):
+            Mac.from_int(number)
+
+
 # ============================= methods ==============================
 
 @pytest.mark.parametrize("addr, size, splitter, expected", [
@@ -135,6 +175,51 @@ def test__hp_procurve(mac, addr, expected):
     assert actual == expected
 
 
+# ============================= functions ============================
+
+ADDRS = ["00:00:00:00:00:01", "ABCD.EF12.3456", "000000-00000a"]
+
+
+@pytest.mark.parametrize("to", ["cisco", "hp_comware", "hp_procurve", "linux", "windows", "hex"])
+def test__convert_macs(to):
+    """mac.convert_macs()."""
+    actual = mac_.convert_macs(ADDRS, to=to)
+    expected = [Mac(s).hex.lower() if to == "hex" else getattr(Mac(s), to) for s in ADDRS]
+    assert actual == expected
+
+
+@pytest.mark.parametrize("addrs, kwargs, expected", [
+    (ADDRS, {"to": "typo"}, NetportsValueError),
+    (["0000.0000.000X"], {}, NetportsValueError),
+    (["0000_0000_0001"], {}, NetportsValueError),
+    (["0000.0000.0001", "0000.0000.000X", ""], {"strict": False}, ["0000.0000.0001"]),
+    ([], {}, []),
+])
+def test__convert_macs__strict(addrs, kwargs, expected):
+    """mac.convert_macs() strict."""
+    if isinstance(expected, list):
+        actual = mac_.convert_macs(addrs, **kwargs)
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            mac_.convert_macs(addrs, **kwargs)
+
+
+@pytest.mark.parametrize("addrs, kwargs, expected", [
+    (ADDRS, {}, [1, 0xABCDEF123456, 10]),
+    (["0000.0000.000X"], {}, NetportsValueError),
+    (["0000.0000.0001", "0000.0000.000X"], {"strict": False}, [1]),
+])
+def test__parse_macs(addrs, kwargs, expected):
+    """mac.parse_macs()."""
+    if isinstance(expected, list):
+        actual = mac_.parse_macs(addrs, **kwargs)
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            mac_.parse_macs(addrs, **kwargs)
+
+
 # ============================== parse ===============================
 
 
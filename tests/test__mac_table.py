@@ -0,0 +1,138 @@
+"""Tests mac_table.py"""
+
+import pytest
+
+from netports import NetportsValueError
+from netports.mac import Mac
+from netports.mac_table import MacTable
+
+ROWS = [
+    (10, "0000.0000.0002", "Gi0/2"),
+    (10, "00:00:00:00:00:01", "Gi0/1"),
+    ("20", "000000-000002", "Gi0/2"),
+    (30, 3, "Po1"),
+    (30, Mac("0000.0000.0001"), "Gi0/1"),
+]
+
+
+@pytest.fixture
+def table() -> MacTable:
+    """Create MacTable object."""
+    return MacTable(ROWS)
+
+
+def test__init__(table):
+    """MacTable.__init__()."""
+    assert len(table) == 5
+    assert list(table.integers) == [2, 1, 2, 3, 1]
+    assert list(table.vlans) == [10, 10, 20, 30, 30]
+    assert table.intfs == ["Gi0/2", "Gi0/1", "Po1"]
+    assert repr(table) == "<MacTable: rows=5 intfs=3>"
+
+
+@pytest.mark.parametrize("rows, expected", [
+    ([(10, "0000.0000.000X", "Gi0/1")], NetportsValueError),
+    ([(10, "0000.0000.0000.0000", "Gi0/1")], NetportsValueError),
+    ([(10, -1, "Gi0/1")], NetportsValueError),
+    ([(4096, "0000.0000.0001", "Gi0/1")], NetportsValueError),
+    ([("typo", "0000.0000.0001", "Gi0/1")], TypeError),
+])
+def test__init__invalid(rows, expected):
+    """MacTable.__init__() invalid."""
+    with pytest.raises(expected):
+        MacTable(rows)
+
+
+@pytest.mark.parametrize("mac, expected", [
+    ("0000.0000.0001", True),
+    (2, True),
+    (Mac("00-00-00-00-00-03"), True),
+    ("ffff.ffff.ffff", False),
+])
+def test__contains__(table, mac, expected):
+    """MacTable.__contains__()."""
+    actual = mac in table
+    assert actual == expected
+
+
+def test__append(table):
+    """MacTable.append()."""
+    assert "0000.0000.0004" not in table
+    table.append(40, "0000.0000.0004", "Gi0/1")
+    assert "0000.0000.0004" in table
+    assert table.find(4) == [(40, "000000000004", "Gi0/1")]
+    assert table.intfs == ["Gi0/2", "Gi0/1", "Po1"]
+
+
+def test__extend__invalid():
+    """MacTable.extend() rows appended before an invalid row are indexed."""
+    table = MacTable([(10, "0000.0000.0001", "Gi0/1")])
+    assert 2 not in table
+    with pytest.raises(NetportsValueError):
+        table.extend([(10, "0000.0000.0002", "Gi0/2"), (10, "typo", "Gi0/3")])
+
+    assert len(table) == 2
+    assert 2 in table
+    assert table.find(2) == [(10, "000000000002", "Gi0/2")]
+
+
+@pytest.mark.parametrize("mac, fmt, expected", [
+    ("0000.0000.0001", "hex", [(10, "000000000001", "Gi0/1"), (30, "000000000001", "Gi0/1")]),
+    (2, "cisco", [(10, "0000.0000.0002", "Gi0/2"), (20, "0000.0000.0002", "Gi0/2")]),
+    (3, "linux", [(30, "00:00:00:00:00:03", "Po1")]),
+    (4, "hex", []),
+    (1, "typo", NetportsValueError),
+])
+def test__find(table, mac, fmt, expected):
+    """MacTable.find()."""
+    if isinstance(expected, list):
+        actual = table.find(mac, fmt=fmt)
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            table.find(mac, fmt=fmt)
+
+
+@pytest.mark.parametrize("mac, expected", [
+    (1, ["Gi0/1"]),
+    (3, ["Po1"]),
+    (4, []),
+])
+def test__intfs_by_mac(table, mac, expected):
+    """MacTable.intfs_by_mac()."""
+    actual = table.intfs_by_mac(mac)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("fmt, expected", [
+    ("cisco", "0000.0000.0002"),
+    ("hex", "000000000002"),
+    ("hp_comware", "0000-0000-0002"),
+    ("hp_procurve", "000000-000002"),
+    ("linux", "00:00:00:00:00:02"),
+    ("windows", "00-00-00-00-00-02"),
+    ("typo", NetportsValueError),
+])
+def test__macs(table, fmt, expected):
+    """MacTable.macs()."""
+    if isinstance(expected, str):
+        actual = table.macs(fmt=fmt)
+        assert actual[0] == expected
+        assert actual[0] == getattr(Mac(expected), fmt)
+        assert len(actual) == len(table)
+    else:
+        with pytest.raises(expected):
+            table.macs(fmt=fmt)
+
+
+def test__rows(table):
+    """MacTable.rows()."""
+    actual = table.rows(fmt="cisco")
+    assert actual == [
+        (10, "0000.0000.0002", "Gi0/2"),
+        (10, "0000.0000.0001", "Gi0/1"),
+        (20, "0000.0000.0002", "Gi0/2"),
+        (30, "0000.0000.0003", "Po1"),
+        (30, "0000.0000.0001", "Gi0/1"),
+    ]
+    assert list(table) == table.rows()
@@ -0,0 +1,135 @@
+"""Tests oui.py"""
+
+from pathlib import Path
+
+import pytest
+
+from netports import NetportsValueError, oui
+from netports.mac import Mac, vendors
+from netports.oui import OuiIndex
+
+CSV_MAL = """Registry,Assignment,Organization Name,Organization Address
+MA-L,00000C,"Cisco Systems, Inc",170 WEST TASMAN DRIVE SAN JOSE CA US 95134
+MA-L,70B3D5,IEEE Registration Authority,445 Hoes Lane Piscataway NJ US 08554
+MA-L,0050C2,IEEE Registration Authority,445 Hoes Lane Piscataway NJ US 08554
+"""
+CSV_MAM = """Registry,Assignment,Organization Name,Organization Address
+MA-M,0050C21,Vendor M,Address
+"""
+CSV_MAS = """Registry,Assignment,Organization Name,Organization Address
+MA-S,70B3D5123,Vendor S,Address
+"""
+TXT = """OUI/MA-L                                                    Organization
+company_id                                                  Organization
+                                                            Address
+
+00-00-0C   (hex)\t\tCisco Systems, Inc
+00000C     (base 16)\t\tCisco Systems, Inc
+\t\t\t\t170 WEST TASMAN DRIVE
+
+08-00-20   (hex)\t\tOracle Corporation
+080020     (base 16)\t\tOracle Corporation
+"""
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> list:
+    """Create IEEE registry files."""
+    paths = []
+    for name, text in [("oui.csv", CSV_MAL), ("mam.csv", CSV_MAM), ("oui36.csv", CSV_MAS)]:
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def index(registry) -> OuiIndex:
+    """Create OuiIndex object."""
+    return OuiIndex.from_registry(*registry)
+
+
+@pytest.fixture
+def reset_registry():
+    """Reset registry after test."""
+    yield
+    oui.set_registry()
+
+
+@pytest.mark.parametrize("integer, expected", [
+    (0x00000C123456, "Cisco Systems, Inc"),
+    (0x70B3D5000001, "IEEE Registration Authority"),
+    (0x70B3D5123001, "Vendor S"),
+    (0x70B3D5124001, "IEEE Registration Authority"),
+    (0x0050C2100001, "Vendor M"),
+    (0x0050C2200001, "IEEE Registration Authority"),
+    (0xFFFFFF000000, ""),
+])
+def test__lookup(index, integer, expected):
+    """OuiIndex.lookup()."""
+    actual = index.lookup(integer)
+    assert actual == expected
+
+
+def test__init__(index):
+    """OuiIndex.__init__()."""
+    assert len(index) == 5
+    assert repr(index) == "<OuiIndex: prefixes=5 vendors=4>"
+    with pytest.raises(NetportsValueError):
+        OuiIndex([(32, 0, "typo")])
+
+
+def test__lookup_many(index):
+    """OuiIndex.lookup_many()."""
+    integers = [0x00000C000001, 0x70B3D5123001, 0x70B3D5000001, 0x00000C000002, 0]
+    actual = index.lookup_many(integers)
+    assert actual == [index.lookup(i) for i in integers]
+
+
+def test__save__load(index, tmp_path):
+    """OuiIndex.save(), OuiIndex.load()."""
+    path = tmp_path / "oui.bin"
+    index.save(path)
+
+    loaded = OuiIndex.load(path)
+    assert len(loaded) == len(index)
+    for integer in [0x00000C123456, 0x70B3D5123001, 0x0050C2100001, 0xFFFFFF000000]:
+        assert loaded.lookup(integer) == index.lookup(integer)
+
+    with pytest.raises(NetportsValueError):
+        OuiIndex.load(tmp_path / "oui36.csv")
+
+
+def test__from_registry__txt(tmp_path):
+    """OuiIndex.from_registry() oui.txt."""
+    path = tmp_path / "oui.txt"
+    path.write_text(TXT, encoding="utf-8")
+
+    index = OuiIndex.from_registry(path)
+    assert len(index) == 2
+    assert index.lookup(0x080020000001) == "Oracle Corporation"
+
+
+def test__set_registry(registry, tmp_path, reset_registry):
+    """oui.set_registry(), Mac.vendor, mac.vendors()."""
+    oui.set_registry()
+    assert oui.get_index() is None
+    assert Mac("0000.0c00.0001").vendor == ""
+    assert vendors(["0000.0c00.0001"]) == [""]
+
+    oui.set_registry(*registry)
+    assert Mac("0000.0c00.0001").vendor == "Cisco Systems, Inc"
+    assert Mac("0000.0c00.0001").oui == "00000c"
+
+    path = tmp_path / "oui.bin"
+    OuiIndex.from_registry(*registry).save(path)
+    oui.set_registry(path)
+    actual = vendors(["0000.0c00.0001", 0x70B3D5123001, Mac("ffff.ffff.ffff")])
+    assert actual == ["Cisco Systems, Inc", "Vendor S", ""]
+
+
+def test__env(registry, monkeypatch, reset_registry):
+    """oui.get_index() from environment variable."""
+    oui.set_registry()
+    monkeypatch.setenv(oui.ENV_OUI_REGISTRY, str(registry[0]))
+    assert Mac("0000.0c00.0001").vendor == "Cisco Systems, Inc"
@@ -1,7 +1,10 @@
 """Tests package"""
 import re
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 from vhelpers import vdate, vdict, vpath, vre
 
 ROOT = Path(__file__).parent.parent
@@ -46,3 +49,45 @@ def test__last_modified_date():
     files = vpath.get_files(ROOT, pattern=".py$")
     expected = vdate.last_modified(files)
     assert actual == expected, "last modified file"
+
+
+def test__import_time():
+    """Lazy imports, `import netports` and VLAN, TCP functions without heavy dependencies."""
+    code = "import sys, netports; netports.svlan('1'); netports.stcp('1'); print(*sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    )
+    modules = result.stdout.split()
+    for name in ["pydantic", "packaging", "vhelpers", "netports.ipv4", "netports.swversion"]:
+        assert name not in modules, f"{name} imported"
+
+
+def test__lazy_names():
+    """All names in __all__ are available."""
+    import netports  # pylint: disable=import-outside-toplevel
+
+    for name in netports.__all__:
+        assert getattr(netports, name) is not None, name
+    assert set(netports.__all__).issubset(dir(netports))
+    with pytest.raises(AttributeError):
+        _ = netports.typo
+
+
+def test__benchmarks():
+    """Benchmark cases run on small sizes."""
+    sys.path.insert(0, str(ROOT))
+    try:
+        from benchmarks import run  # pylint: disable=import-outside-toplevel
+    finally:
+        sys.path.pop(0)
+
+    data = run.main(["--repeat", "1", "--scale", "0.001"])
+    results = data["results"]
+    assert results
+    for name, result in results.items():
+        assert result["size"] >= 1, name
+        assert result["min"] <= result["median"], name
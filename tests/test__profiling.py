@@ -0,0 +1,96 @@
+"""Tests profiling.py"""
+
+import pytest
+
+import netports
+from netports import cache, profiling
+from netports.ports import parse_range
+
+
+@pytest.fixture
+def enabled():
+    """Enable instrumentation on clean registry, disable after test."""
+    cache.cache_clear()
+    profiling.reset()
+    profiling.enable()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test__disabled():
+    """Entry points are not wrapped by default."""
+    assert profiling.is_enabled() is False
+    assert netports.ports.parse_range is parse_range
+    assert not hasattr(netports.Intf.__init__, "__wrapped__")
+
+
+@pytest.mark.parametrize(
+    "func_name, args, name, size",
+    [
+        ("parse_range", ["1-3,5"], "parse_range", 5),
+        ("ivlan", ["1-3,5"], "ivlan", 5),
+        ("itcp", [[1, 2, 3]], "itcp", 3),
+        ("iip", ["tcp"], "iip", 3),
+        ("Intf", ["Gi0/1"], "Intf", 5),
+        ("IPv4", ["10.0.0.1/24"], "IPv4", 11),
+        ("Mac", ["000000000001"], "Mac", 12),
+    ],
+)
+def test__stats(enabled, func_name, args, name, size):
+    """profiling.stats()"""
+    func = getattr(netports, func_name)
+    func(*args)
+    func(*args)
+
+    actual = profiling.stats()[name]
+    assert actual["calls"] == 2
+    assert actual["size"] == size * 2
+    assert actual["seconds"] > 0
+
+
+def test__intf_gm_ranges(enabled):
+    """IntfGM.ranges() input size is number of interfaces."""
+    intf_gm = netports.IntfGM(["Gi0/1", "Gi0/2", "Gi0/3"])
+    actual = intf_gm.ranges()
+
+    assert actual == ["Gi0/1-3"]
+    assert profiling.stats()["IntfGM.ranges"]["size"] == 3
+
+
+def test__imported_names(enabled):
+    """Functions imported by netports modules are wrapped."""
+    netports.trunk_changes("1", "1-2")
+    parse_range("1")  # imported before enable()
+
+    assert netports.ports.parse_range is not parse_range
+    assert netports.vlan.parse_range is netports.ports.parse_range
+    assert profiling.stats()["parse_range"]["calls"] == 2  # current and desired
+
+
+def test__disable():
+    """profiling.disable() restores originals, registry is kept."""
+    init = netports.Mac.__init__
+    profiling.enable()
+    profiling.enable()
+    netports.ivlan("1")
+    profiling.disable()
+    netports.ivlan("1")
+
+    assert profiling.is_enabled() is False
+    assert netports.ports.parse_range is parse_range
+    assert netports.vlan.parse_range is parse_range
+    assert netports.Mac.__init__ is init
+    assert profiling.stats()["ivlan"]["calls"] == 1
+    profiling.reset()
+    assert profiling.stats() == {}
+
+
+def test__report(enabled):
+    """profiling.report()"""
+    netports.ivlan("1")
+    netports.parse_range("1")
+    lines = profiling.report().splitlines()
+
+    assert lines[0].split() == ["name", "calls", "seconds", "size"]
+    assert [s.split()[0] for s in lines[1:]] == ["ivlan", "parse_range"]
@@ -1,8 +1,15 @@
 """Tests range.py"""
 
+import copy
+import pickle
+import random
+from array import array
+
 import pytest
 
-from netports import Range, Item, NetportsValueError
+from netports import AllRange, FrozenRange, Range, Item, NetportsValueError, coverage
+from netports import range as range_module
+from netports.static import PLATFORMS
 from netports.types_ import StrIInt
 from tests import helpers_
 
@@ -629,3 +636,852 @@ def test__items_wo_duplicates(range_, items, items_, expected):
     """Range._items_wo_duplicates()"""
     actual = range_._items_wo_duplicates(items=items_)
     assert actual == expected
+
+
+# ============================ FrozenRange ============================
+
+
+@pytest.mark.parametrize("items, kwargs, expected", [
+    ("1,3-5", {}, "1,3-5"),
+    ([5, 4, 3, 1], {}, "1,3-5"),
+    (Range("1,3-5"), {}, "1,3-5"),
+    ("1 3 to 5", {"splitter": " ", "range_splitter": " to "}, "1 3 to 5"),
+    ("", {}, ""),
+])
+def test__frozen_range__init__(items, kwargs, expected):
+    """FrozenRange.__init__()."""
+    frozen = FrozenRange(items, **kwargs)
+    assert frozen.line == expected
+    assert frozen is FrozenRange(frozen)
+    assert frozen is FrozenRange(frozen.line, **kwargs)
+
+
+def test__frozen_range__hash__():
+    """FrozenRange.__hash__() equal to Range.__hash__(), usable as dict key."""
+    frozen = FrozenRange("1,3-5")
+    assert hash(frozen) == hash(Range("1,3-5"))
+    assert frozen == Range("1,3-5")
+    assert Range("1,3-5") == frozen
+    assert frozen != FrozenRange("1,3")
+    assert {frozen: 1}[FrozenRange([1, 3, 4, 5])] == 1
+    assert FrozenRange("1") is not FrozenRange("1", splitter=" ")
+
+
+@pytest.mark.parametrize("number, expected", [
+    (0, False),
+    (1, True),
+    (2, False),
+    (3, True),
+    (5, True),
+    (6, False),
+])
+def test__frozen_range__contains__(number, expected):
+    """FrozenRange.__contains__()."""
+    frozen = FrozenRange("1,3-5")
+    assert (number in frozen) == expected
+
+
+@pytest.mark.parametrize("method, args", [
+    ("add", [Range("7")]),
+    ("append", [7]),
+    ("clear", []),
+    ("difference_update", [Range("1")]),
+    ("discard", [1]),
+    ("extend", [[7]]),
+    ("intersection_update", [Range("1")]),
+    ("pop", []),
+    ("remove", [1]),
+    ("symmetric_difference_update", [Range("1")]),
+    ("update", [Range("7")]),
+    ("__delitem__", [0]),
+])
+def test__frozen_range__immutable(method, args):
+    """FrozenRange mutating methods."""
+    frozen = FrozenRange("1,3-5")
+    with pytest.raises(TypeError, match="immutable"):
+        getattr(frozen, method)(*args)
+    with pytest.raises(TypeError):
+        frozen.line = "1"
+    assert frozen.line == "1,3-5"
+
+
+def test__frozen_range__items():
+    """FrozenRange.items are new objects, changing them does not change the interned object."""
+    frozen = FrozenRange("1-5")
+    frozen.items[0].line = "7"
+
+    assert FrozenRange("1-5") is frozen
+    assert str(frozen) == "1-5"
+    assert frozen.intervals == ((1, 5),)
+    assert 3 in frozen and 7 not in frozen
+    assert frozen.items == [Item("1-5")]
+    assert frozen.items[0] is not frozen.items[0]
+
+
+@pytest.mark.parametrize("method, other, expected", [
+    ("__add__", "7", "1,3-5,7"),
+    ("__sub__", "1,4", "3,5"),
+    ("difference", "1,4", "3,5"),
+    ("intersection", "4-7", "4-5"),
+    ("symmetric_difference", "4-7", "1,3,6-7"),
+    ("union", "7", "1,3-5,7"),
+])
+def test__frozen_range__operations(method, other, expected):
+    """FrozenRange non-mutating operations return FrozenRange."""
+    frozen = FrozenRange("1,3-5")
+    actual = getattr(frozen, method)(Range(other))
+    assert isinstance(actual, FrozenRange)
+    assert actual.line == expected
+    assert frozen.line == "1,3-5"
+
+
+def test__frozen_range__methods():
+    """FrozenRange read methods."""
+    frozen = FrozenRange("1,3-5")
+    assert len(frozen) == 4
+    assert list(frozen) == [1, 3, 4, 5]
+    assert list(frozen) == [1, 3, 4, 5]
+    assert frozen[1] == 3
+    assert frozen.index(4) == 2
+    assert frozen.numbers() == [1, 3, 4, 5]
+    assert frozen.intervals == ((1, 1), (3, 5))
+    assert frozen.issubset(Range("1-5"))
+    assert frozen.isdisjoint(Range("2"))
+    assert frozen.copy() is frozen
+    assert copy.deepcopy(frozen) is frozen
+    assert pickle.loads(pickle.dumps(frozen)) is frozen
+    assert repr(frozen) == "FrozenRange('1,3-5')"
+    assert sorted([FrozenRange("3"), FrozenRange("1")]) == [Range("1"), Range("3")]
+
+
+# ============================= multi-way =============================
+
+
+@pytest.mark.parametrize("items, min_count, expected", [
+    ([], 1, ""),
+    (["1,3-5"], 1, "1,3-5"),
+    (["1-3", "5", "2-4"], 1, "1-5"),
+    (["1-3", "5", "2-4"], 2, "2-3"),
+    (["1-3", "5", "2-4"], 3, ""),
+    (["1", "3", "5"], 1, "1,3,5"),
+    (["1", "2", "3"], 1, "1-3"),
+    (["1-10", "2-9", "3-8", "", "5"], 3, "3-8"),
+])
+def test__union_all(items, min_count, expected):
+    """Range.union_all()."""
+    actual = Range.union_all([Range(s) for s in items], min_count=min_count)
+    assert isinstance(actual, Range)
+    assert actual.line == expected
+
+    actual = FrozenRange.union_all(FrozenRange(s) for s in items)
+    assert isinstance(actual, FrozenRange)
+
+
+@pytest.mark.parametrize("items, expected", [
+    ([], ""),
+    (["1,3-5"], "1,3-5"),
+    (["1-5", "3-7", "4-9"], "4-5"),
+    (["1-5", "3-7", "6-9"], ""),
+    (["1,3,5-10", "1-8", "1,4-7"], "1,5-7"),
+])
+def test__intersection_all(items, expected):
+    """Range.intersection_all()."""
+    actual = Range.intersection_all([Range(s) for s in items])
+    assert actual.line == expected
+
+
+def test__union_all__random():
+    """Range.union_all() equal to set operations."""
+    rand = random.Random(0)
+    for _ in range(50):
+        sets = [set(rand.sample(range(1, 60), rand.randint(0, 30))) for _ in range(5)]
+        ranges = [Range(list(s)) for s in sets]
+        for min_count in range(1, 6):
+            expected = [i for i in range(1, 60) if sum(i in s for s in sets) >= min_count]
+            actual = Range.union_all(ranges, min_count=min_count)
+            assert actual.numbers() == expected
+        assert Range.intersection_all(ranges).numbers() == sorted(set.intersection(*sets))
+
+
+@pytest.mark.parametrize("ranges, min_count, error", [
+    ([Range("1"), "2"], 1, TypeError),
+    ([Range("1")], 0, NetportsValueError),
+])
+def test__union_all__invalid(ranges, min_count, error):
+    """Range.union_all() invalid."""
+    with pytest.raises(error):
+        Range.union_all(ranges, min_count=min_count)
+
+
+@pytest.mark.parametrize("items, expected", [
+    ([], []),
+    ([""], []),
+    (["1,3-5"], [(1, 1, 1), (3, 5, 1)]),
+    (["1-10", "5-20"], [(1, 4, 1), (5, 10, 2), (11, 20, 1)]),
+    (["1-10", "5-20", Range("8")], [(1, 4, 1), (5, 7, 2), (8, 8, 3), (9, 10, 2), (11, 20, 1)]),
+    (["1-5", [6, 7]], [(1, 7, 1)]),
+    (["1-5", "1-5"], [(1, 5, 2)]),
+    ([FrozenRange("1-3"), "3"], [(1, 2, 1), (3, 3, 2)]),
+])
+def test__coverage(items, expected):
+    """coverage()."""
+    actual = coverage(items)
+    assert actual == expected
+
+
+def test__coverage__random():
+    """coverage() equal to counting numbers."""
+    rand = random.Random(0)
+    for _ in range(50):
+        sets = [set(rand.sample(range(1, 60), rand.randint(0, 30))) for _ in range(5)]
+        counts = {i: sum(i in s for s in sets) for i in range(1, 60)}
+        actual = coverage([Range(list(s)) for s in sets])
+        expected = {i: count for start, end, count in actual for i in range(start, end + 1)}
+        assert expected == {i: c for i, c in counts.items() if c}
+        for segment1, segment2 in zip(actual, actual[1:]):
+            assert segment1[1] < segment2[0]
+            assert segment1[1] + 1 < segment2[0] or segment1[2] != segment2[2]
+
+
+# =========================== contains_many ===========================
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run test with pure Python and with NumPy backend."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(range_module._NUMPY, "numpy", None)
+    return request.param
+
+
+@pytest.mark.parametrize("items, values, expected", [
+    ("", [1, 2], [False, False]),
+    ("1,3-5", [], []),
+    ("1,3-5", [0, 1, 2, 3, 4, 5, 6], [False, True, False, True, True, True, False]),
+    ("1,3-5", (5, 1, 5), [True, True, True]),
+    ("1,3-5", array("H", [2, 3]), [False, True]),
+    ("1,3-5", range(4, 8, 3), [True, False]),
+])
+def test__contains_many(backend, items, values, expected):
+    """Range.contains_many()."""
+    range_o = Range(items)
+    actual = range_o.contains_many(values)
+    assert actual == expected
+
+    actual = range_o.contains_many(values, subset=True)
+    assert actual == [i for i, is_in in zip(values, expected) if is_in]
+
+
+def test__contains_many__random(backend):
+    """Range.contains_many() equal to `in`."""
+    rand = random.Random(0)
+    numbers = rand.sample(range(1, 1000), 300)
+    range_o = FrozenRange(numbers)
+    values = [rand.randint(0, 1001) for _ in range(2000)]
+
+    actual = range_o.contains_many(values)
+
+    assert actual == [i in range_o for i in values]
+
+
+def test__contains_many__ndarray():
+    """Range.contains_many() returns numpy.ndarray for numpy.ndarray."""
+    np = pytest.importorskip("numpy")
+    range_o = Range("1,3-5")
+    values = np.array([1, 2, 5, 6], dtype=np.uint16)
+
+    actual = range_o.contains_many(values)
+    assert isinstance(actual, np.ndarray)
+    assert actual.tolist() == [True, False, True, False]
+
+    actual = range_o.contains_many(values, subset=True)
+    assert actual.tolist() == [1, 5]
+
+
+# =============================== numpy ===============================
+
+
+@pytest.mark.parametrize("items, dtype, expected", [
+    ("", "uint16", []),
+    ("1,3-5", "uint16", [1, 3, 4, 5]),
+    ("0,65535", "uint16", [0, 65535]),
+    ("65536", "uint32", [65536]),
+    ("4294967296", "uint64", [4294967296]),
+])
+def test__to_array(items, dtype, expected):
+    """Range.to_array()."""
+    np = pytest.importorskip("numpy")
+    actual = Range(items).to_array()
+    assert actual.dtype == np.dtype(dtype)
+    assert actual.tolist() == expected
+
+    actual = FrozenRange(items).to_array(dtype=np.int64)
+    assert actual.dtype == np.int64
+    assert actual.tolist() == expected
+
+
+@pytest.mark.parametrize("numbers, kwargs, expected", [
+    ([], {}, ""),
+    ([5, 1, 3, 4, 1], {}, "1,3-5"),
+    ([1, 2, 3, 10, 12, 11], {}, "1-3,10-12"),
+    ([1, 2, 3, 5], {"splitter": " ", "range_splitter": " to "}, "1 to 3 5"),
+])
+def test__from_array(numbers, kwargs, expected):
+    """Range.from_array()."""
+    np = pytest.importorskip("numpy")
+    actual = Range.from_array(np.array(numbers, dtype=np.uint16), **kwargs)
+    assert actual.line == expected
+    assert actual.numbers() == sorted(set(numbers))
+
+    actual = FrozenRange.from_array(array("H", numbers), **kwargs)
+    assert isinstance(actual, FrozenRange)
+    assert actual.line == expected
+
+
+def test__from_array__invalid():
+    """Range.from_array() negative numbers."""
+    np = pytest.importorskip("numpy")
+    with pytest.raises(NetportsValueError):
+        Range.from_array(np.array([-1, 1]))
+
+
+def test__numpy_not_installed(monkeypatch):
+    """Range.to_array(), Range.from_array() without NumPy."""
+    monkeypatch.setitem(range_module._NUMPY, "numpy", None)
+    with pytest.raises(ImportError):
+        Range("1").to_array()
+    with pytest.raises(ImportError):
+        Range.from_array([1])
+
+
+@pytest.mark.parametrize("method", [
+    "__add__",
+    "__sub__",
+    "difference",
+    "intersection",
+    "symmetric_difference",
+    "union",
+    "add",
+    "difference_update",
+    "intersection_update",
+    "symmetric_difference_update",
+    "update",
+])
+def test__numpy_operations(monkeypatch, method):
+    """Set operations by NumPy equal to operations by Python sets."""
+    pytest.importorskip("numpy")
+    rand = random.Random(0)
+    for _ in range(20):
+        items1 = rand.sample(range(1, 300), rand.randint(0, 200))
+        items2 = rand.sample(range(1, 300), rand.randint(0, 200))
+        expected = Range(items1)
+        result_expected = getattr(expected, method)(Range(items2))
+
+        monkeypatch.setattr(range_module, "NUMPY_MIN_SIZE", 0)
+        actual = Range(items1)
+        result_actual = getattr(actual, method)(Range(items2))
+        monkeypatch.undo()
+
+        assert actual.line == expected.line
+        assert result_actual == result_expected
+
+
+# ============================ from_sorted ============================
+
+
+@pytest.mark.parametrize("numbers, kwargs, expected", [
+    ([], {}, ""),
+    ([1], {}, "1"),
+    ([1, 1, 2, 3, 5], {}, "1-3,5"),
+    (range(1, 65536), {}, "1-65535"),
+    (iter([0, 2, 3, 4]), {}, "0,2-4"),
+    ((i for i in [1, 2, 5]), {"splitter": " ", "range_splitter": " to "}, "1 to 2 5"),
+])
+def test__from_sorted(numbers, kwargs, expected):
+    """Range.from_sorted()."""
+    actual = Range.from_sorted(numbers, **kwargs)
+    assert actual.line == expected
+
+
+@pytest.mark.parametrize("numbers", [
+    [2, 1],
+    [1, 5, 4],
+    [-1, 2],
+])
+def test__from_sorted__invalid(numbers):
+    """Range.from_sorted() invalid numbers."""
+    with pytest.raises(NetportsValueError):
+        Range.from_sorted(numbers)
+
+
+@pytest.mark.parametrize("items, strict, expected", [
+    ([5, 3, 4, 1, 1], True, "1,3-5"),
+    ({1, 2, 3}, True, "1-3"),
+    ((2, 1), True, "1-2"),
+    ([1, "2", "4-5"], True, "1-2,4-5"),
+    ([-1, 2], False, "2"),
+])
+def test__init__ints(items, strict, expected):
+    """Range.__init__() from int numbers."""
+    range_o = Range(items, strict=strict)
+    assert range_o.line == expected
+    assert range_o.items == [Item(s) for s in expected.split(",")]
+
+
+def test__init__ints__random():
+    """Range.__init__() from int numbers equal to str numbers."""
+    rand = random.Random(0)
+    for _ in range(50):
+        numbers = [rand.randint(0, 100) for _ in range(rand.randint(1, 60))]
+        assert Range(numbers).line == Range([str(i) for i in numbers]).line
+
+
+# =============================== render ==============================
+
+
+@pytest.mark.parametrize("items, kwargs, expected", [
+    ("", {}, ""),
+    ("1,3-5", {}, "1,3-5"),
+    ("1,3-5", {"splitter": " "}, "1 3-5"),
+    ("1,3-5", {"splitter": " ", "range_splitter": " to "}, "1 3 to 5"),
+    ("1,3-5", {"range_splitter": ".."}, "1,3..5"),
+])
+def test__render(items, kwargs, expected):
+    """Range.render()."""
+    for range_o in [Range(items), FrozenRange(items)]:
+        actual = range_o.render(**kwargs)
+        assert actual == expected
+        assert range_o.render(**kwargs) is actual
+        assert range_o.line == items
+
+
+@pytest.mark.parametrize("method, args, expected", [
+    ("add", [Range("7")], "1,3-5,7"),
+    ("append", [7], "1,3-5,7"),
+    ("clear", [], ""),
+    ("difference_update", [Range("1")], "3-5"),
+    ("discard", [1], "3-5"),
+    ("extend", [[7]], "1,3-5,7"),
+    ("intersection_update", [Range("1")], "1"),
+    ("pop", [], "1,3-4"),
+    ("remove", [1], "3-5"),
+    ("symmetric_difference_update", [Range("1")], "3-5"),
+    ("update", [Range("7")], "1,3-5,7"),
+    ("__delitem__", [0], "3-5"),
+])
+def test__line__invalidated(method, args, expected):
+    """Range.line cache is invalidated by mutating methods."""
+    range_o = Range("1,3-5")
+    assert range_o.line == "1,3-5"
+    assert range_o.render(splitter=" ") == "1 3-5"
+
+    getattr(range_o, method)(*args)
+
+    assert range_o.line == expected
+    assert str(range_o) == expected
+    assert range_o.render(splitter=" ") == expected.replace(",", " ")
+
+
+def test__line__item_changed():
+    """Range.line cache is invalidated by Item changed in place."""
+    range_o = Range("1,3-5")
+    other = Range("7")
+    assert range_o.line == "1,3-5"
+    assert range_o.render(splitter=" ") == "1 3-5"
+    assert other.line == "7"
+
+    range_o.items[0].line = "2"
+
+    assert range_o.numbers() == [2, 3, 4, 5]
+    assert range_o.line == "2,3-5"
+    assert str(range_o) == "2,3-5"
+    assert range_o.render(splitter=" ") == "2 3-5"
+    assert other.line == "7"
+
+
+def test__line__splitters():
+    """Range.line follows changed splitter attributes."""
+    range_o = Range("1,3-5")
+    assert range_o.line == "1,3-5"
+    range_o.splitter = " "
+    range_o.range_splitter = " to "
+    assert range_o.line == "1 3 to 5"
+    range_o.line = "7 9 to 10"
+    assert range_o.line == "7 9 to 10"
+    assert range_o.copy().line == "7 9 to 10"
+
+
+# ========================== local mutations ==========================
+
+
+@pytest.mark.parametrize("items, number, expected", [
+    ("", 1, "1"),
+    ("1,3-5", 1, "1,3-5"),
+    ("1,3-5", 2, "1-5"),
+    ("1,3-5", 6, "1,3-6"),
+    ("1,4-5", 3, "1,3-5"),
+    ("1,3-5", 0, "0-1,3-5"),
+    ("1,3-5", 9, "1,3-5,9"),
+    ("1,3-5", "2", "1-5"),
+])
+def test__append__local(items, number, expected):
+    """Range.append() merges neighbouring items."""
+    range_o = Range(items)
+    range_o.append(number)
+    assert range_o.line == expected
+    assert range_o == Range(expected)
+
+
+@pytest.mark.parametrize("items, number, expected", [
+    ("", 1, ""),
+    ("1,3-5", 2, "1,3-5"),
+    ("1,3-5", 1, "3-5"),
+    ("1,3-5", 3, "1,4-5"),
+    ("1,3-5", 4, "1,3,5"),
+    ("1,3-5", 5, "1,3-4"),
+    ("1,3-5", 9, "1,3-5"),
+])
+def test__discard__local(items, number, expected):
+    """Range.discard() splits only the item of the number."""
+    range_o = Range(items)
+    range_o.discard(number)
+    assert range_o.line == expected
+    assert range_o == Range(expected)
+
+
+@pytest.mark.parametrize("items, idx, expected, remain", [
+    ("1,3-5", 0, 1, "3-5"),
+    ("1,3-5", 2, 4, "1,3,5"),
+    ("1,3-5", -1, 5, "1,3-4"),
+    ("1,3-5", -4, 1, "3-5"),
+    ("1,3-5", 4, IndexError, ""),
+    ("1,3-5", -5, IndexError, ""),
+])
+def test__getitem__delitem__(items, idx, expected, remain):
+    """Range.__getitem__() and Range.__delitem__() without numbers expanding."""
+    range_o = Range(items)
+    if isinstance(expected, int):
+        assert range_o[idx] == expected
+        del range_o[idx]
+        assert range_o.line == remain
+    else:
+        with pytest.raises(expected):
+            _ = range_o[idx]
+        with pytest.raises(expected):
+            del range_o[idx]
+
+
+def test__getitem__prefix_sums():
+    """Range.__getitem__() binary search in prefix sums, invalidated by changes."""
+    range_o = Range("1,3-5,7,10-20")
+    numbers = range_o.numbers()
+    assert [range_o[i] for i in range(-len(numbers), len(numbers))] == numbers + numbers
+    assert len(range_o) == 16
+
+    range_o.items[0].line = "1-2"
+    assert (range_o[1], range_o[-1], len(range_o)) == (2, 20, 17)
+    range_o.append(30)
+    assert (range_o[-1], len(range_o)) == (30, 18)
+
+
+def test__append__invalid():
+    """Range.append() negative number."""
+    with pytest.raises(NetportsValueError):
+        Range("1").append(-1)
+
+
+def test__local_mutations__random():
+    """Range mutations are equal to the same operations on set of numbers."""
+    rnd = random.Random(2)
+    range_o = Range()
+    numbers = set()
+    for _ in range(2000):
+        number = rnd.randint(0, 60)
+        action = rnd.choice(["append", "discard", "remove", "pop", "__delitem__"])
+        if action == "append":
+            range_o.append(number)
+            numbers.add(number)
+        elif action == "discard":
+            range_o.discard(number)
+            numbers.discard(number)
+        elif action == "remove":
+            if number in numbers:
+                range_o.remove(number)
+                numbers.remove(number)
+            else:
+                with pytest.raises(ValueError):
+                    range_o.remove(number)
+        elif action == "pop":
+            if numbers:
+                assert range_o.pop() == max(numbers)
+                numbers.remove(max(numbers))
+            else:
+                with pytest.raises(IndexError):
+                    range_o.pop()
+        elif numbers:
+            idx = rnd.randint(-len(numbers), len(numbers) - 1)
+            number = sorted(numbers)[idx]
+            assert range_o[idx] == number
+            del range_o[idx]
+            numbers.remove(number)
+        assert range_o.numbers() == sorted(numbers)
+        assert len(range_o) == len(numbers)
+        assert number in range_o if number in numbers else number not in range_o
+        assert range_o.line == Range(sorted(numbers)).line
+
+
+# ============================== window ===============================
+
+
+@pytest.mark.parametrize("items, lo, hi, exp_clip, exp_complement, exp_irange", [
+    ("", 1, 10, "", "1-10", []),
+    ("1,3-5,7", 1, 10, "1,3-5,7", "2,6,8-10", [1, 3, 4, 5, 7]),
+    ("1,3-5,7", 4, 6, "4-5", "6", [4, 5]),
+    ("1,3-5,7", 2, 2, "", "2", []),
+    ("1,3-5,7", 5, 5, "5", "", [5]),
+    ("1,3-5,7", 0, 0, "", "0", []),
+    ("1,3-5,7", 8, 9, "", "8-9", []),
+    ("3-5", 0, 4, "3-4", "0-2", [3, 4]),
+    ("1-4094", 1, 4094, "1-4094", "", None),
+    ("10-20", 1, 4094, "10-20", "1-9,21-4094", None),
+])
+def test__window(items, lo, hi, exp_clip, exp_complement, exp_irange):
+    """Range.clip(), Range.complement(), Range.irange()."""
+    range_o = Range(items)
+
+    assert range_o.clip(lo, hi).line == exp_clip
+    assert range_o.complement(lo, hi).line == exp_complement
+    if exp_irange is not None:
+        assert list(range_o.irange(lo, hi)) == exp_irange
+    assert range_o.line == Range(items).line
+
+
+def test__window__random():
+    """Range.clip(), Range.complement(), Range.irange() are equal to set operations."""
+    rnd = random.Random(3)
+    for _ in range(200):
+        numbers = {rnd.randint(0, 60) for _ in range(rnd.randint(0, 40))}
+        lo = rnd.randint(0, 60)
+        hi = rnd.randint(lo, 70)
+        window = set(range(lo, hi + 1))
+        for class_ in (Range, FrozenRange):
+            range_o = class_(list(numbers))
+            assert range_o.clip(lo, hi) == Range(list(numbers & window))
+            assert range_o.complement(lo, hi) == Range(list(window - numbers))
+            assert list(range_o.irange(lo, hi)) == sorted(numbers & window)
+            assert isinstance(range_o.complement(lo, hi), class_)
+
+
+@pytest.mark.parametrize("lo, hi, error", [
+    (-1, 10, NetportsValueError),
+    (5, 4, NetportsValueError),
+    ("1", 10, TypeError),
+    (1, None, TypeError),
+])
+def test__window__invalid(lo, hi, error):
+    """Range.clip(), Range.complement(), Range.irange() invalid window."""
+    range_o = Range("1-5")
+    for method in (range_o.clip, range_o.complement, range_o.irange):
+        with pytest.raises(error):
+            method(lo, hi)
+
+
+def test__window__splitters():
+    """Range.complement() keeps splitters of self."""
+    range_o = Range("1 3 to 5", splitter=" ", range_splitter=" to ")
+    assert range_o.complement(1, 10).line == "2 6 to 10"
+    assert range_o.clip(4, 10).line == "4 to 5"
+
+
+# ============================= AllRange ==============================
+
+
+def test__all_range():
+    """AllRange lazy properties."""
+    range_o = AllRange(1, 65535)
+
+    assert range_o is AllRange(1, 65535)
+    assert repr(range_o) == "AllRange(1, 65535)"
+    assert str(range_o) == "1-65535"
+    assert (range_o.lo, range_o.hi) == (1, 65535)
+    assert len(range_o) == 65535
+    assert 1 in range_o and 65535 in range_o
+    assert 0 not in range_o and 65536 not in range_o
+    assert range_o[-1] == 65535
+    iterator = iter(range_o)
+    assert [next(iterator), next(iterator)] == [1, 2]
+    assert range_o == Range("1-65535") == FrozenRange("1-65535")
+    assert hash(range_o) == hash(Range("1-65535"))
+    assert pickle.loads(pickle.dumps(range_o)) is range_o
+    assert copy.deepcopy(range_o) is range_o
+    assert AllRange(1, 3, splitter=" ", range_splitter=" to ").line == "1 to 3"
+    with pytest.raises(TypeError, match="immutable"):
+        range_o.append(1)
+    with pytest.raises(NetportsValueError):
+        AllRange(5, 4)
+
+
+@pytest.mark.parametrize("method, items, expected, class_", [
+    ("__sub__", "1,3-5", "2,6-10", FrozenRange),
+    ("__sub__", "1", "2-10", FrozenRange),
+    ("__sub__", "1-20", "", FrozenRange),
+    ("__add__", "12-15", "1-10,12-15", FrozenRange),
+    ("__add__", "11-15", "1-15", FrozenRange),
+    ("intersection", "3-5,9-20", "3-5,9-10", FrozenRange),
+    ("symmetric_difference", "5-15", "1-4,11-15", FrozenRange),
+    ("union", "3-5", "1-10", FrozenRange),
+    ("intersection", "5", "5", FrozenRange),
+    ("intersection", "1-10", "1-10", FrozenRange),
+])
+def test__all_range__operations(method, items, expected, class_):
+    """AllRange set operations on interval bounds."""
+    actual = getattr(AllRange(1, 10), method)(Range(items))
+    assert actual.line == expected
+    assert type(actual) is class_
+
+
+def test__all_range__results():
+    """AllRange is created by AllRange() only, results are FrozenRange."""
+    range_o = AllRange(1, 4094)
+
+    actual = range_o - Range("1-10")
+    assert type(actual) is FrozenRange
+    assert repr(actual) == "FrozenRange('11-4094')"
+    assert 4095 not in actual
+    assert type(range_o.intersection(Range("5"))) is FrozenRange
+    assert type(range_o.clip(5, 10)) is FrozenRange
+    assert type(range_o.complement(0, 4095)) is FrozenRange
+    assert type(AllRange(1, 10).complement(0, 20) - Range("0")) is FrozenRange
+    assert type(copy.copy(actual)) is FrozenRange
+    assert type(pickle.loads(pickle.dumps(actual))) is FrozenRange
+    assert AllRange(11, 4094) is not actual
+    assert type(AllRange(11, 4094)) is AllRange
+
+
+@pytest.mark.parametrize("method, items, expected", [
+    ("__sub__", "0-3,9-12", "0,11-12"),
+    ("__add__", "12", "1-10,12"),
+    ("difference", "0-3", "0"),
+    ("intersection", "0-3", "1-3"),
+    ("symmetric_difference", "5-15", "1-4,11-15"),
+    ("difference_update", "0-3", "0"),
+    ("intersection_update", "0-3", "1-3"),
+    ("symmetric_difference_update", "0-3", "0,4-10"),
+    ("update", "12", "1-10,12"),
+])
+def test__all_range__other(method, items, expected):
+    """Range set operations with AllRange on interval bounds."""
+    range_o = Range(items)
+    actual = getattr(range_o, method)(AllRange(1, 10))
+    if method.endswith("update"):
+        actual = range_o
+    assert actual.line == expected
+    assert type(actual) is Range
+
+
+@pytest.mark.parametrize("method, items, expected", [
+    ("isdisjoint", "0", True),
+    ("isdisjoint", "0,65535", False),
+    ("isdisjoint", "", True),
+    ("issubset", "1-65535", True),
+    ("issubset", "0-65536", True),
+    ("issubset", "2-65535", False),
+    ("issuperset", "1,80,65535", True),
+    ("issuperset", "", True),
+    ("issuperset", "0,80", False),
+])
+def test__all_range__comparisons(method, items, expected, monkeypatch):
+    """AllRange set comparisons on interval bounds, numbers are not materialized."""
+    monkeypatch.setattr(Range, "_numbers_sets", None)
+    range_o = AllRange(1, 65535)
+    assert getattr(range_o, method)(Range(items)) == expected
+    reverse = {"isdisjoint": "isdisjoint", "issubset": "issuperset", "issuperset": "issubset"}
+    assert getattr(Range(items), reverse[method])(range_o) == expected
+
+
+def test__all_range__comparisons_invalid():
+    """AllRange set comparisons with not Range."""
+    for method in ["isdisjoint", "issubset", "issuperset"]:
+        with pytest.raises(TypeError):
+            getattr(AllRange(1, 10), method)([1])
+
+
+@pytest.mark.parametrize("operation", ["union1d", "intersect1d", "setdiff1d", "setxor1d"])
+def test__merge_intervals__random(operation):
+    """Set operations on intervals are equal to set operations on numbers."""
+    rnd = random.Random(4)
+    operations = {
+        "union1d": set.union,
+        "intersect1d": set.intersection,
+        "setdiff1d": set.difference,
+        "setxor1d": set.symmetric_difference,
+    }
+    for _ in range(200):
+        numbers1 = {rnd.randint(0, 40) for _ in range(rnd.randint(0, 30))}
+        numbers2 = {rnd.randint(0, 40) for _ in range(rnd.randint(0, 30))}
+        intervals1 = Range(list(numbers1)).intervals
+        intervals2 = Range(list(numbers2)).intervals
+        actual = range_module._merge_intervals(intervals1, intervals2, operation)
+        expected = operations[operation](numbers1, numbers2)
+        assert actual == Range(list(expected)).intervals
+
+
+# ============================== chunks ===============================
+
+
+@pytest.mark.parametrize("items, kwargs, expected", [
+    ("", {}, []),
+    ("", {"max_chars": 5}, []),
+    ("1,3-5,7,9-10", {}, ["1,3-5,7,9-10"]),
+    ("1,3-5,7,9-10", {"max_chars": 7}, ["1,3-5,7", "9-10"]),
+    ("1,3-5,7,9-10", {"max_chars": 4}, ["1", "3-5", "7", "9-10"]),
+    ("1,3-5,7,9-10", {"max_items": 3}, ["1,3-5,7", "9-10"]),
+    ("1,3-5,7,9-10", {"max_items": 1}, ["1", "3-5", "7", "9-10"]),
+    ("1,3,5,7", {"max_chars": 3, "max_items": 1}, ["1", "3", "5", "7"]),
+    ("1,3-5,7", {"splitter": " ", "range_splitter": " to "}, ["1 3 to 5 7"]),
+    ("1,3-5,7", {"platform": "hpe", "max_chars": 8}, ["1 3 to 5", "7"]),
+    ("1,3-5,7", {"platform": "cisco", "splitter": " "}, ["1,3-5,7"]),
+    ("1,3-5,7", {"platform": "typo"}, ["1,3-5,7"]),
+])
+def test__chunks(items, kwargs, expected):
+    """Range.chunks()"""
+    range_o = Range(items)
+    actual = list(range_o.chunks(**kwargs))
+    assert actual == expected
+    assert range_o.line == Range(items).line
+
+
+def test__chunks__splitters():
+    """Range.chunks() default splitters of self."""
+    range_o = Range("1 3 to 5", splitter=" ", range_splitter=" to ")
+    assert list(range_o.chunks(max_items=1)) == ["1", "3 to 5"]
+
+
+def test__chunks__random():
+    """Range.chunks() joined chunks are equal to the rendered range."""
+    rnd = random.Random(5)
+    for _ in range(100):
+        range_o = Range([rnd.randint(1, 4094) for _ in range(rnd.randint(0, 300))])
+        max_chars = rnd.choice([0, 12, 20, 80])
+        max_items = rnd.choice([0, 1, 5, 50])
+        for platform, splitter in [("cisco", ","), ("hpe", " ")]:
+            chunks = list(range_o.chunks(max_chars, max_items, platform=platform))
+            assert splitter.join(chunks) == range_o.render(*PLATFORMS[platform])
+            for chunk in chunks:
+                assert not max_chars or len(chunk) <= max_chars
+                items = Range(chunk, splitter=splitter, range_splitter=PLATFORMS[platform][1])
+                assert not max_items or len(items.items) <= max_items
+
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"max_chars": -1}, NetportsValueError),
+    ({"max_items": -1}, NetportsValueError),
+    ({"max_chars": 3}, NetportsValueError),
+    ({"max_chars": "80"}, TypeError),
+])
+def test__chunks__invalid(kwargs, error):
+    """Range.chunks() invalid limits, raised before iteration."""
+    with pytest.raises(error):
+        Range("1,3-5,100-200").chunks(**kwargs)
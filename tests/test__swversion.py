@@ -1,8 +1,13 @@
 """Unittest sw_version.py"""
 
+import bisect
+import copy
+import pickle
+
 import pytest
 
-from netports.swversion import SwVersion
+from netports import NetportsValueError
+from netports.swversion import SwVersion, SwVersionSpec
 from tests import params__swversion as p
 
 
@@ -77,3 +82,180 @@ def test__le__(text1, text2, expected):
     obj2 = SwVersion(text2)
     actual = bool(obj1 <= obj2)
     assert actual == expected
+
+
+def test__interned():
+    """SwVersion.__new__() interned objects."""
+    obj1 = SwVersion("15.2(4)E10")
+    obj2 = SwVersion("15.2(4)e10")
+    obj3 = SwVersion("15.2(4)E11")
+    assert obj1 is obj2
+    assert obj1 is not obj3
+    assert str(obj1) == "15.2(4)e10"
+
+    copied = copy.deepcopy(obj1)
+    assert copied is obj1
+    loaded = pickle.loads(pickle.dumps(obj3))
+    assert loaded is obj3
+    assert str(SwVersion("")) == "0"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", ((), 0, "0")),
+    ("1", ((1,), 0, "1")),
+    ("1.2", ((1, 2), 0, "1.2")),
+    ("1.2.0", ((1, 2), 0, "1.2.0")),
+    ("11.22(33)SE", ((11, 22, 33), 0, "11.22(33)se")),
+    ("11.22(33)SE44", ((11, 22, 33, 44), 44, "11.22(33)se44")),
+    ("11.22.33.44.55", ((11, 22, 33, 44), 44, "11.22.33.44.55")),
+    ("YA.11.22.0033", ((11, 22, 33), 0, "ya.11.22.0033")),
+    ("v7.0.12,build0523", ((7, 0, 12, 523), 523, "v7.0.12,build0523")),
+    ("text", ((), 0, "text")),
+])
+def test__sort_key(text, expected):
+    """SwVersion.sort_key"""
+    actual = SwVersion(text).sort_key
+    assert actual == expected
+
+
+@pytest.mark.parametrize("text1, text2, expected", [
+    ("2.2(2)A2", "2.2(2)A2", (False, True, False, True)),
+    ("2.2(2)A2", "2.2(2)B2", (True, True, False, False)),
+    ("2.2(2)B2", "2.2(2)A2", (False, False, True, True)),
+    ("2.2(2)A2", "2.2(2)A10", (True, True, False, False)),
+    ("1.2", "1.2.0", (True, True, False, False)),
+    ("1.2.1", "1.2.0", (False, False, True, True)),
+])
+def test__ordering(text1, text2, expected):
+    """SwVersion.__lt__() __le__() __gt__() __ge__()"""
+    obj1 = SwVersion(text1)
+    obj2 = SwVersion(text2)
+    actual = (obj1 < obj2, obj1 <= obj2, obj1 > obj2, obj1 >= obj2)
+    assert actual == expected
+    assert (obj1 == obj2) == (obj1 <= obj2 and obj1 >= obj2)
+
+
+def test__sorted():
+    """sorted(), max(), bisect with SwVersion"""
+    texts = ["15.2(4)E10", "12.2(55)SE12", "15.2(4)E2", "15.2(4)EA2", "15.2(4)E2", "16.1.1"]
+    versions = [SwVersion(s) for s in texts]
+
+    actual = [str(o) for o in sorted(versions)]
+    expected = ["12.2(55)se12", "15.2(4)e2", "15.2(4)e2", "15.2(4)ea2", "15.2(4)e10", "16.1.1"]
+    assert actual == expected
+    assert sorted(versions) == sorted(versions, key=lambda o: o.sort_key)
+    assert str(max(versions)) == "16.1.1"
+    assert bisect.bisect_left(sorted(versions), SwVersion("15.2(4)E2")) == 1
+    with pytest.raises(TypeError):
+        _ = versions[0] < "15.2(4)E2"
+
+
+# ========================== SwVersionSpec ===========================
+
+@pytest.mark.parametrize("spec, text, expected", [
+    # through
+    ("15.2(4)E through 15.2(7)E3", "15.2(4)E", True),
+    ("15.2(4)E through 15.2(7)E3", "15.2(5)E1", True),
+    ("15.2(4)E through 15.2(7)E3", "15.2(7)E3", True),
+    ("15.2(4)E through 15.2(7)E3", "15.2(7)E4", False),
+    ("15.2(4)E through 15.2(7)E3", "15.2(3)E9", False),
+    ("15.2(4)E to 15.2(7)E3", "15.2(5)E1", True),
+    # excluding
+    ("15.2(4)E through 15.2(7)E3, excluding 15.2(6)E2", "15.2(6)E2", False),
+    ("15.2(4)E through 15.2(7)E3, excluding 15.2(6)E2", "15.2(6)E1", True),
+    ("15.2(4)E through 15.2(7)E3, excluding 15.2(6)E2", "15.2(6)E3", True),
+    ("15.2(4)E through 15.2(7)E3, except 15.2(5)E through 15.2(6)E", "15.2(5)E5", False),
+    ("15.2(4)E through 15.2(7)E3, except 15.2(5)E through 15.2(6)E", "15.2(6)E1", True),
+    ("15.2(4)E through 15.2(7)E3, != 15.2(4)E", "15.2(4)E", False),
+    ("15.2(4)E through 15.2(7)E3, !=15.2(4)E", "15.2(4)E", False),
+    ("15.2(4)E through 15.2(7)E3, !=15.2(4)E", "15.2(4)E1", True),
+    (">=1, !=2", "2", False),
+    (">=1, !=2", "3", True),
+    ("15.2(4)E through 15.2(7)E3, excluding >= 15.2(7)E", "15.2(7)E1", False),
+    # operators
+    (">= 15.2(4)E", "16.1.1", True),
+    (">= 15.2(4)E", "15.2(4)E", True),
+    ("> 15.2(4)E", "15.2(4)E", False),
+    ("<= 15.2(4)E", "15.2(4)E", True),
+    ("<15.2(4)E", "15.2(4)E", False),
+    ("<15.2(4)E", "12.2(55)SE12", True),
+    ("== 15.2(4)E10", "15.2(4)E10", True),
+    ("15.2(4)E10", "15.2(4)E10", True),
+    ("15.2(4)E10", "15.2(4)E11", False),
+    # bounds by release and nano, text only for exact match
+    (">= 1.0", "1", True),
+    ("> 1.0", "1", False),
+    ("1 through 3", "3.0", True),
+    ("1 through 3", "1.0.0", True),
+    ("< 2.0", "2", False),
+    ("<= 2.0", "2", True),
+    ("15.2(4)E through 15.2(7)E3", "15.2.7.3", True),
+    ("== 2.0", "2", False),
+    ("2.0", "2.0", True),
+    (">= 1, excluding 2.0", "2", True),
+    (">= 1, excluding 2.0", "2.0", False),
+    # union
+    ("12.2(55)SE10, 15.2(4)E through 15.2(4)E5", "12.2(55)SE10", True),
+    ("12.2(55)SE10, 15.2(4)E through 15.2(4)E5", "15.2(4)E2", True),
+    ("12.2(55)SE10, 15.2(4)E through 15.2(4)E5", "12.2(55)SE11", False),
+    # rays intersection
+    (">= 1, <= 3", "0.5", False),
+    (">= 1, <= 3", "1", True),
+    (">= 1, <= 3", "3", True),
+    (">= 1, <= 3", "4", False),
+    (">= 1, < 3, > 0.5", "0.9", False),
+    (">= 1, < 3, > 0.5", "1.5", True),
+    (">= 1, < 3, > 0.5", "3", False),
+    ("< 12, > 15", "11", False),
+    ("< 12, > 15", "13.1", False),
+    ("< 12, > 15", "15.1", False),
+    ("< 12, 15.1, 16 through 17", "11", True),
+    ("< 12, 15.1, 16 through 17", "15.1", True),
+    ("< 12, 15.1, 16 through 17", "16.5", True),
+    ("< 12, 15.1, 16 through 17", "13", False),
+    ("", "15.1", False),
+    # exclusions only
+    ("!=2", "3", True),
+    ("!=2", "2", False),
+    ("excluding 2 through 3", "1", True),
+    ("excluding 2 through 3", "2.5", False),
+    ("except >= 2, != 1", "0.5", True),
+    ("except >= 2, != 1", "1", False),
+])
+def test__spec__contains__(spec, text, expected):
+    """SwVersionSpec.__contains__()"""
+    spec_o = SwVersionSpec(spec)
+    assert (text in spec_o) == expected
+    assert (SwVersion(text) in spec_o) == expected
+
+
+@pytest.mark.parametrize("spec", [
+    "15.2(4)E through",
+    "15.2(4)E 15.2(5)E",
+    ">=",
+    "excluding",
+    "!=",
+])
+def test__spec__invalid(spec):
+    """SwVersionSpec.__init__() invalid."""
+    with pytest.raises(NetportsValueError):
+        SwVersionSpec(spec)
+
+
+def test__spec__filter():
+    """SwVersionSpec.filter()"""
+    spec = SwVersionSpec("1.2 through 1.8, excluding 1.4 through 1.5, != 1.7, >= 3")
+    versions = [f"{major}.{minor}" for major in range(5) for minor in range(10)]
+    actual = [str(o) for o in spec.filter(versions)]
+
+    def match(version: SwVersion) -> bool:
+        low, high = SwVersion("1.2"), SwVersion("1.8")
+        if version >= SwVersion("3"):
+            return True
+        if not low <= version <= high:
+            return False
+        return not SwVersion("1.4") <= version <= SwVersion("1.5") and str(version) != "1.7"
+
+    expected = [s for s in versions if match(SwVersion(s))]
+    assert actual == expected
+    assert actual[:4] == ["1.2", "1.3", "1.6", "1.8"]
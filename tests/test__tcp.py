@@ -120,3 +120,43 @@ def test__check_ports(kwargs, expected):
     else:
         with pytest.raises(expected):
             tcp.check_port(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, "1-65535"),
+    ({"items": "1,3-5"}, "2,6-65535"),
+    ({"items": [65535, 1]}, "2-65534"),
+    ({"items": "1-65535"}, ""),
+    ({"items": "-1"}, ""),
+    ({"items": "1", "all": True}, ""),
+    ({"items": "0"}, NetportsValueError),
+    ({"items": "65536"}, NetportsValueError),
+])
+def test__complement_ports(kwargs, expected):
+    """tcp.complement_ports()"""
+    if isinstance(expected, str):
+        actual = tcp.complement_ports(**kwargs)
+        assert actual.line == expected
+    else:
+        with pytest.raises(expected):
+            tcp.complement_ports(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({"items": "1-65535", "lazy": True}, tcp.ALL_PORTS_R),
+    ({"items": "1-65535", "lazy": True, "verbose": True}, tcp.ALL_PORTS_R),
+    ({"items": "-1", "lazy": True}, tcp.ALL_PORTS_R),
+    ({"items": [-1, 65535], "lazy": True}, tcp.ALL_PORTS_R),
+    ({"items": "65535", "all": True, "lazy": True}, tcp.ALL_PORTS_R),
+    ({"items": "65535", "lazy": True}, [65535]),
+    ({"items": "1-65535", "lazy": False}, [-1]),
+])
+def test__itcp__lazy(kwargs, expected):
+    """tcp.itcp(lazy=True)"""
+    actual = tcp.itcp(**kwargs)
+    assert actual == expected
+    if isinstance(expected, list):
+        assert isinstance(actual, list)
+    else:
+        assert actual is expected
+        assert len(actual) == 65535
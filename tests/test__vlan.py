@@ -1,10 +1,13 @@
 """Tests vlan.py"""
 
+import random
+
 import dictdiffer  # type: ignore[import-untyped]
 import pytest
 
-from netports import vlan
+from netports import Range, vlan
 from netports.exceptions import NetportsValueError
+from netports.static import PLATFORMS
 
 ALL = list(range(1, 4095))
 
@@ -116,3 +119,124 @@ def test_valid__update_splitters(kwargs, expected):
 
     diff = list(dictdiffer.diff(result, expected))
     assert diff == []
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({}, "1-4094"),
+    ({"items": ""}, "1-4094"),
+    ({"items": "1,3-5"}, "2,6-4094"),
+    ({"items": [4094, 1]}, "2-4093"),
+    ({"items": "1-4094"}, ""),
+    ({"items": "-1"}, ""),
+    ({"items": [-1, 10]}, ""),
+    ({"items": "1", "all": True}, ""),
+    ({"items": "1 3 to 5", "platform": "hpe"}, "2 6 to 4094"),
+    ({"items": "0"}, NetportsValueError),
+    ({"items": "1,4095"}, NetportsValueError),
+    ({"items": [-1, 4095]}, NetportsValueError),
+])
+def test__complement_vlans(kwargs, expected):
+    """vlan.complement_vlans()"""
+    if isinstance(expected, str):
+        actual = vlan.complement_vlans(**kwargs)
+        assert actual.line == expected
+    else:
+        with pytest.raises(expected):
+            vlan.complement_vlans(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({"items": "1-4094", "lazy": True}, vlan.ALL_VLANS_R),
+    ({"items": "1-4094", "lazy": True, "verbose": True}, vlan.ALL_VLANS_R),
+    ({"items": "-1", "lazy": True}, vlan.ALL_VLANS_R),
+    ({"items": [-1, 4094], "lazy": True}, vlan.ALL_VLANS_R),
+    ({"items": "4094", "all": True, "lazy": True}, vlan.ALL_VLANS_R),
+    ({"items": "4094", "lazy": True}, [4094]),
+    ({"items": "1-4094", "lazy": False}, [-1]),
+])
+def test__ivlan__lazy(kwargs, expected):
+    """vlan.ivlan(lazy=True)"""
+    actual = vlan.ivlan(**kwargs)
+    assert actual == expected
+    if isinstance(expected, list):
+        assert isinstance(actual, list)
+    else:
+        assert actual is expected
+        assert len(actual) == 4094
+
+
+@pytest.mark.parametrize("current, desired, kwargs, expected", [
+    ("1-10", "1-10", {}, []),
+    ("", "", {}, []),
+    ("10,20,30,40,50,60,70", "10,20,30,40,50,60,70,80", {},
+     ["switchport trunk allowed vlan add 80"]),
+    ("10,20,30,40,50,60,70", "20,30,40,50,60,70", {},
+     ["switchport trunk allowed vlan remove 10"]),
+    ("10,20,30,40,50,60,70", "10,20", {}, ["switchport trunk allowed vlan 10,20"]),
+    ("1-10", "", {}, ["switchport trunk allowed vlan none"]),
+    ([1, 2, 3], "1-5", {}, ["switchport trunk allowed vlan 1-5"]),
+    ("1,3,5,7,9", "1,3,5,7,9,11", {"max_chars": 40}, ["switchport trunk allowed vlan add 11"]),
+    ("", "1,3,5,7,9,11", {"max_chars": 40},
+     ["switchport trunk allowed vlan 1,3,5", "switchport trunk allowed vlan add 7,9,11"]),
+    ("1 to 10 20", "1 to 10 30", {"platform": "hpe"},
+     ["port trunk permit vlan 30", "undo port trunk permit vlan 20"]),
+    ("1 to 10", "20", {"platform": "hpe"},
+     ["undo port trunk permit vlan all", "port trunk permit vlan 20"]),
+    ("1 to 10", "", {"platform": "hpe"}, ["undo port trunk permit vlan all"]),
+    (Range("1,3,5,7,9"), Range("1,3,5,7,9,11"), {}, ["switchport trunk allowed vlan add 11"]),
+    ("1-10", "1-4095", {}, NetportsValueError),
+    ("1-10", "1 to 10", {"platform": "cisco"}, NetportsValueError),
+    ("1-10", "1-3", {"platform": "typo"}, NetportsValueError),
+    ("1-10", "1-3", {"max_chars": 30}, NetportsValueError),
+])
+def test__trunk_changes(current, desired, kwargs, expected):
+    """vlan.trunk_changes()"""
+    if isinstance(expected, list):
+        actual = vlan.trunk_changes(current, desired, **kwargs)
+        assert actual == expected
+    else:
+        with pytest.raises(expected):
+            vlan.trunk_changes(current, desired, **kwargs)
+
+
+def _apply_trunk_changes(current: set, lines: list, platform: str) -> set:
+    """Apply trunk commands to the set of allowed VLANs."""
+    commands = vlan.TRUNK_COMMANDS[platform]
+    splitter, range_splitter = PLATFORMS[platform]
+    vlans = set(current)
+    for line in lines:
+        if line == commands["none"]:
+            vlans = set()
+            continue
+        for action in ("add", "remove", "replace"):
+            if commands[action] and line.startswith(commands[action]):
+                line_ = line[len(commands[action]):]
+                numbers = set(Range(line_, splitter=splitter, range_splitter=range_splitter))
+                if action == "add":
+                    vlans |= numbers
+                elif action == "remove":
+                    vlans -= numbers
+                else:
+                    vlans = numbers
+                break
+        else:
+            raise ValueError(f"{line=}")
+    return vlans
+
+
+@pytest.mark.parametrize("platform", ["cisco", "hpe"])
+def test__trunk_changes__random(platform):
+    """vlan.trunk_changes() commands change current VLANs to desired."""
+    rnd = random.Random(6)
+    for _ in range(200):
+        current = {rnd.randint(1, 4094) for _ in range(rnd.randint(0, 100))}
+        desired = set(current)
+        for _ in range(rnd.randint(0, 20)):
+            desired.symmetric_difference_update({rnd.randint(1, 4094)})
+        max_chars = rnd.choice([0, 60, 80, 200])
+
+        lines = vlan.trunk_changes(sorted(current), sorted(desired), platform, max_chars)
+
+        assert _apply_trunk_changes(current, lines, platform) == desired
+        assert not max_chars or all(len(s) <= max_chars for s in lines)
+        assert bool(lines) == (current != desired)
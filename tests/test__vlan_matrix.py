@@ -0,0 +1,139 @@
+"""Tests vlan_matrix.py"""
+
+import random
+
+import pytest
+
+from netports import Intf, NetportsValueError, Range
+from netports.vlan_matrix import VlanMatrix, _bits_to_intervals
+
+ROWS = [
+    ("Gi0/1", "1,3-5"),
+    ("Gi0/2", "4-10"),
+    (Intf("Gi0/3"), [4094]),
+    ("Gi0/4", ""),
+]
+
+
+@pytest.fixture
+def matrix() -> VlanMatrix:
+    """Create VlanMatrix object."""
+    return VlanMatrix(ROWS)
+
+
+def test__init__(matrix):
+    """VlanMatrix.__init__()."""
+    assert len(matrix) == 4
+    assert repr(matrix) == "<VlanMatrix: rows=4>"
+    assert matrix.intfs == [Intf("Gi0/1"), Intf("Gi0/2"), Intf("Gi0/3"), Intf("Gi0/4")]
+    assert list(matrix) == matrix.intfs
+    assert "Gi0/1" in matrix
+    assert Intf("Gi0/3") in matrix
+    assert "Gi0/5" not in matrix
+
+
+@pytest.mark.parametrize("intf, expected", [
+    ("Gi0/1", "1,3-5"),
+    ("Gi0/2", "4-10"),
+    (Intf("Gi0/3"), "4094"),
+    ("Gi0/4", ""),
+    ("Gi0/5", KeyError),
+])
+def test__row(matrix, intf, expected):
+    """VlanMatrix.row()"""
+    if isinstance(expected, str):
+        actual = matrix.row(intf)
+        assert actual == Range(expected)
+    else:
+        with pytest.raises(expected):
+            matrix.row(intf)
+
+
+@pytest.mark.parametrize("vlan, expected", [
+    (1, ["Gi0/1"]),
+    (2, []),
+    (4, ["Gi0/1", "Gi0/2"]),
+    ("10", ["Gi0/2"]),
+    (11, []),
+    (4094, ["Gi0/3"]),
+    (0, NetportsValueError),
+    (4095, NetportsValueError),
+])
+def test__col(matrix, vlan, expected):
+    """VlanMatrix.col()"""
+    if isinstance(expected, list):
+        actual = matrix.col(vlan)
+        assert actual == [Intf(s) for s in expected]
+    else:
+        with pytest.raises(expected):
+            matrix.col(vlan)
+
+
+@pytest.mark.parametrize("intfs, exp_union, exp_intersection", [
+    (None, "1,3-10,4094", ""),
+    (["Gi0/1", "Gi0/2"], "1,3-10", "4-5"),
+    ([Intf("Gi0/1")], "1,3-5", "1,3-5"),
+    ([], "", ""),
+])
+def test__union__intersection(matrix, intfs, exp_union, exp_intersection):
+    """VlanMatrix.union(), VlanMatrix.intersection()"""
+    assert matrix.union(intfs) == Range(exp_union)
+    assert matrix.intersection(intfs) == Range(exp_intersection)
+
+
+def test__set(matrix):
+    """VlanMatrix.set() resets the column index."""
+    assert matrix.col(2) == []
+    matrix.set("Gi0/1", "2")
+    matrix.set("Gi0/5", Range("2-3"))
+    assert matrix.col(2) == [Intf("Gi0/1"), Intf("Gi0/5")]
+    assert matrix.col(4) == [Intf("Gi0/2")]
+    assert matrix.row("Gi0/1") == Range("2")
+    assert len(matrix) == 5
+
+
+@pytest.mark.parametrize("rows, kwargs, error", [
+    ([("Gi0/1", "0-5")], {}, NetportsValueError),
+    ([("Gi0/1", "4095")], {}, NetportsValueError),
+    ([("Gi0/1", "1-5")], {"platform": "hpe"}, NetportsValueError),
+])
+def test__update__invalid(rows, kwargs, error):
+    """VlanMatrix.update() invalid VLANs."""
+    with pytest.raises(error):
+        VlanMatrix(rows, **kwargs)
+
+
+def test__update__platform():
+    """VlanMatrix.update() VLANs in HPE format."""
+    matrix = VlanMatrix([("Gi0/1", "1 3 to 5")], platform="hpe")
+    assert matrix.row("Gi0/1") == Range("1,3-5")
+
+
+def test__random():
+    """VlanMatrix queries are equal to queries on sets of VLANs."""
+    rnd = random.Random(7)
+    specs = [
+        sorted({rnd.randint(1, 4094) for _ in range(rnd.randint(0, 50))}) for _ in range(20)
+    ]
+    rows = {f"Gi0/{i}": rnd.choice(specs) for i in range(100)}
+    matrix = VlanMatrix((k, ",".join(str(i) for i in v)) for k, v in rows.items())
+
+    for vlan in [1, 4094] + [rnd.randint(1, 4094) for _ in range(50)]:
+        expected = [Intf(k) for k, v in rows.items() if vlan in v]
+        assert matrix.col(vlan) == expected
+    intfs = rnd.sample(list(rows), 10)
+    assert matrix.union(intfs) == Range([i for k in intfs for i in rows[k]])
+    vlans = set.intersection(*[set(rows[k]) for k in intfs])
+    assert matrix.intersection(intfs) == Range(list(vlans))
+
+
+@pytest.mark.parametrize("bits, expected", [
+    (0, ()),
+    (0b10, ((1, 1),)),
+    (0b1110111010, ((1, 1), (3, 5), (7, 9))),
+    (((1 << 4094) - 1) << 1, ((1, 4094),)),
+])
+def test__bits_to_intervals(bits, expected):
+    """vlan_matrix._bits_to_intervals()"""
+    actual = _bits_to_intervals(bits)
+    assert actual == expected